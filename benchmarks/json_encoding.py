@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark for JSON response encoding
+Encodes large event and booking listings (as the routes build them) through
+Flask's default provider and through FastJSONProvider, and compares serving
+the tier catalogue from pre-encoded bytes with re-encoding (and re-hashing
+its ETag) per request.
+A third payload keeps raw datetimes to exercise the `default` hook.
+
+Usage: python benchmarks/json_encoding.py [--sizes 100,1000,10000] [--repeat 20]
+"""
+
+import argparse
+import hashlib
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from flask import Flask, request
+from flask.json.provider import DefaultJSONProvider
+from src.app import create_app
+from src.models.event import Event
+from src.models.booking import Booking
+
+default_app = Flask('default')
+fast_app = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite://'})
+PROVIDERS = (('default', DefaultJSONProvider(default_app)), ('fast', fast_app.json))
+
+
+def events_payload(count):
+    now = datetime.utcnow().replace(microsecond=0)
+    events = [
+        Event(id=i, title=f'Event {i}', description='Rooftop tasting with live jazz ✨', category='vip',
+              price=120.5, max_guests=80, date=now + timedelta(days=i % 90), duration_hours=3,
+              venue_location='Level 12', features='["bar", "dj"]', is_active=True,
+              confirmed_seats=i % 80, held_seats=0, created_at=now, updated_at=now)
+        for i in range(count)
+    ]
+    events_data = [event.to_dict(Event.LISTING_FIELDS) for event in events]
+    return {'success': True, 'events': events_data, 'total': len(events_data), 'next_cursor': None}
+
+
+def bookings_payload(count):
+    now = datetime.utcnow().replace(microsecond=0)
+    bookings = [
+        Booking(id=i, booking_reference=f'EE{i:08d}', guest_name='Guest', guest_email='guest@example.com',
+                guest_count=2, event_id=i, booking_date=now, booking_time='20:00', duration_hours=2,
+                total_amount=240.0, payment_status='paid', status='confirmed', created_at=now, updated_at=now)
+        for i in range(count)
+    ]
+    bookings_data = [booking.to_dict() for booking in bookings]
+    return {'success': True, 'bookings': bookings_data, 'total': len(bookings_data), 'next_cursor': None}
+
+
+def raw_datetimes_payload(count):
+    now = datetime.utcnow()
+    return {'success': True, 'rows': [{'id': i, 'at': now, 'ok': bool(i % 2), 'amount': i * 1.5} for i in range(count)]}
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def reencoded_response(provider, payload):
+    """What response_cache does on a miss: encode, hash an ETag, answer conditionally"""
+    response = provider.response(payload)
+    response.set_etag(hashlib.sha256(response.get_data()).hexdigest()[:32])
+    return response.make_conditional(request)
+
+
+def run(sizes, repeat):
+    for name, build in (('events', events_payload), ('bookings', bookings_payload), ('raw datetimes', raw_datetimes_payload)):
+        for size in sizes:
+            payload = build(size)
+            results = []
+            for provider_name, provider in PROVIDERS:
+                with provider._app.app_context():
+                    ms = timed(lambda: provider.response(payload).get_data(), repeat)
+                    size_kb = len(provider.response(payload).get_data()) / 1024
+                results.append(f'{provider_name} {ms:8.2f} ms {size_kb:8.0f} KB')
+            print(f'{name:14} {size:>6}   ' + '   '.join(results))
+
+    catalogue = {'success': True, 'tiers': [
+        {'id': i, 'name': f'Tier {i}', 'slug': f'tier-{i}', 'monthly_price': 99.0 * i, 'discount_percentage': 5.0 * i,
+         'features': '["lounge", "concierge"]', 'is_active': True, 'sort_order': i}
+        for i in range(6)
+    ], 'total': 6}
+    provider = fast_app.json
+    with fast_app.test_request_context():
+        encode_ms = timed(lambda: reencoded_response(provider, catalogue).get_data(), repeat * 50)
+        cached_ms = timed(lambda: provider.encoded_response('tiers', 1, lambda: catalogue).get_data(), repeat * 50)
+    print(f'tier catalogue   re-encoded {encode_ms * 1000:7.1f} us   pre-encoded {cached_ms * 1000:7.1f} us')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='100,1000,10000')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    run([int(size) for size in args.sizes.split(',')], args.repeat)
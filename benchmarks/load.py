@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+Load benchmark harness for every API route
+Generates a synthetic dataset (or reuses --database), then drives each route
+through the Flask test client and reports p50/p95/p99 latency, throughput
+and SQL statements per request. Write routes get their preconditions (a
+pending booking to confirm, a membership to renew, ...) from untimed setup
+requests, so only the route under test is measured. The one exception is
+/api/admin/profiles/<id>, which only has records while the profiler samples
+requests, and sampling would skew every other route's numbers.
+
+Prints one JSON record; save it with --output and diff a later run against it
+with --compare.
+
+Usage:
+    python benchmarks/load.py [--requests 100] [--users 5000 --events 2000 --bookings 50000]
+    python benchmarks/load.py --database sqlite:////tmp/elevate.db --output baseline.json
+    python benchmarks/load.py --compare baseline.json
+
+Write routes modify the database, so point --database at a copy.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sqlalchemy import event as sa_event
+from src.app import create_app
+from src.generate_data import generate
+from src.models.user import db, User
+from src.models.event import Event
+from src.models.booking import Booking
+from src.models.lounge import Lounge
+from src.models.membership import MembershipTier, Membership
+
+# Admin routes are closed without a token; the harness configures its own
+ADMIN_TOKEN = 'bench-admin-token'
+
+
+class Context:
+    """Dataset facts and untimed setup helpers shared by the scenarios"""
+
+    def __init__(self, client, rng):
+        self.client = client
+        self.rng = rng
+        self.counter = 0
+        now = datetime.utcnow()
+        self.event_ids = db.session.execute(
+            db.select(Event.id).where(Event.is_active == True, Event.date > now + timedelta(days=1))
+        ).scalars().all()
+        self.booking_refs = db.session.execute(
+            db.select(Booking.booking_reference).order_by(db.func.random()).limit(1000)
+        ).scalars().all()
+        self.user_ids = db.session.execute(db.select(User.id).order_by(db.func.random()).limit(1000)).scalars().all()
+        self.member_user_ids = db.session.execute(
+            db.select(Membership.user_id).where(Membership.is_active == True).order_by(db.func.random()).limit(1000)
+        ).scalars().all()
+        # Cheapest first, so new memberships can always be upgraded to the last tier
+        self.tiers = db.session.execute(
+            db.select(MembershipTier.id, MembershipTier.slug).order_by(MembershipTier.monthly_price)
+        ).all()
+        if not (self.event_ids and self.booking_refs and self.user_ids and self.member_user_ids and self.tiers):
+            raise SystemExit('Dataset too small: need upcoming events, bookings, users and active memberships')
+
+    def unique(self, prefix):
+        self.counter += 1
+        return f'{prefix}{os.getpid()}x{self.counter}'
+
+    def future_date(self, days=30):
+        return (datetime.utcnow() + timedelta(days=self.rng.randrange(2, days))).date().isoformat()
+
+    def setup(self, method, url, **kwargs):
+        response = self.client.open(url, method=method, **kwargs)
+        if response.status_code >= 400:
+            raise RuntimeError(f'Setup {method} {url} failed: {response.status_code} {response.get_data(as_text=True)[:200]}')
+        return response.get_json()
+
+    def event_payload(self):
+        return {
+            'title': self.unique('Load event '), 'description': 'Load test', 'category': 'vip',
+            'price': 100.0, 'max_guests': 1000, 'date': (datetime.utcnow() + timedelta(days=60)).isoformat()
+        }
+
+    def new_event(self):
+        return self.setup('POST', '/api/events', json=self.event_payload())['event']['id']
+
+    def booking_payload(self, event_id=None):
+        event_id = event_id or self.new_event()
+        return {
+            'guest_name': 'Load', 'guest_email': 'load@example.com', 'guest_count': 1,
+            'booking_date': self.future_date(), 'booking_time': '20:00', 'event_id': event_id,
+            'user_id': self.rng.choice(self.member_user_ids)
+        }
+
+    def new_booking(self, confirmed=False):
+        reference = self.setup('POST', '/api/bookings', json=self.booking_payload())['booking']['booking_reference']
+        if confirmed:
+            self.setup('POST', f'/api/bookings/{reference}/confirm', json={'payment_method': 'stripe'})
+        return reference
+
+    def new_qr_token(self):
+        reference = self.new_booking()
+        return self.setup('POST', f'/api/bookings/{reference}/confirm', json={'payment_method': 'stripe'})['booking']['qr_code']
+
+    def new_user(self):
+        name = self.unique('load_user_')
+        return self.setup('POST', '/api/users', json={'username': name, 'email': f'{name}@example.com'})['id']
+
+    def new_membership(self):
+        payload = {'user_id': self.new_user(), 'tier_id': self.tiers[0].id, 'billing_cycle': 'monthly'}
+        return self.setup('POST', '/api/memberships', json=payload)['membership']['id']
+
+
+# name -> build(ctx) returning (method, url, request kwargs); builds may run untimed setup first
+SCENARIOS = {
+    'health': lambda ctx: ('GET', '/api/health', {}),
+    'metrics': lambda ctx: ('GET', '/api/metrics', {}),
+    'events.list': lambda ctx: ('GET', '/api/events', {}),
+    'events.list_filtered': lambda ctx: ('GET', f'/api/events?category=vip&from={ctx.future_date(10)}&limit=20', {}),
+    'events.list_fields': lambda ctx: ('GET', '/api/events?fields=id,title,date,available_spots', {}),
+    'events.detail': lambda ctx: ('GET', f'/api/events/{ctx.rng.choice(ctx.event_ids)}', {}),
+    'events.availability': lambda ctx: ('GET', f'/api/events/{ctx.rng.choice(ctx.event_ids)}/availability', {}),
+    'events.create': lambda ctx: ('POST', '/api/events', {'json': ctx.event_payload()}),
+    'events.update': lambda ctx: ('PUT', f'/api/events/{ctx.new_event()}', {'json': {'price': 120.0}}),
+    'events.delete': lambda ctx: ('DELETE', f'/api/events/{ctx.new_event()}', {}),
+    'bookings.create': lambda ctx: ('POST', '/api/bookings', {'json': ctx.booking_payload()}),
+    'bookings.get': lambda ctx: ('GET', f'/api/bookings/{ctx.rng.choice(ctx.booking_refs)}', {}),
+    'bookings.confirm': lambda ctx: ('POST', f'/api/bookings/{ctx.new_booking()}/confirm', {'json': {'payment_method': 'stripe'}}),
+    'bookings.checkin': lambda ctx: ('POST', f'/api/bookings/{ctx.new_booking(confirmed=True)}/checkin', {}),
+    'bookings.scan': lambda ctx: ('POST', '/api/bookings/checkin/scan', {'json': {'token': ctx.new_qr_token()}}),
+    'bookings.scan_batch': lambda ctx: ('POST', '/api/bookings/checkin/batch', {'json': {
+        'scans': [{'token': ctx.new_qr_token()} for _ in range(20)]}}),
+    'bookings.cancel': lambda ctx: ('POST', f'/api/bookings/{ctx.new_booking()}/cancel', {}),
+    'bookings.user': lambda ctx: ('GET', f'/api/users/{ctx.rng.choice(ctx.user_ids)}/bookings', {}),
+    'availability.lounges': lambda ctx: ('GET', f'/api/availability/lounges?date={ctx.future_date()}&time=19:30&duration=2', {}),
+    'tiers.list': lambda ctx: ('GET', '/api/membership-tiers', {}),
+    'tiers.detail': lambda ctx: ('GET', f'/api/membership-tiers/{ctx.rng.choice(ctx.tiers).slug}', {}),
+    'memberships.create': lambda ctx: ('POST', '/api/memberships', {'json': {
+        'user_id': ctx.new_user(), 'tier_id': ctx.tiers[0].id, 'billing_cycle': 'monthly'}}),
+    'memberships.get': lambda ctx: ('GET', f'/api/users/{ctx.rng.choice(ctx.member_user_ids)}/membership', {}),
+    'memberships.benefits': lambda ctx: ('GET', f'/api/users/{ctx.rng.choice(ctx.member_user_ids)}/membership/benefits', {}),
+    'memberships.renew': lambda ctx: ('POST', f'/api/memberships/{ctx.new_membership()}/renew', {'json': {}}),
+    'memberships.cancel': lambda ctx: ('POST', f'/api/memberships/{ctx.new_membership()}/cancel', {}),
+    'memberships.upgrade': lambda ctx: ('POST', f'/api/memberships/{ctx.new_membership()}/upgrade', {'json': {
+        'new_tier_id': ctx.tiers[-1].id}}),
+    'users.list': lambda ctx: ('GET', '/api/users', {}),
+    'users.create': lambda ctx: ('POST', '/api/users', {'json': {
+        'username': ctx.unique('load_new_'), 'email': f"{ctx.unique('load_new_')}@example.com"}}),
+    'users.get': lambda ctx: ('GET', f'/api/users/{ctx.rng.choice(ctx.user_ids)}', {}),
+    'users.update': lambda ctx: ('PUT', f'/api/users/{ctx.new_user()}', {'json': {'username': ctx.unique('load_renamed_')}}),
+    'users.delete': lambda ctx: ('DELETE', f'/api/users/{ctx.new_user()}', {}),
+    'admin.export': lambda ctx: ('GET', f"/api/admin/bookings/export?status=pending&from={(datetime.utcnow() - timedelta(days=1)).date().isoformat()}", {}),
+    'admin.profiles': lambda ctx: ('GET', '/api/admin/profiles', {}),
+    'admin.import': lambda ctx: ('POST', '/api/admin/events/import', {
+        'data': ''.join(json.dumps(ctx.event_payload()) + '\n' for _ in range(50)),
+        'content_type': 'application/x-ndjson'}),
+}
+
+
+def percentile(sorted_samples, fraction):
+    index = min(len(sorted_samples) - 1, max(0, round(fraction * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+def run_scenario(ctx, build, requests, statements):
+    latencies = []
+    statement_counts = []
+    statuses = Counter()
+    for _ in range(requests):
+        method, url, kwargs = build(ctx)
+        statements[0] = 0
+        started = time.perf_counter()
+        response = ctx.client.open(url, method=method, **kwargs)
+        response.get_data()
+        latencies.append((time.perf_counter() - started) * 1000)
+        statement_counts.append(statements[0])
+        statuses[response.status_code] += 1
+    latencies.sort()
+    return {
+        'p50_ms': round(percentile(latencies, 0.50), 3),
+        'p95_ms': round(percentile(latencies, 0.95), 3),
+        'p99_ms': round(percentile(latencies, 0.99), 3),
+        'throughput_rps': round(len(latencies) / (sum(latencies) / 1000), 1),
+        'statements_per_request': round(statistics.mean(statement_counts), 2),
+        'statuses': {str(code): count for code, count in sorted(statuses.items())},
+    }
+
+
+def compare(record, baseline_path):
+    with open(baseline_path) as handle:
+        baseline = json.load(handle)
+    print(f"\nvs {baseline_path} ({baseline.get('commit')})")
+    print(f"{'route':24} {'p50 ms':>18} {'p95 ms':>18} {'statements':>14}")
+    for name, current in record['routes'].items():
+        before = baseline.get('routes', {}).get(name)
+        if before is None:
+            print(f'{name:24} (new)')
+            continue
+        cells = []
+        for key, width in (('p50_ms', 18), ('p95_ms', 18), ('statements_per_request', 14)):
+            change = (current[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+            cells.append(f"{before[key]:.2f}→{current[key]:.2f} {change:+.0f}%".rjust(width))
+        print(f'{name:24} ' + ' '.join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database', help='Existing (generated) database URI; writes will modify it')
+    parser.add_argument('--users', type=int, default=5000)
+    parser.add_argument('--events', type=int, default=2000)
+    parser.add_argument('--bookings', type=int, default=50000)
+    parser.add_argument('--lounges', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=100, help='Timed requests per route')
+    parser.add_argument('--routes', help='Comma-separated scenario names (default: all)')
+    parser.add_argument('--cache', action='store_true', help='Keep the response cache enabled')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='Write the JSON record to this file')
+    parser.add_argument('--compare', help='Baseline JSON record to diff against')
+    args = parser.parse_args()
+
+    database = args.database or f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='ee-bench-'), 'load.db')}"
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': database,
+        'AUTO_CREATE_SCHEMA': True,
+        'RESPONSE_CACHE_ENABLED': args.cache,
+        'ADMIN_API_TOKEN': ADMIN_TOKEN,
+    })
+    names = args.routes.split(',') if args.routes else list(SCENARIOS)
+
+    with app.app_context():
+        if not args.database:
+            generate(users=args.users, lounges=args.lounges, events=args.events, bookings=args.bookings,
+                     seed=args.seed, log=lambda line: print(line, file=sys.stderr))
+        dataset = {
+            model.__tablename__: db.session.execute(db.select(db.func.count()).select_from(model)).scalar()
+            for model in (User, Membership, Lounge, Event, Booking)
+        }
+        statements = [0]
+
+        def count_statement(*_):
+            statements[0] += 1
+
+        sa_event.listen(db.engine, 'before_cursor_execute', count_statement)
+        client = app.test_client()
+        client.environ_base['HTTP_AUTHORIZATION'] = f'Bearer {ADMIN_TOKEN}'
+        ctx = Context(client, random.Random(args.seed))
+        db.session.remove()
+
+    routes = {}
+    for name in names:
+        print(f'running {name}...', file=sys.stderr)
+        routes[name] = run_scenario(ctx, SCENARIOS[name], args.requests, statements)
+
+    commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    record = {
+        'timestamp': datetime.utcnow().isoformat(),
+        'commit': commit or None,
+        'python': sys.version.split()[0],
+        'dataset': dataset,
+        'requests_per_route': args.requests,
+        'response_cache': args.cache,
+        'routes': routes,
+    }
+    print(json.dumps(record, indent=2))
+    if args.output:
+        with open(args.output, 'w') as handle:
+            json.dump(record, handle, indent=2)
+    if args.compare:
+        compare(record, args.compare)
+
+
+if __name__ == '__main__':
+    main()
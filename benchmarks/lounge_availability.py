@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark for GET /api/availability/lounges
+Seeds a throwaway SQLite database with a growing number of lounges (each with a
+few confirmed bookings on the searched date) and reports request latency and
+SQL statements per search. Latency should stay flat as the lounge count grows.
+
+Usage: python benchmarks/lounge_availability.py [--sizes 10,100,1000] [--repeat 50]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event as sa_event
+from src.app import create_app
+from src.models.user import db
+from src.models.lounge import Lounge
+from src.models.booking import Booking
+
+DB_FILE = os.path.join(tempfile.mkdtemp(prefix='ee-bench-'), 'bench.db')
+app = create_app({
+    'SQLALCHEMY_DATABASE_URI': f'sqlite:///{DB_FILE}',
+    'AUTO_CREATE_SCHEMA': True,
+    'RESPONSE_CACHE_ENABLED': False
+})
+
+
+def seed(lounge_count, search_date):
+    """Replace all lounges and bookings with lounge_count lounges"""
+    db.session.query(Booking).delete()
+    db.session.query(Lounge).delete()
+    lounges = [
+        Lounge(name=f'Lounge {i}', description='Benchmark lounge', category='premium',
+               capacity=20, hourly_rate=100.0 + i)
+        for i in range(lounge_count)
+    ]
+    db.session.add_all(lounges)
+    db.session.flush()
+
+    # Every other lounge is busy during the searched slot
+    for i, lounge in enumerate(lounges):
+        for hour in ('12:00', '19:00' if i % 2 else '23:00'):
+            db.session.add(Booking(
+                guest_name='Bench', guest_email='bench@example.com', guest_count=2,
+                lounge_id=lounge.id, booking_date=search_date, booking_time=hour,
+                duration_hours=2, total_amount=200.0, status='confirmed'
+            ))
+    db.session.commit()
+
+
+def run(sizes, repeat):
+    search_date = (datetime.now() + timedelta(days=30)).date()
+    url = f'/api/availability/lounges?date={search_date.isoformat()}&time=19:30&duration=2'
+    client = app.test_client()
+    statements = []
+    with app.app_context():
+        sa_event.listen(db.engine, 'before_cursor_execute', lambda *args: statements.append(1))
+
+    print(f"{'lounges':>8} {'p50 ms':>8} {'p95 ms':>8} {'queries':>8} {'free':>6}")
+    for size in sizes:
+        with app.app_context():
+            seed(size, search_date)
+
+        timings = []
+        for _ in range(repeat):
+            statements.clear()
+            started = time.perf_counter()
+            response = client.get(url)
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        free = len(response.get_json()['available_lounges'])
+        print(f"{size:>8} {statistics.median(timings):>8.2f} {p95:>8.2f} {len(statements):>8} {free:>6}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10,100,1000')
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+    run([int(size) for size in args.sizes.split(',')], args.repeat)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the nightly membership renewal job
+Seeds a throwaway SQLite database with memberships, a third of them lapsed,
+then times `renew_memberships` against the per-object approach (load each
+lapsed Membership, call renew_membership or deactivate it, commit) and
+reports memberships per second.
+
+Usage: python benchmarks/membership_renewal.py [--sizes 100000,1000000] [--orm-sample 20000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.app import create_app
+from src.jobs import renew_memberships
+from src.models.user import db
+from src.models.membership import MembershipTier, Membership
+
+DB_FILE = os.path.join(tempfile.mkdtemp(prefix='ee-bench-'), 'bench.db')
+app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{DB_FILE}', 'AUTO_CREATE_SCHEMA': True})
+
+
+def seed(total, batch_size=50000):
+    """Replace all memberships with total rows, roughly a third lapsed"""
+    rng = random.Random(42)
+    now = datetime.utcnow().replace(microsecond=0)
+    db.session.execute(db.delete(Membership))
+    if not db.session.execute(db.select(MembershipTier.id)).first():
+        db.session.execute(db.insert(MembershipTier), [{'id': 1, 'name': 'Bench', 'slug': 'bench', 'monthly_price': 99.0}])
+    for start in range(0, total, batch_size):
+        rows = []
+        for i in range(start, min(start + batch_size, total)):
+            annual = rng.random() < 0.3
+            end_date = now + timedelta(days=rng.randrange(-45, 90))
+            rows.append({
+                'id': i + 1, 'user_id': i + 1, 'tier_id': 1, 'membership_number': f'BENCH{i:09d}',
+                'start_date': end_date - timedelta(days=365 if annual else 30), 'end_date': end_date,
+                'billing_cycle': 'annual' if annual else 'monthly', 'payment_status': 'active',
+                'is_active': True, 'auto_renew': rng.random() < 0.8, 'created_at': now, 'updated_at': now
+            })
+        db.session.execute(db.insert(Membership), rows)
+    db.session.commit()
+
+
+def per_object(limit):
+    """Baseline: one ORM object at a time"""
+    now = datetime.utcnow()
+    memberships = Membership.query.filter(Membership.is_active == True, Membership.end_date <= now).limit(limit).all()
+    for membership in memberships:
+        if membership.auto_renew and membership.end_date + Membership.billing_period(membership.billing_cycle) > now:
+            membership.renew_membership()
+        else:
+            membership.is_active = False
+            membership.payment_status = 'expired'
+        db.session.commit()
+    return len(memberships)
+
+
+def run(sizes, orm_sample):
+    for size in sizes:
+        with app.app_context():
+            seed(size)
+            started = time.perf_counter()
+            report = renew_memberships(restart=True)
+            elapsed = time.perf_counter() - started
+        print(f"{size:>8} memberships  batch job  {report['lapsed']:>7} lapsed in {elapsed:6.1f}s  "
+              f"{report['lapsed'] / elapsed:9.0f} lapsed/s  {size / elapsed:9.0f} memberships/s")
+
+    if orm_sample:
+        with app.app_context():
+            seed(orm_sample * 3)
+            started = time.perf_counter()
+            processed = per_object(orm_sample)
+            elapsed = time.perf_counter() - started
+        print(f"{orm_sample * 3:>8} memberships  per-object {processed:>7} lapsed in {elapsed:6.1f}s  "
+              f"{processed / elapsed:9.0f} lapsed/s")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='100000,1000000')
+    parser.add_argument('--orm-sample', type=int, default=20000, help='Lapsed memberships for the per-object baseline')
+    args = parser.parse_args()
+    run([int(size) for size in args.sizes.split(',')], args.orm_sample)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Oversell stress test for event seat holds
+Fires concurrent POST /api/bookings requests at one event from many threads,
+then confirms every booking that got a hold, and checks that confirmed seats
+never exceed the event's capacity. Exits non-zero on oversell or ledger drift.
+
+Usage: python benchmarks/seat_hold_stress.py [--requests 500] [--capacity 100] [--guests 1]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.app import create_app
+from src.models.user import db
+from src.models.event import Event
+from src.models.booking import Booking
+
+DB_FILE = os.path.join(tempfile.mkdtemp(prefix='ee-bench-'), 'bench.db')
+app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{DB_FILE}', 'AUTO_CREATE_SCHEMA': True})
+
+
+def run_concurrently(target, items):
+    threads = [threading.Thread(target=target, args=(item,)) for item in items]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def run(requests, capacity, guests):
+    event_date = (datetime.now() + timedelta(days=14)).replace(microsecond=0)
+    with app.app_context():
+        event = Event(title='Launch night', description='Stress test', category='vip',
+                      price=100.0, max_guests=capacity, date=event_date)
+        db.session.add(event)
+        db.session.commit()
+        event_id = event.id
+
+    lock = threading.Lock()
+    created = Counter()
+    references = []
+
+    def book(_):
+        response = app.test_client().post('/api/bookings', json={
+            'guest_name': 'Stress', 'guest_email': 'stress@example.com', 'guest_count': guests,
+            'booking_date': event_date.date().isoformat(), 'booking_time': '20:00', 'event_id': event_id
+        })
+        with lock:
+            created[response.status_code] += 1
+            if response.status_code == 201:
+                references.append(response.get_json()['booking']['booking_reference'])
+
+    confirmed = Counter()
+
+    def confirm(reference):
+        response = app.test_client().post(f'/api/bookings/{reference}/confirm', json={})
+        with lock:
+            confirmed[response.status_code] += 1
+
+    run_concurrently(book, range(requests))
+    run_concurrently(confirm, references)
+
+    with app.app_context():
+        event = db.session.get(Event, event_id)
+        seated = db.session.execute(
+            db.select(db.func.coalesce(db.func.sum(Booking.guest_count), 0))
+            .where(Booking.event_id == event_id, Booking.status.in_(Booking.SEAT_HOLDING_STATUSES))
+        ).scalar()
+        ledger = (event.confirmed_seats, event.held_seats)
+
+    print(f"create:  {dict(created)}")
+    print(f"confirm: {dict(confirmed)}")
+    print(f"capacity={capacity} seated={seated} ledger(confirmed, held)={ledger}")
+
+    if seated > capacity:
+        print(f"❌ Oversold by {seated - capacity} seats")
+        return 1
+    if ledger != (seated, 0):
+        print("❌ Seat ledger drifted from bookings")
+        return 1
+    print("✅ No oversell")
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--capacity', type=int, default=100)
+    parser.add_argument('--guests', type=int, default=1)
+    args = parser.parse_args()
+    sys.exit(run(args.requests, args.capacity, args.guests))
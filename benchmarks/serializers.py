@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the compiled model serializers
+Seeds a throwaway SQLite database with events and bookings and compares, per
+model over the same rows:
+  * the hand-written to_dict bodies the models used before (kept here as the baseline)
+  * the compiled serializer on ORM instances
+  * the compiled serializer on Row tuples from a column select (no ORM hydration)
+Each variant is checked to produce exactly the baseline's dicts.
+
+Usage: python benchmarks/serializers.py [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.app import create_app
+from src.models.user import db
+from src.models.event import Event
+from src.models.booking import Booking
+from src.utils.serializers import default_fields, serialize_rows, serializer_for
+
+DB_FILE = os.path.join(tempfile.mkdtemp(prefix='ee-bench-'), 'bench.db')
+app = create_app({'SQLALCHEMY_DATABASE_URI': f'sqlite:///{DB_FILE}', 'AUTO_CREATE_SCHEMA': True})
+
+
+def legacy_event_dict(self):
+    return {
+        'id': self.id,
+        'title': self.title,
+        'description': self.description,
+        'category': self.category,
+        'price': self.price,
+        'max_guests': self.max_guests,
+        'date': self.date.isoformat() if self.date else None,
+        'duration_hours': self.duration_hours,
+        'image_url': self.image_url,
+        'venue_location': self.venue_location,
+        'features': self.features,
+        'is_active': self.is_active,
+        'created_at': self.created_at.isoformat() if self.created_at else None,
+        'updated_at': self.updated_at.isoformat() if self.updated_at else None
+    }
+
+
+def legacy_booking_dict(self):
+    return {
+        'id': self.id,
+        'booking_reference': self.booking_reference,
+        'guest_name': self.guest_name,
+        'guest_email': self.guest_email,
+        'guest_phone': self.guest_phone,
+        'guest_count': self.guest_count,
+        'special_requests': self.special_requests,
+        'event_id': self.event_id,
+        'lounge_id': self.lounge_id,
+        'booking_date': self.booking_date.isoformat() if self.booking_date else None,
+        'booking_time': self.booking_time,
+        'duration_hours': self.duration_hours,
+        'starts_at': self.starts_at.isoformat() if self.starts_at else None,
+        'ends_at': self.ends_at.isoformat() if self.ends_at else None,
+        'total_amount': self.total_amount,
+        'payment_status': self.payment_status,
+        'payment_method': self.payment_method,
+        'status': self.status,
+        'qr_code': self.qr_code,
+        'hold_id': self.hold_id,
+        'check_in_time': self.check_in_time.isoformat() if self.check_in_time else None,
+        'created_at': self.created_at.isoformat() if self.created_at else None,
+        'updated_at': self.updated_at.isoformat() if self.updated_at else None
+    }
+
+
+def seed(rows):
+    now = datetime.utcnow().replace(microsecond=0)
+    db.session.execute(db.insert(Event), [
+        {'title': f'Event {i}', 'description': 'Benchmark event', 'category': 'vip', 'price': 100.0,
+         'max_guests': 50, 'date': now + timedelta(hours=i), 'duration_hours': 3, 'features': '[]',
+         'is_active': True, 'created_at': now, 'updated_at': now}
+        for i in range(rows)
+    ])
+    db.session.execute(db.insert(Booking), [
+        {'booking_reference': f'BENCH{i:08d}', 'guest_name': 'Bench', 'guest_email': 'bench@example.com',
+         'guest_count': 2, 'event_id': 1 + i % rows, 'booking_date': (now + timedelta(hours=i)).date(),
+         'booking_time': '20:00', 'duration_hours': 2, 'starts_at': now + timedelta(hours=i),
+         'ends_at': now + timedelta(hours=i + 2), 'total_amount': 200.0, 'payment_status': 'paid',
+         'status': 'confirmed', 'created_at': now, 'updated_at': now}
+        for i in range(rows)
+    ])
+    db.session.commit()
+
+
+def timed(fn, repeat):
+    """Median milliseconds of fn() over repeat runs, plus its last result"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), result
+
+
+def compare(model, legacy, repeat):
+    objects = db.session.execute(db.select(model).order_by(model.id)).scalars().all()
+    columns = [getattr(model, name) for name in default_fields(model)]
+    rows = db.session.execute(db.select(*columns).order_by(model.id)).all()
+    compiled = serializer_for(model)
+
+    baseline_ms, expected = timed(lambda: [legacy(obj) for obj in objects], repeat)
+    orm_ms, from_objects = timed(lambda: [compiled(obj) for obj in objects], repeat)
+    row_ms, from_rows = timed(lambda: serialize_rows(model, rows), repeat)
+    assert from_objects == expected, f'{model.__name__}: compiled output differs from to_dict'
+    assert from_rows == expected, f'{model.__name__}: Row output differs from to_dict'
+
+    # End to end: load and serialize, ORM instances vs plain rows
+    db.session.expunge_all()
+    load_orm_ms, _ = timed(lambda: [compiled(obj) for obj in db.session.execute(
+        db.select(model).order_by(model.id).execution_options(populate_existing=True)).scalars()], repeat)
+    load_rows_ms, _ = timed(lambda: serialize_rows(model, db.session.execute(
+        db.select(*columns).order_by(model.id)).all()), repeat)
+
+    print(f"{model.__name__:8} {len(objects):>6} rows   "
+          f"to_dict {baseline_ms:7.1f} ms   compiled {orm_ms:7.1f} ms ({baseline_ms / orm_ms:.1f}x)   "
+          f"rows {row_ms:7.1f} ms   load+serialize ORM {load_orm_ms:7.1f} ms vs rows {load_rows_ms:7.1f} ms")
+
+
+def run(rows, repeat):
+    with app.app_context():
+        seed(rows)
+        compare(Event, legacy_event_dict, repeat)
+        compare(Booking, legacy_booking_dict, repeat)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the Vercel entry point
+Measures, in fresh interpreter processes:
+  * import time of api/main.py via `python -X importtime`, with the slowest modules
+  * time from process start to the first response from /api/health
+Prints one JSON record; append it to a file with --output to track cold-start
+latency across commits.
+
+Usage: python benchmarks/startup.py [--runs 5] [--output startup.jsonl]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FIRST_RESPONSE = (
+    "import time; started = time.perf_counter()\n"
+    "from api.main import app\n"
+    "imported = time.perf_counter()\n"
+    "response = app.test_client().get('/api/health')\n"
+    "assert response.status_code == 200\n"
+    "print(imported - started, time.perf_counter() - started)\n"
+)
+
+
+def _env():
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    env.setdefault('SQLALCHEMY_DATABASE_URI', f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='ee-bench-'), 'bench.db')}")
+    return env
+
+
+def import_profile(top=10):
+    """Total import time of api.main and its slowest modules (cumulative microseconds)"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import api.main'],
+        cwd=ROOT, env=_env(), capture_output=True, text=True, check=True
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        modules.append((name.strip(), int(cumulative_us)))
+    total = next(cumulative for name, cumulative in modules if name == 'api.main')
+    slowest = sorted((item for item in modules if item[0] != 'api.main'), key=lambda item: -item[1])[:top]
+    return total, slowest
+
+
+def first_response(runs):
+    """(process wall, import, import + first request) latencies in ms over fresh processes"""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, '-c', FIRST_RESPONSE],
+            cwd=ROOT, env=_env(), capture_output=True, text=True, check=True
+        )
+        wall = time.perf_counter() - started
+        imported, responded = (float(value) for value in result.stdout.split()[-2:])
+        samples.append((wall * 1000, imported * 1000, responded * 1000))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--output', help='Append the JSON record to this file')
+    args = parser.parse_args()
+
+    total_us, slowest = import_profile()
+    samples = first_response(args.runs)
+    commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+
+    record = {
+        'timestamp': datetime.utcnow().isoformat(),
+        'commit': commit or None,
+        'python': sys.version.split()[0],
+        'import_ms': round(total_us / 1000, 2),
+        'slowest_imports_ms': {name: round(cumulative / 1000, 2) for name, cumulative in slowest},
+        'process_to_first_response_ms': round(statistics.median(sample[0] for sample in samples), 2),
+        'in_process_first_response_ms': round(statistics.median(sample[2] for sample in samples), 2),
+        'runs': args.runs,
+    }
+    line = json.dumps(record)
+    print(json.dumps(record, indent=2))
+    if args.output:
+        with open(args.output, 'a') as handle:
+            handle.write(line + '\n')
+
+
+if __name__ == '__main__':
+    main()
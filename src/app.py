@@ -0,0 +1,116 @@
+"""
+Application factory for Elevate Events
+Keeps module import cheap for serverless cold starts: blueprints are imported
+by name when the app is built, and the schema bootstrap runs from
+`flask init-db` (or AUTO_CREATE_SCHEMA=1) instead of on every boot.
+"""
+
+import os
+from importlib import import_module
+from pathlib import Path
+from flask import Flask
+from flask_cors import CORS
+from src.models.user import db
+
+project_root = Path(__file__).parent.parent.absolute()
+
+# (module, blueprint attribute) pairs registered under /api
+BLUEPRINTS = [
+    ('src.routes.user', 'user_bp'),
+    ('src.routes.events', 'events_bp'),
+    ('src.routes.bookings', 'bookings_bp'),
+    ('src.routes.memberships', 'memberships_bp'),
+    ('src.routes.admin', 'admin_bp'),
+]
+
+
+def _env_flag(name):
+    return os.environ.get(name, '').lower() in ('1', 'true', 'yes')
+
+
+def _default_database_uri():
+    # For production (Vercel), use environment variable
+    if os.environ.get('SQLALCHEMY_DATABASE_URI'):
+        return os.environ.get('SQLALCHEMY_DATABASE_URI')
+
+    # Local development database
+    db_path = project_root / 'src' / 'database' / 'app.db'
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    return f'sqlite:///{db_path}'
+
+
+def register_blueprints(app):
+    """Import and register every API blueprint"""
+    for module_name, attribute in BLUEPRINTS:
+        blueprint = getattr(import_module(module_name), attribute)
+        app.register_blueprint(blueprint, url_prefix='/api')
+
+
+def create_app(config=None):
+    """Build and configure the Flask application"""
+    from src.cli import register_commands
+    from src.utils.auth import require_admin
+    from src.utils.cache import response_cache
+    from src.utils.idempotency import replay_cache
+    from src.utils.json_provider import FastJSONProvider
+    from src.utils.metrics import metrics
+    from src.utils.nplusone import nplusone
+    from src.utils.profiler import profiler
+
+    app = Flask(__name__, static_folder=None)
+    app.json = FastJSONProvider(app)
+
+    # Configure a secret key from environment variables for production
+    # Fallback to a development key if not available
+    app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'your-development-secret-key')
+    app.config['SQLALCHEMY_DATABASE_URI'] = _default_database_uri()
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['AUTO_CREATE_SCHEMA'] = _env_flag('AUTO_CREATE_SCHEMA')
+    app.config['ADMIN_API_TOKEN'] = os.environ.get('ADMIN_API_TOKEN')
+    app.config['SERVER_TIMING'] = _env_flag('SERVER_TIMING')
+    app.config['NPLUSONE'] = os.environ.get('NPLUSONE') or ('log' if app.debug else 'off')
+    app.config['PROFILER_SAMPLE_RATE'] = float(os.environ.get('PROFILER_SAMPLE_RATE', 0))
+    app.config['PROFILER_SLOW_MS'] = float(os.environ.get('PROFILER_SLOW_MS', 500))
+    app.config['SEAT_HOLD_TTL_MINUTES'] = int(os.environ.get('SEAT_HOLD_TTL_MINUTES', 15))
+    app.config['PENDING_BOOKING_TTL_MINUTES'] = int(os.environ.get('PENDING_BOOKING_TTL_MINUTES', 60))
+    app.config['PENDING_BOOKING_SWEEPER'] = _env_flag('PENDING_BOOKING_SWEEPER')
+    app.config['PENDING_BOOKING_SWEEP_INTERVAL'] = int(os.environ.get('PENDING_BOOKING_SWEEP_INTERVAL', 300))
+    app.config.update(config or {})
+
+    # Enable CORS for all routes
+    CORS(app, origins='*')
+
+    db.init_app(app)
+    response_cache.init_app(app)
+    replay_cache.init_app(app)
+    metrics.init_app(app, db)
+    nplusone.init_app(app, db)
+    profiler.init_app(app, db)
+    register_commands(app)
+    register_blueprints(app)
+
+    @app.route('/api/health')
+    def health_check():
+        return {'status': 'healthy', 'message': 'API is running'}, 200
+
+    @app.route('/api/metrics')
+    @require_admin
+    def prometheus_metrics():
+        return metrics.render(), 200, {'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'}
+
+    @app.route('/')
+    def home():
+        return {'message': 'Elevate Events Backend API', 'status': 'running'}, 200
+
+    # Opt-in schema bootstrap for local development; deployments run `flask init-db`
+    if app.config['AUTO_CREATE_SCHEMA']:
+        from src.migrations import upgrade_schema
+        with app.app_context():
+            upgrade_schema()
+
+    # Opt-in in-process sweeper; otherwise schedule `flask expire-pending-bookings`
+    if app.config['PENDING_BOOKING_SWEEPER']:
+        from src.jobs import start_pending_booking_sweeper
+        app.extensions['pending_booking_sweeper'] = start_pending_booking_sweeper(app)
+
+    return app
@@ -0,0 +1,165 @@
+"""
+Flask CLI commands for Elevate Events
+Run with `flask --app api/main.py <command>`.
+"""
+
+import click
+from flask.cli import with_appcontext
+from src.models.user import db
+from src.models.event import Event
+
+
+@click.command('init-db')
+@with_appcontext
+def init_db_command():
+    """Create missing tables, columns and indexes and run the backfills"""
+    from src.migrations import upgrade_schema
+
+    try:
+        report = upgrade_schema()
+        click.echo(f"✅ Database schema up to date ({len(report['added_columns'])} columns added)")
+        if report['seats_reconciled'] or report['slots_filled']:
+            click.echo(f"   • {report['seats_reconciled']} seat counters reconciled, "
+                       f"{report['slots_filled']} booking slots filled")
+        if report['slots_skipped']:
+            skipped = report['slots_skipped']
+            click.echo(f"⚠️  {len(skipped)} bookings have an unparseable booking_time and no slot "
+                       f"(ids {', '.join(map(str, skipped[:20]))}{', ...' if len(skipped) > 20 else ''})")
+    except Exception as e:
+        db.session.rollback()
+        raise click.ClickException(f"Error creating database tables: {e}")
+
+
+@click.command('reconcile-seats')
+@with_appcontext
+def reconcile_seats_command():
+    """Rebuild event seat counters from confirmed bookings"""
+    try:
+        repaired = Event.reconcile_confirmed_seats()
+        db.session.commit()
+        click.echo(f"✅ Seat ledger reconciled ({repaired} events corrected)")
+    except Exception as e:
+        db.session.rollback()
+        raise click.ClickException(f"Error reconciling seat ledger: {e}")
+
+
+@click.command('release-expired-holds')
+@click.option('--batch-size', default=500, show_default=True, help='Holds expired per transaction')
+@with_appcontext
+def release_expired_holds_command(batch_size):
+    """Return seats from lapsed checkout holds to their events"""
+    from src.models.seat_hold import SeatHold
+
+    total = 0
+    try:
+        while True:
+            released = SeatHold.release_expired(limit=batch_size)
+            db.session.commit()
+            total += released
+            if released < batch_size:
+                break
+        click.echo(f"✅ Released {total} expired seat holds")
+    except Exception as e:
+        db.session.rollback()
+        raise click.ClickException(f"Error releasing seat holds: {e}")
+
+
+@click.command('expire-pending-bookings')
+@click.option('--ttl-minutes', type=int, default=None,
+              help='Age after which pending bookings expire [default: PENDING_BOOKING_TTL_MINUTES]')
+@click.option('--batch-size', default=500, show_default=True, help='Bookings expired per transaction')
+@with_appcontext
+def expire_pending_bookings_command(ttl_minutes, batch_size):
+    """Expire abandoned pending bookings and release their seat holds"""
+    from src.jobs import expire_pending_bookings
+
+    try:
+        expired = expire_pending_bookings(ttl_minutes, batch_size, log=click.echo)
+    except Exception as e:
+        db.session.rollback()
+        raise click.ClickException(f"Error expiring pending bookings: {e}")
+    if expired is None:
+        click.echo("⏭️  Another worker is already expiring pending bookings")
+    else:
+        click.echo(f"✅ Expired {expired} stale pending bookings")
+
+
+@click.command('renew-memberships')
+@click.option('--batch-size', default=5000, show_default=True, help='Memberships processed per transaction')
+@click.option('--dry-run', is_flag=True, help='Report what would change without writing')
+@click.option('--restart', is_flag=True, help='Ignore the checkpoint of an interrupted run')
+@with_appcontext
+def renew_memberships_command(batch_size, dry_run, restart):
+    """Renew due auto-renew memberships and deactivate expired ones"""
+    from src.jobs import renew_memberships
+
+    try:
+        report = renew_memberships(batch_size, dry_run=dry_run, restart=restart, log=click.echo)
+    except Exception as e:
+        db.session.rollback()
+        raise click.ClickException(f"Error renewing memberships: {e}")
+    if report is None:
+        click.echo("⏭️  Another worker is already renewing memberships")
+        return
+
+    renewed = report['renewed']
+    expired = report['expired']
+    prefix = "🔎 Dry run: would renew" if dry_run else "✅ Renewed"
+    click.echo(f"{prefix} {sum(renewed.values())} memberships "
+               f"({renewed['monthly']} monthly, {renewed['annual']} annual) as of {report['as_of']}")
+    click.echo(f"   {'Would expire' if dry_run else 'Expired'} {sum(expired.values())} "
+               f"({expired['not_auto_renew']} not auto-renewing, {expired['payment_status']} with payment "
+               f"issues, {expired['overdue']} more than a cycle overdue)")
+
+
+@click.command('purge-idempotency-keys')
+@click.option('--batch-size', default=1000, show_default=True, help='Keys deleted per transaction')
+@with_appcontext
+def purge_idempotency_keys_command(batch_size):
+    """Delete stored Idempotency-Key responses past their TTL"""
+    from src.models.idempotency_key import IdempotencyKey
+
+    total = 0
+    try:
+        while True:
+            purged = IdempotencyKey.purge_expired(limit=batch_size)
+            db.session.commit()
+            total += purged
+            if purged < batch_size:
+                break
+        click.echo(f"✅ Purged {total} expired idempotency keys")
+    except Exception as e:
+        db.session.rollback()
+        raise click.ClickException(f"Error purging idempotency keys: {e}")
+
+
+@click.command('check-query-plans')
+@click.option('--verbose', is_flag=True, help='Print the full plan for every query')
+@with_appcontext
+def check_query_plans_command(verbose):
+    """Fail if any route query falls back to a full table scan"""
+    from src.query_plans import check_query_plans
+
+    failures = 0
+    for name, plan, full_scans in check_query_plans():
+        status = 'FAIL' if full_scans else 'ok'
+        click.echo(f"{status:>4}  {name}")
+        if verbose or full_scans:
+            for line in plan:
+                click.echo(f"        {line}")
+        failures += bool(full_scans)
+
+    if failures:
+        raise click.ClickException(f"{failures} queries fall back to a full table scan")
+    click.echo("✅ All route queries use indexes")
+
+
+def register_commands(app):
+    """Attach all CLI commands to the application"""
+    app.cli.add_command(init_db_command)
+    app.cli.add_command(reconcile_seats_command)
+    app.cli.add_command(release_expired_holds_command)
+    app.cli.add_command(expire_pending_bookings_command)
+    app.cli.add_command(renew_memberships_command)
+    app.cli.add_command(purge_idempotency_keys_command)
+    app.cli.add_command(check_query_plans_command)
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Synthetic data generator for Elevate Events
+Fills a database with production-scale users, memberships, lounges, events and
+bookings using batched Core inserts, for load testing and query-plan work.
+Rows are appended after any existing data and are reproducible for a given seed.
+
+Usage:
+    python src/generate_data.py --database sqlite:////tmp/elevate.db \
+        --users 300000 --events 50000 --bookings 2000000
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from src.models.user import db, User
+from src.models.event import Event
+from src.models.lounge import Lounge
+from src.models.booking import Booking
+from src.models.membership import MembershipTier, Membership
+
+CATEGORIES = ('premium', 'vip', 'exclusive')
+DEFAULT_TIERS = (
+    ('Essential', 'essential', 49.0, 5.0),
+    ('Premium', 'premium', 99.0, 10.0),
+    ('Elite', 'elite', 249.0, 20.0),
+)
+
+
+def _next_id(model):
+    return (db.session.execute(db.select(db.func.max(model.id))).scalar() or 0) + 1
+
+
+def _insert(model, rows, batch_size):
+    """executemany rows into the model's table in batches; returns the row count"""
+    table = model.__table__
+    count = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            db.session.execute(db.insert(table), batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        db.session.execute(db.insert(table), batch)
+        count += len(batch)
+    return count
+
+
+def _tier_ids(now):
+    ids = db.session.execute(db.select(MembershipTier.id)).scalars().all()
+    if ids:
+        return ids
+    _insert(MembershipTier, (
+        {'name': name, 'slug': slug, 'monthly_price': price, 'annual_price': price * 10,
+         'discount_percentage': discount, 'is_active': True, 'sort_order': order,
+         'created_at': now, 'updated_at': now}
+        for order, (name, slug, price, discount) in enumerate(DEFAULT_TIERS)
+    ), len(DEFAULT_TIERS))
+    return db.session.execute(db.select(MembershipTier.id)).scalars().all()
+
+
+def _users(rng, first_id, count, now):
+    for user_id in range(first_id, first_id + count):
+        yield {
+            'id': user_id, 'username': f'gen_user_{user_id}', 'email': f'gen_user_{user_id}@example.com',
+            'first_name': 'Guest', 'last_name': f'#{user_id}', 'preferred_language': rng.choice(('en', 'de')),
+            'marketing_emails': rng.random() < 0.5, 'is_active': True, 'is_verified': rng.random() < 0.7,
+            'created_at': now - timedelta(days=rng.randrange(730)), 'updated_at': now
+        }
+
+
+def _memberships(rng, first_id, user_ids, tier_ids, now):
+    for offset, user_id in enumerate(user_ids):
+        start = now - timedelta(days=rng.randrange(400))
+        annual = rng.random() < 0.3
+        end = start + timedelta(days=365 if annual else 30)
+        yield {
+            'id': first_id + offset, 'user_id': user_id, 'tier_id': rng.choice(tier_ids),
+            'membership_number': f'GEN{first_id + offset:010d}', 'start_date': start, 'end_date': end,
+            'billing_cycle': 'annual' if annual else 'monthly',
+            'payment_status': 'active' if end > now else 'expired', 'next_payment_date': end,
+            'events_attended': 0, 'total_bookings': 0, 'total_spent': 0.0, 'complimentary_drinks_used': 0,
+            'is_active': end > now, 'auto_renew': rng.random() < 0.8, 'created_at': start, 'updated_at': start
+        }
+
+
+def _lounges(rng, first_id, count, now):
+    for lounge_id in range(first_id, first_id + count):
+        yield {
+            'id': lounge_id, 'name': f'Lounge {lounge_id}', 'description': 'Generated lounge',
+            'category': rng.choice(CATEGORIES), 'capacity': rng.randrange(10, 80),
+            'hourly_rate': float(rng.randrange(80, 600)), 'minimum_hours': 2, 'maximum_hours': 8,
+            'is_active': True, 'operating_hours_start': '18:00', 'operating_hours_end': '02:00',
+            'created_at': now, 'updated_at': now
+        }
+
+
+def _events(rng, first_id, count, now):
+    for event_id in range(first_id, first_id + count):
+        date = (now + timedelta(days=rng.randrange(-180, 365), hours=rng.randrange(24))).replace(minute=0, second=0, microsecond=0)
+        yield {
+            'id': event_id, 'title': f'Generated event {event_id}', 'description': 'Generated event',
+            'category': rng.choice(CATEGORIES), 'price': float(rng.randrange(40, 400)),
+            'max_guests': rng.randrange(20, 200), 'date': date, 'duration_hours': rng.randrange(2, 6),
+            'features': '[]', 'is_active': rng.random() < 0.95, 'confirmed_seats': 0, 'held_seats': 0,
+            'created_at': now - timedelta(days=200), 'updated_at': now
+        }
+
+
+def _booking_status(rng, starts_at, now):
+    """(status, payment_status) weighted by whether the slot is past or upcoming"""
+    roll = rng.random()
+    if roll < 0.15:
+        return 'cancelled', 'refunded'
+    if starts_at < now:
+        return ('checked_in', 'paid') if roll < 0.75 else ('confirmed', 'paid')
+    return ('confirmed', 'paid') if roll < 0.75 else ('pending', 'pending')
+
+
+def _bookings(rng, first_id, count, events, lounges, user_range, now):
+    for booking_id in range(first_id, first_id + count):
+        guests = rng.randrange(1, 5)
+        if lounges and (not events or rng.random() < 0.2):
+            lounge_id, hourly_rate = rng.choice(lounges)
+            event_id = None
+            duration = rng.randrange(2, 5)
+            starts_at = (now + timedelta(days=rng.randrange(-180, 180))).replace(
+                hour=rng.randrange(18, 23), minute=rng.choice((0, 30)), second=0, microsecond=0)
+            amount = hourly_rate * duration
+        else:
+            event_id, starts_at, duration, price = rng.choice(events)
+            lounge_id = None
+            amount = price * guests
+        status, payment_status = _booking_status(rng, starts_at, now)
+        created_at = min(now, starts_at) - timedelta(days=rng.randrange(1, 60), minutes=rng.randrange(1440))
+        yield {
+            'id': booking_id, 'booking_reference': f'GEN{booking_id:012d}', 'guest_name': 'Generated Guest',
+            'guest_email': f'guest{booking_id}@example.com', 'guest_count': guests,
+            'event_id': event_id, 'lounge_id': lounge_id,
+            'user_id': rng.randrange(*user_range) if user_range and rng.random() < 0.6 else None,
+            'booking_date': starts_at.replace(hour=0, minute=0), 'booking_time': starts_at.strftime('%H:%M'),
+            'duration_hours': duration, 'starts_at': starts_at, 'ends_at': starts_at + timedelta(hours=duration),
+            'total_amount': amount, 'payment_status': payment_status,
+            'payment_method': 'stripe' if payment_status != 'pending' else None, 'status': status,
+            'check_in_time': starts_at if status == 'checked_in' else None,
+            'created_at': created_at, 'updated_at': created_at
+        }
+
+
+def generate(users=1000, lounges=20, events=500, bookings=10000, membership_ratio=0.3, seed=42,
+             batch_size=10000, log=print):
+    """Append synthetic rows to the current app's database; returns rows inserted per table"""
+    rng = random.Random(seed)
+    now = datetime.utcnow().replace(microsecond=0)
+    if db.engine.dialect.name == 'sqlite':
+        db.session.execute(db.text('PRAGMA synchronous=OFF'))
+    counts = {}
+
+    def timed(name, model, rows):
+        started = time.perf_counter()
+        counts[name] = _insert(model, rows, batch_size)
+        elapsed = time.perf_counter() - started
+        log(f"   • {name}: {counts[name]} rows in {elapsed:.1f}s ({counts[name] / max(elapsed, 1e-9):.0f} rows/s)")
+
+    tier_ids = _tier_ids(now)
+
+    first_user = _next_id(User)
+    timed('users', User, _users(rng, first_user, users, now))
+    member_ids = [user_id for user_id in range(first_user, first_user + users) if rng.random() < membership_ratio]
+    timed('memberships', Membership, _memberships(rng, _next_id(Membership), member_ids, tier_ids, now))
+
+    first_lounge = _next_id(Lounge)
+    lounge_rows = list(_lounges(rng, first_lounge, lounges, now))
+    timed('lounges', Lounge, lounge_rows)
+
+    first_event = _next_id(Event)
+    event_rows = list(_events(rng, first_event, events, now))
+    timed('events', Event, event_rows)
+
+    # Bookings only need a few fields of their targets
+    event_refs = [(row['id'], row['date'], row['duration_hours'], row['price']) for row in event_rows]
+    lounge_refs = [(row['id'], row['hourly_rate']) for row in lounge_rows]
+    del event_rows, lounge_rows
+    if bookings and not (event_refs or lounge_refs):
+        raise ValueError('Bookings need at least one event or lounge')
+    user_range = (first_user, first_user + users) if users else None
+    timed('bookings', Booking, _bookings(rng, _next_id(Booking), bookings, event_refs, lounge_refs, user_range, now))
+
+    Event.reconcile_confirmed_seats()
+    db.session.commit()
+    if db.engine.dialect.name == 'sqlite':
+        db.session.execute(db.text('ANALYZE'))
+        db.session.commit()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database', required=True,
+                        help='Target database URI, e.g. sqlite:////tmp/elevate.db (never read from the environment)')
+    parser.add_argument('--force', action='store_true', help='Allow a non-SQLite target database')
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--lounges', type=int, default=20)
+    parser.add_argument('--events', type=int, default=500)
+    parser.add_argument('--bookings', type=int, default=10000)
+    parser.add_argument('--membership-ratio', type=float, default=0.3)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--batch-size', type=int, default=10000)
+    args = parser.parse_args()
+    if not args.database.startswith('sqlite:') and not args.force:
+        parser.error(f'refusing to write synthetic rows to {args.database.split(":", 1)[0]}; '
+                     'pass --force if this really is a throwaway database')
+
+    from src.app import create_app
+    app = create_app({'SQLALCHEMY_DATABASE_URI': args.database, 'AUTO_CREATE_SCHEMA': True})
+
+    print("🌱 Generating synthetic data...")
+    with app.app_context():
+        try:
+            generate(args.users, args.lounges, args.events, args.bookings, args.membership_ratio,
+                     args.seed, args.batch_size)
+        except Exception as e:
+            print(f"❌ Error during generation: {str(e)}")
+            db.session.rollback()
+            return False
+    print("🎉 Done")
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,155 @@
+"""
+Background maintenance jobs for Elevate Events
+Each job works in bounded batches, committing as it goes, under a JobLease so
+that several workers (cron-driven CLI runs, in-process sweeper threads on
+every web worker) can be scheduled at once without doing the same work twice.
+Runs are recorded in the Prometheus job metrics.
+"""
+
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from flask import current_app
+from src.models.user import db
+from src.models.booking import Booking
+from src.models.job_lease import JobLease
+from src.models.membership import Membership
+from src.utils.cache import response_cache
+from src.utils.metrics import metrics
+
+EXPIRE_PENDING_BOOKINGS = 'expire-pending-bookings'
+RENEW_MEMBERSHIPS = 'renew-memberships'
+
+# Leases outlive a batch comfortably and are renewed after each one
+LEASE_SECONDS = 120
+
+
+def worker_id():
+    """Identify this process and thread as a lease owner"""
+    return f'{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}'
+
+
+def expire_pending_bookings(ttl_minutes=None, batch_size=500, log=None):
+    """Expire pending bookings older than ttl_minutes (default PENDING_BOOKING_TTL_MINUTES).
+
+    Returns the number expired, or None when another worker holds the lease.
+    """
+    if ttl_minutes is None:
+        ttl_minutes = current_app.config['PENDING_BOOKING_TTL_MINUTES']
+    owner = worker_id()
+    if not JobLease.acquire(EXPIRE_PENDING_BOOKINGS, owner, LEASE_SECONDS):
+        return None
+
+    started = time.perf_counter()
+    created_before = datetime.utcnow() - timedelta(minutes=ttl_minutes)
+    total = 0
+    try:
+        while True:
+            expired = Booking.expire_pending(created_before, limit=batch_size)
+            db.session.commit()
+            total += expired
+            if log and expired:
+                log(f"   • {total} pending bookings expired ({time.perf_counter() - started:.1f}s)")
+            if expired < batch_size or not JobLease.acquire(EXPIRE_PENDING_BOOKINGS, owner, LEASE_SECONDS):
+                break
+    finally:
+        db.session.rollback()
+        JobLease.release(EXPIRE_PENDING_BOOKINGS, owner)
+        metrics.observe_job(EXPIRE_PENDING_BOOKINGS, total, time.perf_counter() - started)
+
+    if total:
+        # Released seat holds change event availability
+        response_cache.bump('events')
+    return total
+
+
+def _membership_report(as_of):
+    return {
+        'as_of': as_of.isoformat(),
+        'last_id': 0,
+        'lapsed': 0,
+        'renewed': {'monthly': 0, 'annual': 0},
+        'expired': {'not_auto_renew': 0, 'payment_status': 0, 'overdue': 0},
+    }
+
+
+def renew_memberships(batch_size=5000, dry_run=False, restart=False, log=None):
+    """Renew due auto-renew memberships and deactivate lapsed ones, batch by batch.
+
+    Each batch commits together with a checkpoint on the job lease, so an
+    interrupted run resumes after the last committed batch with the same as_of
+    cutoff (pass restart=True to start over). A dry run writes nothing and
+    needs no lease. Returns the report, or None when another worker holds the
+    lease.
+    """
+    owner = worker_id()
+    if not dry_run and not JobLease.acquire(RENEW_MEMBERSHIPS, owner, LEASE_SECONDS):
+        return None
+
+    started = time.perf_counter()
+    report = None if dry_run or restart else JobLease.load_checkpoint(RENEW_MEMBERSHIPS)
+    if report and log:
+        log(f"   • Resuming run as of {report['as_of']} after membership {report['last_id']}")
+    report = report or _membership_report(datetime.utcnow())
+    as_of = datetime.fromisoformat(report['as_of'])
+    processed = 0
+    try:
+        while True:
+            rows = Membership.lapsed_batch(as_of, after_id=report['last_id'], limit=batch_size)
+            if not rows:
+                break
+            renewals, expiries = Membership.plan_lapsed(rows, as_of)
+            report['last_id'] = rows[-1].id
+            report['lapsed'] += len(rows)
+            for row, _ in renewals:
+                report['renewed']['annual' if row.billing_cycle == 'annual' else 'monthly'] += 1
+            for _, reason in expiries:
+                report['expired'][reason] += 1
+            processed += len(rows)
+
+            if not dry_run:
+                Membership.apply_lapsed(renewals, expiries, as_of)
+                if not JobLease.save_checkpoint(RENEW_MEMBERSHIPS, owner, report, LEASE_SECONDS):
+                    raise RuntimeError('Lost the renew-memberships lease to another worker')
+                db.session.commit()
+            if log:
+                log(f"   • {report['lapsed']} lapsed memberships processed ({time.perf_counter() - started:.1f}s)")
+            if len(rows) < batch_size:
+                break
+
+        if not dry_run:
+            JobLease.save_checkpoint(RENEW_MEMBERSHIPS, owner, None, LEASE_SECONDS)
+            db.session.commit()
+    finally:
+        db.session.rollback()
+        if not dry_run:
+            JobLease.release(RENEW_MEMBERSHIPS, owner)
+            metrics.observe_job(RENEW_MEMBERSHIPS, processed, time.perf_counter() - started)
+
+    report['dry_run'] = dry_run
+    return report
+
+
+def start_pending_booking_sweeper(app):
+    """Run expire_pending_bookings every PENDING_BOOKING_SWEEP_INTERVAL seconds on a daemon thread.
+
+    Returns a threading.Event that stops the sweeper when set.
+    """
+    interval = app.config['PENDING_BOOKING_SWEEP_INTERVAL']
+    stop = threading.Event()
+
+    def sweep():
+        while not stop.wait(interval):
+            with app.app_context():
+                try:
+                    expired = expire_pending_bookings()
+                    if expired:
+                        app.logger.info('Expired %d stale pending bookings', expired)
+                except Exception:
+                    db.session.rollback()
+                    app.logger.exception('Pending booking sweep failed')
+
+    threading.Thread(target=sweep, name='pending-booking-sweeper', daemon=True).start()
+    return stop
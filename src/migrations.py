@@ -0,0 +1,123 @@
+"""
+Lightweight schema upgrades for Elevate Events
+Brings an existing database in line with the model definitions without a full
+migration framework: creates missing tables, adds missing columns, drops
+obsolete indexes and runs the data backfills that derived columns need. The
+backfills run on every upgrade, so one interrupted by a bad row or a crash
+finishes on the next run.
+"""
+
+from src.models import import_models
+from src.models.user import db
+
+
+def _add_missing_columns():
+    """Add columns declared on the models but missing from existing tables"""
+    inspector = db.inspect(db.engine)
+    existing_tables = set(inspector.get_table_names())
+    added = set()
+
+    for table in db.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+
+        existing_columns = {column['name'] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing_columns:
+                continue
+
+            column_type = column.type.compile(dialect=db.engine.dialect)
+            ddl = f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'
+            if column.server_default is not None:
+                default = str(column.server_default.arg).replace("'", "''")
+                ddl += f" DEFAULT '{default}'"
+                if not column.nullable:
+                    ddl += ' NOT NULL'
+
+            with db.engine.begin() as connection:
+                connection.execute(db.text(ddl))
+            added.add((table.name, column.name))
+
+    return added
+
+
+# Indexes older releases created that the models no longer declare
+OBSOLETE_INDEXES = [
+    'ix_bookings_starts_at',  # superseded by ix_bookings_lounge_slot
+]
+
+
+def _drop_obsolete_indexes():
+    """Drop indexes the models no longer declare, so writes stop maintaining them"""
+    with db.engine.begin() as connection:
+        for name in OBSOLETE_INDEXES:
+            connection.execute(db.text(f'DROP INDEX IF EXISTS {name}'))
+
+
+def _create_missing_indexes():
+    """Create indexes declared on the models but missing from existing tables"""
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db.engine, checkfirst=True)
+
+
+def _backfill_booking_slots(batch_size=1000):
+    """Fill bookings.starts_at/ends_at from booking_date, booking_time and duration_hours.
+
+    Commits each batch. Rows whose legacy booking_time cannot be parsed are
+    left unfilled; returns (filled, ids of skipped rows).
+    """
+    from src.models.booking import Booking
+
+    filled = 0
+    skipped = []
+    last_id = 0
+    while True:
+        rows = db.session.execute(
+            db.select(Booking.id, Booking.booking_date, Booking.booking_time, Booking.duration_hours)
+            .where(Booking.starts_at.is_(None), Booking.id > last_id)
+            .order_by(Booking.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+
+        updates = []
+        for row in rows:
+            try:
+                starts_at, ends_at = Booking.slot_for(row.booking_date, row.booking_time, row.duration_hours)
+            except (TypeError, ValueError):
+                skipped.append(row.id)
+                continue
+            updates.append({'id': row.id, 'starts_at': starts_at, 'ends_at': ends_at})
+        if updates:
+            db.session.execute(db.update(Booking), updates)
+        db.session.commit()
+        filled += len(updates)
+        last_id = rows[-1].id
+
+    return filled, skipped
+
+
+def _run_backfills():
+    """Bring derived columns up to date; safe to repeat, as each step only touches stale rows"""
+    from src.models.event import Event
+
+    # Committed on its own, so a failure later on cannot roll the ledger repair back
+    reconciled = Event.reconcile_confirmed_seats()
+    db.session.commit()
+    filled, skipped = _backfill_booking_slots()
+    return {'seats_reconciled': reconciled, 'slots_filled': filled, 'slots_skipped': skipped}
+
+
+def upgrade_schema():
+    """Create missing tables, columns and indexes, drop obsolete indexes, then run the backfills.
+
+    Returns a report: added_columns plus the backfill counts from _run_backfills.
+    """
+    import_models()
+    db.create_all()
+    added_columns = _add_missing_columns()
+    _drop_obsolete_indexes()
+    _create_missing_indexes()
+    return {'added_columns': added_columns, **_run_backfills()}
@@ -0,0 +1,25 @@
+"""
+Model registry for Elevate Events
+Routes and jobs import only the models they use, so `db.metadata` is complete
+only once every model module has been imported. Schema tooling calls
+`import_models()` first so that no table is left out.
+"""
+
+from importlib import import_module
+
+MODEL_MODULES = [
+    'src.models.user',
+    'src.models.event',
+    'src.models.lounge',
+    'src.models.membership',
+    'src.models.booking',
+    'src.models.seat_hold',
+    'src.models.idempotency_key',
+    'src.models.job_lease',
+]
+
+
+def import_models():
+    """Import every model module so that db.metadata knows all tables"""
+    for module_name in MODEL_MODULES:
+        import_module(module_name)
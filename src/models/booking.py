@@ -1,11 +1,30 @@
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
+from datetime import datetime, timedelta
 import uuid
 from .user import db
+from src.utils import qr_tokens
+from src.utils.serializers import serializer_for
+from .event import Event
 
 class Booking(db.Model):
     __tablename__ = 'bookings'
     
+    # Statuses that occupy seats in an event's capacity ledger
+    SEAT_HOLDING_STATUSES = ('confirmed', 'checked_in')
+    
+    # Upper bound on a single booking's length; keeps slot range scans tight
+    MAX_DURATION_HOURS = 24
+    
+    # How long after the slot ends a booking's QR token still admits the guest
+    QR_TOKEN_GRACE = timedelta(hours=12)
+    
+    __table_args__ = (
+        db.Index('ix_bookings_lounge_slot', 'lounge_id', 'starts_at', 'ends_at'),
+        db.Index('ix_bookings_event_status', 'event_id', 'status'),
+        db.Index('ix_bookings_user_created', 'user_id', 'created_at'),
+        db.Index('ix_bookings_status_created', 'status', 'created_at'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
     booking_reference = db.Column(db.String(50), unique=True, nullable=False)
     
@@ -22,6 +41,9 @@ class Booking(db.Model):
     booking_date = db.Column(db.DateTime, nullable=False)
     booking_time = db.Column(db.String(10), nullable=False)  # e.g., "19:00"
     duration_hours = db.Column(db.Integer, nullable=False, default=2)
+    starts_at = db.Column(db.DateTime)  # booking_date + booking_time
+    ends_at = db.Column(db.DateTime)  # starts_at + duration_hours
+    hold_id = db.Column(db.String(36))  # seat hold reserved at checkout (event bookings)
     
     # Payment Information
     total_amount = db.Column(db.Float, nullable=False)
@@ -30,7 +52,7 @@ class Booking(db.Model):
     payment_reference = db.Column(db.String(200))
     
     # Status and QR Code
-    status = db.Column(db.String(50), default='pending')  # pending, confirmed, cancelled, completed
+    status = db.Column(db.String(50), default='pending')  # pending, confirmed, checked_in, cancelled, expired, completed
     qr_code = db.Column(db.String(500))  # QR code data or URL
     check_in_time = db.Column(db.DateTime)
     
@@ -45,48 +67,228 @@ class Booking(db.Model):
         super().__init__(**kwargs)
         if not self.booking_reference:
             self.booking_reference = self.generate_booking_reference()
+        if not self.starts_at and self.booking_date and self.booking_time:
+            self.set_slot()
+    
+    @staticmethod
+    def slot_for(booking_date, booking_time, duration_hours):
+        """Return the (starts_at, ends_at) datetimes for a date, 'HH:MM' time and duration"""
+        if isinstance(booking_date, datetime):
+            booking_date = booking_date.date()
+        starts_at = datetime.combine(booking_date, datetime.strptime(booking_time, '%H:%M').time())
+        return starts_at, starts_at + timedelta(hours=duration_hours or 0)
+    
+    def set_slot(self):
+        """Derive starts_at/ends_at from booking_date, booking_time and duration_hours"""
+        duration_hours = self.duration_hours if self.duration_hours is not None else 2
+        self.starts_at, self.ends_at = self.slot_for(self.booking_date, self.booking_time, duration_hours)
     
     @staticmethod
     def generate_booking_reference():
         return f"EE{datetime.now().strftime('%Y%m%d')}{str(uuid.uuid4())[:8].upper()}"
     
+    @staticmethod
+    def overlaps_slot(slot_start, slot_end):
+        """SQL predicate for bookings whose time slot overlaps [slot_start, slot_end)
+        
+        The lower bound on starts_at turns the check into a bounded range scan
+        on the (lounge_id, starts_at, ends_at) index.
+        """
+        return db.and_(
+            Booking.starts_at < slot_end,
+            Booking.starts_at > slot_start - timedelta(hours=Booking.MAX_DURATION_HOURS),
+            Booking.ends_at > slot_start
+        )
+    
+    SERIALIZE_EXCLUDE = ('user_id', 'payment_reference')
+    
     def to_dict(self):
-        return {
-            'id': self.id,
-            'booking_reference': self.booking_reference,
-            'guest_name': self.guest_name,
-            'guest_email': self.guest_email,
-            'guest_phone': self.guest_phone,
-            'guest_count': self.guest_count,
-            'special_requests': self.special_requests,
-            'event_id': self.event_id,
-            'lounge_id': self.lounge_id,
-            'booking_date': self.booking_date.isoformat() if self.booking_date else None,
-            'booking_time': self.booking_time,
-            'duration_hours': self.duration_hours,
-            'total_amount': self.total_amount,
-            'payment_status': self.payment_status,
-            'payment_method': self.payment_method,
-            'status': self.status,
-            'qr_code': self.qr_code,
-            'check_in_time': self.check_in_time.isoformat() if self.check_in_time else None,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        return serializer_for(Booking)(self)
     
     def generate_qr_code_data(self):
-        """Generate QR code data for booking verification"""
-        return f"ELEVATE_BOOKING:{self.booking_reference}:{self.guest_name}:{self.booking_date.strftime('%Y-%m-%d')}:{self.booking_time}"
+        """Signed QR token that door scanners verify without a database lookup"""
+        expires_at = self.ends_at + self.QR_TOKEN_GRACE if self.ends_at else None
+        return qr_tokens.sign_booking(self.booking_reference, expires_at)
     
     def confirm_booking(self):
-        """Confirm the booking and generate QR code"""
+        """Confirm the booking and generate QR code.
+        
+        Event bookings convert their own seat hold into confirmed seats, or claim
+        seats directly if the hold was already released. Returns False, leaving the
+        booking pending, when the event can no longer seat the party.
+        """
+        if self.event_id and not self.claim_seats():
+            return False
+        
         self.status = 'confirmed'
         self.qr_code = self.generate_qr_code_data()
         self.updated_at = datetime.utcnow()
+        return True
     
-    def check_in(self):
-        """Check in the guest"""
-        self.check_in_time = datetime.utcnow()
-        self.status = 'checked_in'
+    def claim_seats(self):
+        """Move this booking's seats into the event's confirmed counter"""
+        from .seat_hold import SeatHold
+        
+        if self.hold_id and SeatHold.consume(self.hold_id, self.event_id, self.guest_count):
+            return True
+        return Event.claim_seats(self.event_id, self.guest_count)
+    
+    @staticmethod
+    def check_in_reference(booking_reference, checked_in_at=None):
+        """Check in a confirmed booking with one conditional UPDATE.
+        
+        Returns (id, user_id, guest_name, guest_count) of the booking, or None
+        when it does not exist, is not confirmed or was already checked in, so
+        concurrent scans of the same code admit the guest exactly once.
+        Confirmed and checked-in bookings both hold seats, so the event's seat
+        ledger is unchanged.
+        """
+        checked_in_at = checked_in_at or datetime.utcnow()
+        check_in = (
+            db.update(Booking)
+            .where(
+                Booking.booking_reference == booking_reference,
+                Booking.status == 'confirmed',
+                Booking.check_in_time.is_(None)
+            )
+            .values(status='checked_in', check_in_time=checked_in_at, updated_at=checked_in_at)
+        )
+        columns = (Booking.id, Booking.user_id, Booking.guest_name, Booking.guest_count)
+        if db.engine.dialect.update_returning:
+            return db.session.execute(check_in.returning(*columns)).first()
+        
+        # No RETURNING: the guarded update still admits once; read back the winner's row
+        if db.session.execute(check_in).rowcount != 1:
+            return None
+        return db.session.execute(
+            db.select(*columns).where(Booking.booking_reference == booking_reference)
+        ).first()
+    
+    @staticmethod
+    def check_in_batch(scanned_at_by_reference):
+        """Check in many bookings at their scan times with one guarded UPDATE.
+        
+        Takes {booking_reference: scanned_at} and returns {booking_reference:
+        (outcome, booking row)} where outcome is 'accepted', 'duplicate' (already
+        checked in, including by a concurrent scan), 'conflict' (not confirmed) or
+        'not_found'. Replaying a batch therefore only yields duplicates.
+        """
+        references = list(scanned_at_by_reference)
+        rows = db.session.execute(
+            db.select(Booking.id, Booking.booking_reference, Booking.status, Booking.check_in_time,
+                      Booking.user_id, Booking.guest_count)
+            .where(Booking.booking_reference.in_(references))
+        ).all()
+        by_reference = {row.booking_reference: row for row in rows}
+        scanned_at_by_id = {
+            row.id: scanned_at_by_reference[row.booking_reference]
+            for row in rows if row.status == 'confirmed' and row.check_in_time is None
+        }
+        
+        admitted = set()
+        if scanned_at_by_id:
+            check_in = (
+                db.update(Booking)
+                .where(
+                    Booking.id.in_(list(scanned_at_by_id)),
+                    Booking.status == 'confirmed',
+                    Booking.check_in_time.is_(None)
+                )
+                .values(
+                    status='checked_in',
+                    check_in_time=db.case(scanned_at_by_id, value=Booking.id),
+                    updated_at=datetime.utcnow()
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if db.engine.dialect.update_returning:
+                admitted = set(db.session.execute(check_in.returning(Booking.id)).scalars())
+            else:
+                # No RETURNING: a booking is ours if it now carries our scan time
+                db.session.execute(check_in)
+                admitted = {
+                    row.id for row in db.session.execute(
+                        db.select(Booking.id, Booking.check_in_time).where(Booking.id.in_(list(scanned_at_by_id)))
+                    ) if row.check_in_time == scanned_at_by_id[row.id]
+                }
+        
+        outcomes = {}
+        for reference in references:
+            row = by_reference.get(reference)
+            if row is None:
+                outcomes[reference] = ('not_found', None)
+            elif row.id in admitted:
+                outcomes[reference] = ('accepted', row)
+            elif row.check_in_time is not None or row.status == 'checked_in' or row.id in scanned_at_by_id:
+                outcomes[reference] = ('duplicate', row)
+            else:
+                outcomes[reference] = ('conflict', row)
+        return outcomes
+    
+    @staticmethod
+    def expire_pending(created_before, limit=500):
+        """Expire up to limit pending bookings created before created_before.
+        
+        Seat holds still attached to them are released. Returns the number of
+        bookings expired. Runs in the caller's transaction.
+        """
+        from .seat_hold import SeatHold
+        
+        ids = db.session.execute(
+            db.select(Booking.id)
+            .where(Booking.status == 'pending', Booking.created_at < created_before)
+            .order_by(Booking.created_at)
+            .limit(limit)
+        ).scalars().all()
+        if not ids:
+            return 0
+        
+        now = datetime.utcnow()
+        expire = (
+            db.update(Booking)
+            .where(Booking.id.in_(ids), Booking.status == 'pending')
+            .values(status='expired', updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        if db.engine.dialect.update_returning:
+            hold_ids = db.session.execute(expire.returning(Booking.hold_id)).scalars().all()
+        else:
+            # No RETURNING: the status guard keeps concurrent sweeps from expiring a booking twice
+            hold_ids = db.session.execute(
+                db.select(Booking.hold_id).where(Booking.id.in_(ids), Booking.status == 'pending')
+            ).scalars().all()
+            db.session.execute(expire)
+        
+        SeatHold.release_many([hold_id for hold_id in hold_ids if hold_id])
+        return len(hold_ids)
+    
+    def cancel(self):
+        """Cancel the booking and release any seats it held"""
+        from .seat_hold import SeatHold
+        
+        previous_status = self.status
+        if previous_status == 'pending' and self.hold_id:
+            SeatHold.release(self.hold_id)
+        self.status = 'cancelled'
         self.updated_at = datetime.utcnow()
+        self.update_seat_ledger(previous_status)
+    
+    def cache_family(self):
+        """Response cache family whose availability this booking affects"""
+        return 'events' if self.event_id else 'lounges'
+    
+    def update_seat_ledger(self, previous_status):
+        """Apply a status change to the event's confirmed seat counter.
+        
+        Runs in the caller's transaction so the counter commits or rolls back
+        together with the booking itself.
+        """
+        if not self.event_id:
+            return
+        
+        held_before = previous_status in self.SEAT_HOLDING_STATUSES
+        held_now = self.status in self.SEAT_HOLDING_STATUSES
+        if held_before != held_now:
+            delta = self.guest_count if held_now else -self.guest_count
+            Event.adjust_confirmed_seats(self.event_id, delta)
 
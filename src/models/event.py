@@ -1,9 +1,16 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
+import json
+from sqlalchemy.ext.hybrid import hybrid_property
 from .user import db
+from src.utils.dates import parse_timestamp
+from src.utils.serializers import serializer_for
 
 class Event(db.Model):
     __tablename__ = 'events'
+    __table_args__ = (
+        db.Index('ix_events_active_category_date', 'is_active', 'category', 'date'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(200), nullable=False)
@@ -17,41 +24,236 @@ class Event(db.Model):
     venue_location = db.Column(db.String(200))
     features = db.Column(db.Text)  # JSON string of features
     is_active = db.Column(db.Boolean, default=True)
+    
+    # Capacity ledger: seats held by confirmed/checked-in bookings, kept in step by Booking,
+    # and seats reserved by unexpired checkout holds, kept in step by SeatHold
+    confirmed_seats = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    held_seats = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     # Relationships
     bookings = db.relationship('Booking', backref='event', lazy=True, cascade='all, delete-orphan')
     
-    def to_dict(self):
+    # Fields a listing can project with ?fields=
+    LISTING_FIELDS = (
+        'id', 'title', 'description', 'category', 'price', 'max_guests', 'date',
+        'duration_hours', 'image_url', 'venue_location', 'features', 'is_active',
+        'created_at', 'updated_at', 'available_spots'
+    )
+    SERIALIZE_EXCLUDE = ('confirmed_seats', 'held_seats')
+    
+    # Fields a bulk import row may carry; the first six are required
+    IMPORT_FIELDS = (
+        'title', 'description', 'category', 'price', 'max_guests', 'date',
+        'duration_hours', 'image_url', 'venue_location', 'features', 'is_active'
+    )
+    IMPORT_REQUIRED_FIELDS = IMPORT_FIELDS[:6]
+    IMPORT_BATCH_SIZE = 500
+    
+    def to_dict(self, fields=None):
+        return serializer_for(Event, fields)(self)
+    
+    @staticmethod
+    def import_values(data):
+        """Validate one import row (JSON object or CSV record) into insert values.
+        
+        Raises ValueError describing the first problem found.
+        """
+        if not isinstance(data, dict):
+            raise ValueError('Row must be an object')
+        data = {key: value for key, value in data.items() if value not in (None, '')}
+        unknown = set(data) - set(Event.IMPORT_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        missing = [field for field in Event.IMPORT_REQUIRED_FIELDS if field not in data]
+        if missing:
+            raise ValueError(f"Missing required fields: {', '.join(missing)}")
+        
+        event_date = data['date']
+        if not isinstance(event_date, datetime):
+            event_date = parse_timestamp(str(event_date))
+        price = float(data['price'])
+        max_guests = int(data['max_guests'])
+        duration_hours = int(data.get('duration_hours', 3))
+        if price < 0 or max_guests < 1 or duration_hours < 1:
+            raise ValueError('price must be >= 0, max_guests and duration_hours >= 1')
+        features = data.get('features')
+        if isinstance(features, list):
+            features = json.dumps(features)
+        is_active = data.get('is_active', True)
+        if isinstance(is_active, str):
+            is_active = is_active.strip().lower() in ('1', 'true', 'yes')
+        
         return {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'category': self.category,
-            'price': self.price,
-            'max_guests': self.max_guests,
-            'date': self.date.isoformat() if self.date else None,
-            'duration_hours': self.duration_hours,
-            'image_url': self.image_url,
-            'venue_location': self.venue_location,
-            'features': self.features,
-            'is_active': self.is_active,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'title': str(data['title']),
+            'description': str(data['description']),
+            'category': str(data['category']),
+            'price': price,
+            'max_guests': max_guests,
+            'date': event_date,
+            'duration_hours': duration_hours,
+            'image_url': data.get('image_url'),
+            'venue_location': data.get('venue_location'),
+            'features': features,
+            'is_active': bool(is_active)
         }
     
     @staticmethod
-    def get_available_events(category=None):
+    def bulk_insert(rows, batch_size=IMPORT_BATCH_SIZE):
+        """Insert import_values() dicts in batches; runs in the caller's transaction.
+        
+        Each batch is one executemany of a single cached INSERT, which avoids
+        recompiling a new multi-row VALUES statement for every batch.
+        Returns the number of rows inserted.
+        """
+        inserted = 0
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                db.session.execute(db.insert(Event.__table__), batch)
+                inserted += len(batch)
+                batch = []
+        if batch:
+            db.session.execute(db.insert(Event.__table__), batch)
+            inserted += len(batch)
+        return inserted
+    
+    @staticmethod
+    def columns_for(fields):
+        """Mapped columns needed to serialize fields (plus the pagination key)"""
+        names = {'id', 'date'}
+        for field in fields:
+            if field == 'available_spots':
+                names.update(('max_guests', 'confirmed_seats', 'held_seats'))
+            else:
+                names.add(field)
+        return [getattr(Event, name) for name in sorted(names)]
+    
+    @staticmethod
+    def available_events_query(category=None, date_from=None, date_to=None):
         query = Event.query.filter_by(is_active=True)
         if category and category != 'all':
             query = query.filter_by(category=category)
-        return query.filter(Event.date > datetime.utcnow()).order_by(Event.date).all()
+        query = query.filter(Event.date > datetime.utcnow())
+        if date_from:
+            query = query.filter(Event.date >= date_from)
+        if date_to:
+            query = query.filter(Event.date < date_to)
+        return query.order_by(Event.date, Event.id)
+    
+    @staticmethod
+    def get_available_events(category=None, date_from=None, date_to=None, after=None, limit=None, fields=None):
+        """Get upcoming events in (date, id) order.
+        
+        after resumes from a (date, id) keyset position and fields restricts
+        which columns are loaded.
+        """
+        query = Event.available_events_query(category, date_from, date_to)
+        if after:
+            after_date, after_id = after
+            query = query.filter(db.or_(
+                Event.date > after_date,
+                db.and_(Event.date == after_date, Event.id > after_id)
+            ))
+        if fields:
+            query = query.options(db.load_only(*Event.columns_for(fields)))
+        if limit:
+            query = query.limit(limit)
+        return query.all()
+    
+    @hybrid_property
+    def available_spots(self):
+        return max(0, self.max_guests - (self.confirmed_seats or 0) - (self.held_seats or 0))
+    
+    @available_spots.expression
+    def available_spots(cls):
+        remaining = cls.max_guests - cls.confirmed_seats - cls.held_seats
+        return db.case((remaining > 0, remaining), else_=0)
     
     def get_available_spots(self):
-        booked_spots = sum([booking.guest_count for booking in self.bookings if booking.status == 'confirmed'])
-        return max(0, self.max_guests - booked_spots)
+        return self.available_spots
     
     def is_available(self, guest_count=1):
         return self.get_available_spots() >= guest_count and self.date > datetime.utcnow()
-
+    
+    @staticmethod
+    def has_bookings(event_id):
+        """Check for any booking on the event without loading the collection"""
+        from .booking import Booking
+        
+        return db.session.execute(
+            db.select(db.select(Booking.id).where(Booking.event_id == event_id).exists())
+        ).scalar()
+    
+    @staticmethod
+    def adjust_confirmed_seats(event_id, delta):
+        """Atomically move an event's confirmed seat counter by delta"""
+        db.session.execute(
+            db.update(Event)
+            .where(Event.id == event_id)
+            .values(confirmed_seats=Event.confirmed_seats + delta)
+        )
+    
+    @staticmethod
+    def adjust_held_seats(event_id, delta):
+        """Atomically move an event's held seat counter by delta"""
+        db.session.execute(
+            db.update(Event)
+            .where(Event.id == event_id)
+            .values(held_seats=Event.held_seats + delta)
+        )
+    
+    @staticmethod
+    def claim_seats(event_id, seats):
+        """Confirm seats only if they still fit alongside confirmed and held seats"""
+        result = db.session.execute(
+            db.update(Event)
+            .where(
+                Event.id == event_id,
+                Event.confirmed_seats + Event.held_seats + seats <= Event.max_guests
+            )
+            .values(confirmed_seats=Event.confirmed_seats + seats)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+    
+    @staticmethod
+    def reconcile_confirmed_seats():
+        """Rebuild every event's confirmed and held seat counters from bookings and holds.
+        
+        Returns the number of counters that had drifted.
+        """
+        from .booking import Booking
+        from .seat_hold import SeatHold
+        
+        booked_seats = db.select(
+            db.func.coalesce(db.func.sum(Booking.guest_count), 0)
+        ).where(
+            Booking.event_id == Event.id,
+            Booking.status.in_(Booking.SEAT_HOLDING_STATUSES)
+        ).scalar_subquery()
+        
+        result = db.session.execute(
+            db.update(Event)
+            .where(Event.confirmed_seats != booked_seats)
+            .values(confirmed_seats=booked_seats)
+            .execution_options(synchronize_session=False)
+        )
+        
+        held_seats = db.select(
+            db.func.coalesce(db.func.sum(SeatHold.seats), 0)
+        ).where(
+            SeatHold.event_id == Event.id,
+            SeatHold.status == 'active'
+        ).scalar_subquery()
+        
+        held_result = db.session.execute(
+            db.update(Event)
+            .where(Event.held_seats != held_seats)
+            .values(held_seats=held_seats)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount + held_result.rowcount
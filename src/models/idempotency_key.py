@@ -0,0 +1,127 @@
+from flask_sqlalchemy import SQLAlchemy
+from datetime import datetime, timedelta
+from .user import db
+
+class IdempotencyKey(db.Model):
+    __tablename__ = 'idempotency_keys'
+    __table_args__ = (
+        db.UniqueConstraint('scope', 'key', name='uq_idempotency_keys_scope_key'),
+        db.Index('ix_idempotency_keys_expires', 'expires_at'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    scope = db.Column(db.String(200), nullable=False)  # "POST /api/bookings"
+    key = db.Column(db.String(255), nullable=False)  # client-supplied Idempotency-Key
+    request_hash = db.Column(db.String(64), nullable=False)  # sha256 of the request body
+    status_code = db.Column(db.Integer)  # null while the first request is in flight
+    response_body = db.Column(db.Text)
+    locked_until = db.Column(db.DateTime)  # in-flight claim lapses after this; null counts as lapsed
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    expires_at = db.Column(db.DateTime, nullable=False)
+    
+    def in_flight(self, now=None):
+        """True while an unfinished claim is still within its lock timeout"""
+        return (
+            self.status_code is None
+            and self.locked_until is not None
+            and self.locked_until > (now or datetime.utcnow())
+        )
+    
+    @staticmethod
+    def lookup(scope, key):
+        """Unexpired record for scope/key, or None"""
+        return db.session.execute(
+            db.select(IdempotencyKey)
+            .where(
+                IdempotencyKey.scope == scope,
+                IdempotencyKey.key == key,
+                IdempotencyKey.expires_at > datetime.utcnow()
+            )
+        ).scalar_one_or_none()
+    
+    @staticmethod
+    def claim(scope, key, request_hash, ttl_seconds, lock_seconds):
+        """Record an in-flight request and commit it, returning (expires_at, locked_until).
+        
+        Raises IntegrityError if another request already holds the key. An
+        expired record for the same key is dropped first so the key can be
+        reused, and an unfinished claim for the same request whose lock has
+        lapsed (its request died or hung) is taken over. locked_until identifies
+        this claim to complete() and release().
+        """
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=ttl_seconds)
+        locked_until = now + timedelta(seconds=lock_seconds)
+        db.session.execute(
+            db.delete(IdempotencyKey)
+            .where(IdempotencyKey.scope == scope, IdempotencyKey.key == key, IdempotencyKey.expires_at <= now)
+        )
+        takeover = db.session.execute(
+            db.update(IdempotencyKey)
+            .where(
+                IdempotencyKey.scope == scope,
+                IdempotencyKey.key == key,
+                IdempotencyKey.request_hash == request_hash,
+                IdempotencyKey.status_code.is_(None),
+                db.or_(IdempotencyKey.locked_until.is_(None), IdempotencyKey.locked_until <= now)
+            )
+            .values(locked_until=locked_until, created_at=now, expires_at=expires_at)
+            .execution_options(synchronize_session=False)
+        )
+        if takeover.rowcount != 1:
+            db.session.execute(
+                db.insert(IdempotencyKey).values(
+                    scope=scope, key=key, request_hash=request_hash,
+                    locked_until=locked_until, created_at=now, expires_at=expires_at
+                )
+            )
+        db.session.commit()
+        return expires_at, locked_until
+    
+    @staticmethod
+    def _claimed(scope, key, locked_until):
+        return (
+            IdempotencyKey.scope == scope,
+            IdempotencyKey.key == key,
+            IdempotencyKey.status_code.is_(None),
+            IdempotencyKey.locked_until == locked_until
+        )
+    
+    @staticmethod
+    def complete(scope, key, locked_until, status_code, response_body):
+        """Store the response a claimed request produced, unless its claim was taken over"""
+        db.session.execute(
+            db.update(IdempotencyKey)
+            .where(*IdempotencyKey._claimed(scope, key, locked_until))
+            .values(status_code=status_code, response_body=response_body, locked_until=None)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+    
+    @staticmethod
+    def release(scope, key, locked_until):
+        """Forget an in-flight claim whose request failed, so a retry runs again"""
+        db.session.execute(
+            db.delete(IdempotencyKey)
+            .where(*IdempotencyKey._claimed(scope, key, locked_until))
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+    
+    @staticmethod
+    def purge_expired(limit=1000):
+        """Delete up to limit expired records; returns the number deleted"""
+        ids = db.session.execute(
+            db.select(IdempotencyKey.id)
+            .where(IdempotencyKey.expires_at <= datetime.utcnow())
+            .order_by(IdempotencyKey.expires_at)
+            .limit(limit)
+        ).scalars().all()
+        if not ids:
+            return 0
+        db.session.execute(
+            db.delete(IdempotencyKey)
+            .where(IdempotencyKey.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
+        return len(ids)
@@ -0,0 +1,82 @@
+from flask_sqlalchemy import SQLAlchemy
+import json
+from datetime import datetime, timedelta
+from sqlalchemy.exc import IntegrityError
+from .user import db
+
+# Time-limited lock that lets one worker at a time run a background job
+class JobLease(db.Model):
+    __tablename__ = 'job_leases'
+    
+    name = db.Column(db.String(100), primary_key=True)  # job name, e.g. "expire-pending-bookings"
+    owner = db.Column(db.String(200), nullable=False)  # host:pid:thread of the holder
+    expires_at = db.Column(db.DateTime, nullable=False)
+    checkpoint = db.Column(db.Text)  # JSON progress of an unfinished run, for resuming it
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    @staticmethod
+    def acquire(name, owner, ttl_seconds):
+        """Take or renew the lease on name for ttl_seconds; returns False if another owner holds it.
+        
+        Commits, so the lease is visible to other workers straight away.
+        """
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=ttl_seconds)
+        result = db.session.execute(
+            db.update(JobLease)
+            .where(JobLease.name == name, db.or_(JobLease.owner == owner, JobLease.expires_at <= now))
+            .values(owner=owner, expires_at=expires_at, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 1:
+            db.session.commit()
+            return True
+        
+        try:
+            db.session.execute(
+                db.insert(JobLease).values(name=name, owner=owner, expires_at=expires_at, updated_at=now)
+            )
+            db.session.commit()
+            return True
+        except IntegrityError:
+            db.session.rollback()
+            return False
+    
+    @staticmethod
+    def release(name, owner):
+        """Give up the lease early if owner still holds it"""
+        db.session.execute(
+            db.update(JobLease)
+            .where(JobLease.name == name, JobLease.owner == owner)
+            .values(expires_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+    
+    @staticmethod
+    def load_checkpoint(name):
+        """Progress saved by an unfinished run of name, or None"""
+        checkpoint = db.session.execute(
+            db.select(JobLease.checkpoint).where(JobLease.name == name)
+        ).scalar_one_or_none()
+        return json.loads(checkpoint) if checkpoint else None
+    
+    @staticmethod
+    def save_checkpoint(name, owner, checkpoint, ttl_seconds):
+        """Record progress and renew the lease in the caller's transaction.
+        
+        Returns False if owner no longer holds the lease; the caller should then
+        roll back and stop. Pass checkpoint=None once the run is complete.
+        """
+        now = datetime.utcnow()
+        result = db.session.execute(
+            db.update(JobLease)
+            .where(JobLease.name == name, JobLease.owner == owner)
+            .values(
+                checkpoint=json.dumps(checkpoint) if checkpoint is not None else None,
+                expires_at=now + timedelta(seconds=ttl_seconds),
+                updated_at=now
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
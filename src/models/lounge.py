@@ -1,6 +1,7 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
 from .user import db
+from src.utils.serializers import serializer_for
 
 class Lounge(db.Model):
     __tablename__ = 'lounges'
@@ -40,30 +41,7 @@ class Lounge(db.Model):
     bookings = db.relationship('Booking', backref='lounge', lazy=True)
     
     def to_dict(self):
-        return {
-            'id': self.id,
-            'name': self.name,
-            'description': self.description,
-            'category': self.category,
-            'capacity': self.capacity,
-            'hourly_rate': self.hourly_rate,
-            'minimum_hours': self.minimum_hours,
-            'maximum_hours': self.maximum_hours,
-            'features': self.features,
-            'amenities': self.amenities,
-            'image_urls': self.image_urls,
-            'is_active': self.is_active,
-            'operating_hours_start': self.operating_hours_start,
-            'operating_hours_end': self.operating_hours_end,
-            'floor_level': self.floor_level,
-            'max_standing': self.max_standing,
-            'max_seated': self.max_seated,
-            'has_private_bar': self.has_private_bar,
-            'has_sound_system': self.has_sound_system,
-            'has_lighting_control': self.has_lighting_control,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
-        }
+        return serializer_for(Lounge)(self)
     
     @staticmethod
     def get_available_lounges(category=None):
@@ -72,39 +50,41 @@ class Lounge(db.Model):
             query = query.filter_by(category=category)
         return query.order_by(Lounge.category, Lounge.hourly_rate).all()
     
+    @staticmethod
+    def conflicting_bookings(slot_start, slot_end, lounge_id=None):
+        """Bookings that occupy a lounge at any point within the slot.
+        
+        Correlates with the enclosing Lounge query unless lounge_id is given.
+        """
+        from .booking import Booking
+        
+        return db.select(Booking.id).where(
+            Booking.lounge_id == (Lounge.id if lounge_id is None else lounge_id),
+            Booking.status.in_(Booking.SEAT_HOLDING_STATUSES),
+            Booking.overlaps_slot(slot_start, slot_end)
+        )
+    
+    @staticmethod
+    def find_available_lounges(date, start_time, duration_hours, category=None):
+        """Get every active lounge that is free for the slot, in a single query"""
+        from .booking import Booking
+        
+        slot_start, slot_end = Booking.slot_for(date, start_time, duration_hours)
+        
+        query = Lounge.query.filter_by(is_active=True)
+        if category and category != 'all':
+            query = query.filter_by(category=category)
+        query = query.filter(~Lounge.conflicting_bookings(slot_start, slot_end).exists())
+        return query.order_by(Lounge.category, Lounge.hourly_rate).all()
+    
     def is_available(self, date, start_time, duration_hours):
         """Check if lounge is available for the specified time slot"""
-        from datetime import datetime, timedelta
         from .booking import Booking
         
-        # Parse the booking datetime
-        booking_start = datetime.combine(date, datetime.strptime(start_time, '%H:%M').time())
-        booking_end = booking_start + timedelta(hours=duration_hours)
-        
-        # Check for conflicting bookings
-        conflicting_bookings = Booking.query.filter(
-            Booking.lounge_id == self.id,
-            Booking.booking_date == date,
-            Booking.status.in_(['confirmed', 'checked_in']),
-            # Check for time overlap
-            db.or_(
-                db.and_(
-                    Booking.booking_time <= start_time,
-                    db.func.time(
-                        db.func.datetime(
-                            Booking.booking_time, 
-                            f'+{Booking.duration_hours} hours'
-                        )
-                    ) > start_time
-                ),
-                db.and_(
-                    Booking.booking_time < booking_end.strftime('%H:%M'),
-                    Booking.booking_time >= start_time
-                )
-            )
-        ).first()
+        slot_start, slot_end = Booking.slot_for(date, start_time, duration_hours)
         
-        return conflicting_bookings is None
+        conflict = Lounge.conflicting_bookings(slot_start, slot_end, lounge_id=self.id)
+        return not db.session.execute(db.select(conflict.exists())).scalar()
     
     def calculate_total_cost(self, duration_hours):
         """Calculate total cost for booking this lounge"""
@@ -1,6 +1,7 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime, timedelta
 from .user import db
+from src.utils.serializers import serializer_for
 
 class MembershipTier(db.Model):
     __tablename__ = 'membership_tiers'
@@ -36,29 +37,16 @@ class MembershipTier(db.Model):
     # Relationships
     memberships = db.relationship('Membership', backref='tier', lazy=True)
     
+    SERIALIZE_EXCLUDE = ('created_at', 'updated_at')
+    
     def to_dict(self):
-        return {
-            'id': self.id,
-            'name': self.name,
-            'slug': self.slug,
-            'description': self.description,
-            'monthly_price': self.monthly_price,
-            'annual_price': self.annual_price,
-            'discount_percentage': self.discount_percentage,
-            'priority_booking': self.priority_booking,
-            'complimentary_drinks': self.complimentary_drinks,
-            'private_lounge_access': self.private_lounge_access,
-            'concierge_service': self.concierge_service,
-            'exclusive_events': self.exclusive_events,
-            'birthday_perks': self.birthday_perks,
-            'transportation_service': self.transportation_service,
-            'features': self.features,
-            'is_active': self.is_active,
-            'sort_order': self.sort_order
-        }
+        return serializer_for(MembershipTier)(self)
 
 class Membership(db.Model):
     __tablename__ = 'memberships'
+    __table_args__ = (
+        db.Index('ix_memberships_user_active_end', 'user_id', 'is_active', 'end_date'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
@@ -94,6 +82,8 @@ class Membership(db.Model):
         super().__init__(**kwargs)
         if not self.membership_number:
             self.membership_number = self.generate_membership_number()
+        if not self.start_date:
+            self.start_date = datetime.utcnow()
         if not self.end_date:
             self.set_end_date()
     
@@ -111,29 +101,20 @@ class Membership(db.Model):
             self.end_date = self.start_date + timedelta(days=30)
             self.next_payment_date = self.end_date
     
+    SERIALIZE_NESTED = {'tier': MembershipTier}
+    
     def to_dict(self):
-        return {
-            'id': self.id,
-            'user_id': self.user_id,
-            'tier_id': self.tier_id,
-            'membership_number': self.membership_number,
-            'start_date': self.start_date.isoformat() if self.start_date else None,
-            'end_date': self.end_date.isoformat() if self.end_date else None,
-            'billing_cycle': self.billing_cycle,
-            'payment_status': self.payment_status,
-            'last_payment_date': self.last_payment_date.isoformat() if self.last_payment_date else None,
-            'next_payment_date': self.next_payment_date.isoformat() if self.next_payment_date else None,
-            'payment_method': self.payment_method,
-            'events_attended': self.events_attended,
-            'total_bookings': self.total_bookings,
-            'total_spent': self.total_spent,
-            'complimentary_drinks_used': self.complimentary_drinks_used,
-            'is_active': self.is_active,
-            'auto_renew': self.auto_renew,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'tier': self.tier.to_dict() if self.tier else None
-        }
+        return serializer_for(Membership)(self)
+    
+    @staticmethod
+    def active_for_user_query(user_id):
+        """Query for a user's active, unexpired membership"""
+        return Membership.query.filter_by(
+            user_id=user_id,
+            is_active=True
+        ).filter(
+            Membership.end_date > datetime.utcnow()
+        )
     
     def is_expired(self):
         """Check if membership is expired"""
@@ -145,18 +126,116 @@ class Membership(db.Model):
             return 0
         return (self.end_date - datetime.utcnow()).days
     
+    @staticmethod
+    def billing_period(billing_cycle):
+        """Length of one billing cycle"""
+        return timedelta(days=365) if billing_cycle == 'annual' else timedelta(days=30)
+    
     def renew_membership(self):
         """Renew membership for another billing cycle"""
-        if self.billing_cycle == 'annual':
-            self.end_date = self.end_date + timedelta(days=365)
-        else:
-            self.end_date = self.end_date + timedelta(days=30)
+        self.end_date = self.end_date + self.billing_period(self.billing_cycle)
         
         self.next_payment_date = self.end_date
         self.last_payment_date = datetime.utcnow()
         self.payment_status = 'active'
         self.updated_at = datetime.utcnow()
     
+    def record_booking(self, amount):
+        """Count a confirmed booking against this membership (atomic in SQL)"""
+        self.total_bookings = Membership.total_bookings + 1
+        self.total_spent = Membership.total_spent + amount
+        self.updated_at = datetime.utcnow()
+    
+    @staticmethod
+    def add_attendance(attended_by_user):
+        """Add {user_id: events attended} to each user's active membership in one executemany"""
+        if not attended_by_user:
+            return
+        table = Membership.__table__
+        now = datetime.utcnow()
+        db.session.execute(
+            db.update(table)
+            .where(
+                table.c.user_id == db.bindparam('member'),
+                table.c.is_active == True,
+                table.c.end_date > now
+            )
+            .values(events_attended=table.c.events_attended + db.bindparam('attended'), updated_at=now),
+            [{'member': user_id, 'attended': count} for user_id, count in attended_by_user.items()]
+        )
+    
+    @staticmethod
+    def lapsed_batch(as_of, after_id=0, limit=5000):
+        """Active memberships that ended by as_of, in id order after after_id"""
+        return db.session.execute(
+            db.select(
+                Membership.id, Membership.end_date, Membership.billing_cycle,
+                Membership.auto_renew, Membership.payment_status
+            )
+            .where(Membership.is_active == True, Membership.end_date <= as_of, Membership.id > after_id)
+            .order_by(Membership.id)
+            .limit(limit)
+        ).all()
+    
+    @staticmethod
+    def plan_lapsed(rows, as_of):
+        """Split lapsed rows into renewals [(row, new end date)] and expiries [(row, reason)].
+        
+        Like renew_membership, a renewal adds one billing cycle; memberships that
+        would still be lapsed after it (more than a cycle overdue) expire instead
+        of being back-billed.
+        """
+        renewals, expiries = [], []
+        for row in rows:
+            end_date = row.end_date + Membership.billing_period(row.billing_cycle)
+            if not row.auto_renew:
+                expiries.append((row, 'not_auto_renew'))
+            elif row.payment_status != 'active':
+                expiries.append((row, 'payment_status'))
+            elif end_date <= as_of:
+                expiries.append((row, 'overdue'))
+            else:
+                renewals.append((row, end_date))
+        return renewals, expiries
+    
+    @staticmethod
+    def apply_lapsed(renewals, expiries, as_of):
+        """Write a planned batch: one executemany for renewals, one UPDATE for expiries.
+        
+        Rows changed since they were read are left alone. Runs in the caller's
+        transaction.
+        """
+        table = Membership.__table__
+        now = datetime.utcnow()
+        if renewals:
+            db.session.execute(
+                db.update(table)
+                .where(
+                    table.c.id == db.bindparam('membership'),
+                    table.c.end_date == db.bindparam('lapsed_end'),
+                    table.c.is_active == True
+                )
+                .values(
+                    end_date=db.bindparam('renewed_end'),
+                    next_payment_date=db.bindparam('renewed_end'),
+                    last_payment_date=now,
+                    payment_status='active',
+                    updated_at=now
+                ),
+                [{'membership': row.id, 'lapsed_end': row.end_date, 'renewed_end': end_date}
+                 for row, end_date in renewals]
+            )
+        if expiries:
+            db.session.execute(
+                db.update(table)
+                .where(
+                    table.c.id.in_([row.id for row, _ in expiries]),
+                    table.c.is_active == True,
+                    table.c.end_date <= as_of
+                )
+                .values(is_active=False, payment_status='expired', updated_at=now)
+            )
+    
     def apply_discount(self, amount):
         """Apply membership discount to amount"""
         if self.tier and self.is_active and not self.is_expired():
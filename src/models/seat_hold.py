@@ -0,0 +1,172 @@
+from flask_sqlalchemy import SQLAlchemy
+from datetime import datetime, timedelta
+import uuid
+from .user import db
+from src.utils.serializers import serializer_for
+from .event import Event
+
+class SeatHold(db.Model):
+    __tablename__ = 'seat_holds'
+    __table_args__ = (
+        db.Index('ix_seat_holds_status_expires', 'status', 'expires_at'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True)
+    hold_id = db.Column(db.String(36), unique=True, nullable=False)
+    event_id = db.Column(db.Integer, db.ForeignKey('events.id'), nullable=False)
+    seats = db.Column(db.Integer, nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='active')  # active, consumed, released, expired
+    expires_at = db.Column(db.DateTime, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    SERIALIZE_EXCLUDE = ('id', 'created_at')
+    
+    def to_dict(self):
+        return serializer_for(SeatHold)(self)
+    
+    @staticmethod
+    def _reserve(event_id, seats):
+        """Atomically move seats into the event's held counter if capacity allows"""
+        result = db.session.execute(
+            db.update(Event)
+            .where(
+                Event.id == event_id,
+                Event.is_active == True,
+                Event.confirmed_seats + Event.held_seats + seats <= Event.max_guests
+            )
+            .values(held_seats=Event.held_seats + seats)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+    
+    @staticmethod
+    def place(event_id, seats, ttl_minutes=15):
+        """Reserve seats on an event for ttl_minutes.
+        
+        Returns the new hold, or None when the event cannot seat the party. Lapsed
+        holds on the event are released and the reservation retried once before
+        giving up.
+        """
+        if seats < 1:
+            raise ValueError('A seat hold needs at least one seat')
+        if not SeatHold._reserve(event_id, seats):
+            if not SeatHold.release_expired(event_id=event_id):
+                return None
+            if not SeatHold._reserve(event_id, seats):
+                return None
+        
+        hold = SeatHold(
+            hold_id=uuid.uuid4().hex,
+            event_id=event_id,
+            seats=seats,
+            status='active',
+            expires_at=datetime.utcnow() + timedelta(minutes=ttl_minutes)
+        )
+        db.session.add(hold)
+        return hold
+    
+    @staticmethod
+    def _close(hold_id, status, event_id=None, seats=None):
+        """Atomically close an active hold; returns its (event_id, seats) or None if it was not active"""
+        hold = db.session.execute(
+            db.select(SeatHold.event_id, SeatHold.seats).where(SeatHold.hold_id == hold_id)
+        ).first()
+        if hold is None:
+            return None
+        if (event_id is not None and hold.event_id != event_id) or (seats is not None and hold.seats != seats):
+            return None
+        
+        result = db.session.execute(
+            db.update(SeatHold)
+            .where(SeatHold.hold_id == hold_id, SeatHold.status == 'active')
+            .values(status=status)
+            .execution_options(synchronize_session=False)
+        )
+        return hold if result.rowcount == 1 else None
+    
+    @staticmethod
+    def consume(hold_id, event_id, seats):
+        """Turn an active hold into confirmed seats; returns False if the hold is unusable.
+        
+        A lapsed hold that has not been released yet still owns its seats, so it
+        can be consumed until release_expired reclaims it.
+        """
+        hold = SeatHold._close(hold_id, 'consumed', event_id=event_id, seats=seats)
+        if hold is None:
+            return False
+        
+        db.session.execute(
+            db.update(Event)
+            .where(Event.id == event_id)
+            .values(
+                held_seats=Event.held_seats - seats,
+                confirmed_seats=Event.confirmed_seats + seats
+            )
+        )
+        return True
+    
+    @staticmethod
+    def release(hold_id):
+        """Give an active hold's seats back to the event"""
+        hold = SeatHold._close(hold_id, 'released')
+        if hold is not None:
+            Event.adjust_held_seats(hold.event_id, -hold.seats)
+        return hold is not None
+    
+    @staticmethod
+    def release_expired(limit=500, event_id=None):
+        """Expire up to limit lapsed holds in one set-based pass.
+        
+        Returns the number of holds released. Runs in the caller's transaction.
+        """
+        query = db.select(SeatHold.id).where(
+            SeatHold.status == 'active',
+            SeatHold.expires_at <= datetime.utcnow()
+        )
+        if event_id is not None:
+            query = query.where(SeatHold.event_id == event_id)
+        ids = db.session.execute(query.order_by(SeatHold.expires_at).limit(limit)).scalars().all()
+        if not ids:
+            return 0
+        return SeatHold._close_many(SeatHold.id.in_(ids), 'expired')
+    
+    @staticmethod
+    def release_many(hold_ids):
+        """Give the seats of any still-active holds among hold_ids back to their events in one pass"""
+        if not hold_ids:
+            return 0
+        return SeatHold._close_many(SeatHold.hold_id.in_(list(hold_ids)), 'released')
+    
+    @staticmethod
+    def _close_many(criterion, status):
+        """Close every active hold matching criterion and return their seats to the events.
+        
+        Returns the number of holds closed. Runs in the caller's transaction.
+        """
+        close = (
+            db.update(SeatHold)
+            .where(criterion, SeatHold.status == 'active')
+            .values(status=status)
+            .execution_options(synchronize_session=False)
+        )
+        if db.engine.dialect.update_returning:
+            released = db.session.execute(close.returning(SeatHold.event_id, SeatHold.seats)).all()
+        else:
+            # No RETURNING: the status guard still lets only one worker close each
+            # hold, but other writers could race between the read and the update
+            released = db.session.execute(
+                db.select(SeatHold.event_id, SeatHold.seats).where(criterion, SeatHold.status == 'active')
+            ).all()
+            db.session.execute(close)
+        
+        seats_by_event = {}
+        for row in released:
+            seats_by_event[row.event_id] = seats_by_event.get(row.event_id, 0) + row.seats
+        if seats_by_event:
+            db.session.execute(
+                db.update(Event.__table__)
+                .where(Event.__table__.c.id == db.bindparam('event_id'))
+                .values(held_seats=Event.__table__.c.held_seats - db.bindparam('seats')),
+                [{'event_id': key, 'seats': value} for key, value in seats_by_event.items()]
+            )
+        return len(released)
@@ -1,8 +1,13 @@
+from flask import g, has_request_context
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
 from werkzeug.security import generate_password_hash, check_password_hash
+from src.utils.serializers import serializer_for
 
-db = SQLAlchemy()
+# Objects stay usable after commit: write routes serialize what they just wrote
+# without re-SELECTing every row (ids come back via RETURNING, timestamps are set
+# client-side). Code that changes rows behind the ORM's back must refresh them.
+db = SQLAlchemy(session_options={'expire_on_commit': False})
 
 class User(db.Model):
     __tablename__ = 'users'
@@ -50,22 +55,10 @@ class User(db.Model):
             return check_password_hash(self.password_hash, password)
         return False
 
+    SERIALIZE_EXCLUDE = ('password_hash', 'verification_token', 'updated_at')
+
     def to_dict(self):
-        return {
-            'id': self.id,
-            'username': self.username,
-            'email': self.email,
-            'first_name': self.first_name,
-            'last_name': self.last_name,
-            'phone': self.phone,
-            'date_of_birth': self.date_of_birth.isoformat() if self.date_of_birth else None,
-            'preferred_language': self.preferred_language,
-            'marketing_emails': self.marketing_emails,
-            'is_active': self.is_active,
-            'is_verified': self.is_verified,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'last_login': self.last_login.isoformat() if self.last_login else None
-        }
+        return serializer_for(User)(self)
     
     @property
     def full_name(self):
@@ -74,15 +67,38 @@ class User(db.Model):
             return f"{self.first_name} {self.last_name}"
         return self.username
     
-    def get_active_membership(self):
-        """Get user's active membership"""
-        from .membership import Membership
-        return Membership.query.filter_by(
-            user_id=self.id,
-            is_active=True
-        ).filter(
-            Membership.end_date > datetime.utcnow()
+    @staticmethod
+    def load_with_membership(user_id):
+        """Load a user, their active membership and its tier in one joined query.
+        
+        Returns (user, membership); either may be None. The result is memoized
+        on flask.g, so pricing and usage updates later in the same request reuse it.
+        """
+        from .membership import Membership, MembershipTier
+        
+        memo = g.setdefault('member_context', {}) if has_request_context() else {}
+        if user_id in memo:
+            return memo[user_id]
+        
+        row = db.session.execute(
+            db.select(User, Membership)
+            .outerjoin(Membership, db.and_(
+                Membership.user_id == User.id,
+                Membership.is_active == True,
+                Membership.end_date > datetime.utcnow()
+            ))
+            .outerjoin(MembershipTier, MembershipTier.id == Membership.tier_id)
+            .options(db.contains_eager(Membership.tier))
+            .where(User.id == user_id)
+            .limit(1)
         ).first()
+        
+        memo[user_id] = (row.User, row.Membership) if row else (None, None)
+        return memo[user_id]
+    
+    def get_active_membership(self):
+        """Get user's active membership (with its tier loaded)"""
+        return User.load_with_membership(self.id)[1]
     
     def has_membership_tier(self, tier_slug):
         """Check if user has specific membership tier"""
@@ -0,0 +1,141 @@
+"""
+Query-plan regression checks for Elevate Events
+Runs EXPLAIN QUERY PLAN for the main query behind each route against a seeded,
+throwaway SQLite database and reports any query that falls back to a full
+table scan. Used by `flask check-query-plans`.
+"""
+
+import random
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from src.models import import_models
+from src.models.user import db, User
+from src.models.event import Event
+from src.models.booking import Booking
+from src.models.lounge import Lounge
+from src.models.membership import MembershipTier, Membership
+from src.models.seat_hold import SeatHold
+
+# Small catalogue tables that are expected to be read in full
+SCAN_ALLOWED_TABLES = {'lounges', 'membership_tiers'}
+
+
+def route_queries():
+    """Return (name, statement) pairs for the main query behind each route"""
+    now = datetime.utcnow()
+    slot_start = now + timedelta(days=7)
+    slot_end = slot_start + timedelta(hours=2)
+
+    return [
+        ('GET /events', Event.available_events_query().statement),
+        ('GET /events?category', Event.available_events_query('vip').statement),
+        ('GET /events/<id>', db.select(Event).where(Event.id == 1)),
+        ('DELETE /events/<id> bookings check', db.select(Booking.id).where(Booking.event_id == 1).limit(1)),
+        ('reconcile-seats', db.select(db.func.sum(Booking.guest_count)).where(
+            Booking.event_id == 1, Booking.status.in_(Booking.SEAT_HOLDING_STATUSES))),
+        ('GET /bookings/<ref>', db.select(Booking).where(Booking.booking_reference == 'EE1')),
+        ('GET /users/<id>/bookings', db.select(Booking).where(Booking.user_id == 1)
+            .order_by(Booking.created_at.desc())),
+        ('GET /availability/lounges', db.select(Lounge).where(
+            Lounge.is_active == True,
+            ~Lounge.conflicting_bookings(slot_start, slot_end).exists())),
+        ('POST /bookings lounge check', db.select(
+            Lounge.conflicting_bookings(slot_start, slot_end, lounge_id=1).exists())),
+        ('release-expired-holds', db.select(SeatHold.id).where(
+            SeatHold.status == 'active', SeatHold.expires_at <= now).order_by(SeatHold.expires_at).limit(500)),
+        ('expire-pending-bookings', db.select(Booking.id).where(
+            Booking.status == 'pending', Booking.created_at < now).order_by(Booking.created_at).limit(500)),
+        ('active membership', Membership.active_for_user_query(1).statement),
+        ('renew-memberships', db.select(Membership.id).where(
+            Membership.is_active == True, Membership.end_date <= now, Membership.id > 0)
+            .order_by(Membership.id).limit(5000)),
+        ('GET /membership-tiers', db.select(MembershipTier).where(MembershipTier.is_active == True)
+            .order_by(MembershipTier.sort_order)),
+        ('GET /membership-tiers/<slug>', db.select(MembershipTier).where(MembershipTier.slug == 'vip')),
+    ]
+
+
+def _seed(connection, rows=2000):
+    """Fill every table with enough rows for the planner to prefer indexes"""
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    categories = ['premium', 'vip', 'exclusive']
+
+    connection.execute(db.insert(User), [
+        {'id': i, 'username': f'user{i}', 'email': f'user{i}@example.com'} for i in range(1, rows + 1)
+    ])
+    connection.execute(db.insert(MembershipTier), [
+        {'id': i, 'name': slug.title(), 'slug': slug, 'monthly_price': 100.0 * i, 'sort_order': i}
+        for i, slug in enumerate(['standard', 'vip', 'premium'], start=1)
+    ])
+    connection.execute(db.insert(Lounge), [
+        {'id': i, 'name': f'Lounge {i}', 'description': '', 'category': rng.choice(categories),
+         'capacity': 20, 'hourly_rate': 100.0}
+        for i in range(1, 21)
+    ])
+    connection.execute(db.insert(Event), [
+        {'id': i, 'title': f'Event {i}', 'description': '', 'category': rng.choice(categories),
+         'price': 50.0, 'max_guests': 40, 'date': now + timedelta(days=rng.randint(-200, 200)),
+         'is_active': rng.random() < 0.9}
+        for i in range(1, rows + 1)
+    ])
+    connection.execute(db.insert(Membership), [
+        {'id': i, 'user_id': i, 'tier_id': rng.randint(1, 3), 'membership_number': f'M{i}',
+         'start_date': now - timedelta(days=60), 'end_date': now + timedelta(days=rng.randint(-30, 30)),
+         'is_active': rng.random() < 0.8}
+        for i in range(1, rows + 1)
+    ])
+
+    bookings = []
+    for i in range(1, rows * 5 + 1):
+        starts_at = now + timedelta(days=rng.randint(-100, 100), hours=rng.randint(0, 23))
+        is_event = rng.random() < 0.5
+        bookings.append({
+            'id': i, 'booking_reference': f'EE{i}', 'guest_name': 'Guest', 'guest_email': 'guest@example.com',
+            'guest_count': 2, 'event_id': rng.randint(1, rows) if is_event else None,
+            'lounge_id': None if is_event else rng.randint(1, 20), 'user_id': rng.randint(1, rows),
+            'booking_date': starts_at.replace(hour=0), 'booking_time': starts_at.strftime('%H:%M'),
+            'duration_hours': 2, 'starts_at': starts_at, 'ends_at': starts_at + timedelta(hours=2),
+            'total_amount': 100.0, 'status': rng.choice(['pending', 'confirmed', 'cancelled', 'checked_in']),
+            'created_at': starts_at - timedelta(days=rng.randint(1, 30)),
+        })
+    connection.execute(db.insert(Booking), bookings)
+    connection.exec_driver_sql('ANALYZE')
+
+
+def _explain(connection, statement):
+    """Return the EXPLAIN QUERY PLAN detail lines for a statement"""
+    compiled = statement.compile(dialect=connection.dialect, compile_kwargs={'render_postcompile': True})
+    params = compiled.construct_params()
+    positional = tuple(params[name] for name in compiled.positiontup)
+    rows = connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {compiled}', positional).all()
+    return [row[3] for row in rows]
+
+
+def _full_scans(plan):
+    """Plan lines that read a whole table that is not on the allow list"""
+    scans = []
+    for line in plan:
+        if not line.startswith('SCAN ') or line == 'SCAN CONSTANT ROW':
+            continue
+        table = line.split()[1]
+        if table not in SCAN_ALLOWED_TABLES:
+            scans.append(line)
+    return scans
+
+
+def check_query_plans():
+    """Explain every route query; return a list of (name, plan, full_scans)"""
+    engine = create_engine('sqlite://')
+    import_models()
+    db.metadata.create_all(engine)
+
+    results = []
+    with engine.begin() as connection:
+        _seed(connection)
+        for name, statement in route_queries():
+            plan = _explain(connection, statement)
+            results.append((name, plan, _full_scans(plan)))
+
+    engine.dispose()
+    return results
@@ -0,0 +1,222 @@
+import csv
+import io
+import json
+from datetime import datetime
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
+from src.models.user import db
+from src.models.event import Event
+from src.models.booking import Booking
+from src.utils.auth import require_admin
+from src.utils.cache import response_cache
+from src.utils.dates import parse_date_bound
+from src.utils.profiler import profiler
+from src.utils.serializers import serialize_rows
+
+admin_bp = Blueprint('admin', __name__)
+
+# Columns finance receives, in export order
+BOOKING_EXPORT_FIELDS = (
+    'id', 'booking_reference', 'user_id', 'event_id', 'lounge_id', 'guest_name', 'guest_email',
+    'guest_count', 'booking_date', 'booking_time', 'duration_hours', 'starts_at', 'ends_at',
+    'total_amount', 'payment_status', 'payment_method', 'payment_reference', 'status',
+    'check_in_time', 'created_at', 'updated_at'
+)
+EXPORT_FORMATS = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv'}
+EXPORT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+
+def _export_query(args):
+    """Column select for the export filters; raises ValueError on bad input"""
+    query = db.select(*(getattr(Booking, field) for field in BOOKING_EXPORT_FIELDS))
+    created_from = parse_date_bound(args.get('from'))
+    created_to = parse_date_bound(args.get('to'), end=True)
+    if created_from:
+        query = query.where(Booking.created_at >= created_from)
+    if created_to:
+        query = query.where(Booking.created_at < created_to)
+    for field in ('status', 'payment_status'):
+        if args.get(field):
+            query = query.where(getattr(Booking, field).in_(args[field].split(',')))
+    return query.order_by(Booking.id)
+
+def _export_batches(query, batch_size):
+    """Yield lists of serialized bookings, one server-side cursor partition at a time"""
+    result = db.session.execute(query.execution_options(yield_per=batch_size))
+    for rows in result.partitions():
+        yield serialize_rows(Booking, rows)
+
+def _ndjson(batches):
+    dumps = current_app.json.dumps
+    for batch in batches:
+        yield ''.join(f'{dumps(row)}\n' for row in batch)
+
+def _csv(batches):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=BOOKING_EXPORT_FIELDS)
+    writer.writeheader()
+    for batch in batches:
+        writer.writerows(batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+@admin_bp.route('/admin/bookings/export', methods=['GET'])
+@require_admin
+def export_bookings():
+    """Stream bookings as NDJSON or CSV, filtered by creation date range, status and payment status"""
+    try:
+        export_format = request.args.get('format', 'ndjson')
+        if export_format not in EXPORT_FORMATS:
+            return jsonify({
+                'success': False,
+                'error': f"Unsupported format: {export_format}"
+            }), 400
+        
+        try:
+            query = _export_query(request.args)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        batches = _export_batches(query, EXPORT_BATCH_SIZE)
+        body = _ndjson(batches) if export_format == 'ndjson' else _csv(batches)
+        filename = f"bookings-{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}.{export_format}"
+        
+        # The app context (and its session) stays open until the last chunk is sent
+        return Response(
+            stream_with_context(body),
+            mimetype=EXPORT_FORMATS[export_format],
+            headers={'Content-Disposition': f'attachment; filename={filename}'}
+        )
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+def _import_records(stream, import_format):
+    """Yield (line number, raw row) pairs from an NDJSON or CSV upload without reading it all"""
+    text = io.TextIOWrapper(io.BufferedReader(stream), encoding='utf-8', newline='' if import_format == 'csv' else None)
+    if import_format == 'csv':
+        reader = csv.DictReader(text)
+        for record in reader:
+            yield reader.line_num, record
+        return
+    for line_number, line in enumerate(text, 1):
+        if line.strip():
+            yield line_number, line
+
+@admin_bp.route('/admin/events/import', methods=['POST'])
+@require_admin
+def import_events():
+    """Bulk import events from NDJSON or CSV in one transaction, reporting errors per row"""
+    try:
+        import_format = request.args.get('format') or ('csv' if request.mimetype == 'text/csv' else 'ndjson')
+        if import_format not in EXPORT_FORMATS:
+            return jsonify({
+                'success': False,
+                'error': f"Unsupported format: {import_format}"
+            }), 400
+        dry_run = request.args.get('dry_run', '').lower() in ('1', 'true', 'yes')
+        
+        errors = []
+        error_count = 0
+        
+        def valid_rows():
+            # Validation keeps going after the first error so the report is complete,
+            # but nothing more is handed to the insert once the import is doomed
+            nonlocal error_count
+            for line_number, raw in _import_records(request.stream, import_format):
+                try:
+                    values = Event.import_values(json.loads(raw) if import_format == 'ndjson' else raw)
+                except (ValueError, TypeError) as e:
+                    error_count += 1
+                    if len(errors) < MAX_REPORTED_ERRORS:
+                        errors.append({'line': line_number, 'error': str(e)})
+                    continue
+                if not error_count:
+                    yield values
+        
+        if dry_run:
+            count = sum(1 for _ in valid_rows())
+        else:
+            count = Event.bulk_insert(valid_rows())
+        
+        if error_count:
+            db.session.rollback()
+            return jsonify({
+                'success': False,
+                'error': f'{error_count} invalid rows; nothing was imported',
+                'error_count': error_count,
+                'errors': errors
+            }), 422
+        
+        if not dry_run:
+            db.session.commit()
+            response_cache.bump('events')
+        
+        return jsonify({
+            'success': True,
+            'dry_run': dry_run,
+            'imported': 0 if dry_run else count,
+            'valid_rows': count,
+            'error_count': 0,
+            'errors': []
+        }), 200 if dry_run else 201
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@admin_bp.route('/admin/profiles', methods=['GET'])
+@require_admin
+def list_profiles():
+    """Captured slow-request profiles, newest first, without SQL and frame detail"""
+    try:
+        summaries = [
+            {key: value for key, value in record.items() if key not in ('sql', 'hot_frames')}
+            for record in profiler.profiles()
+        ]
+        return jsonify({
+            'success': True,
+            'sample_rate': profiler.sample_rate,
+            'slow_ms': profiler.slow_ms,
+            'profiles': summaries
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@admin_bp.route('/admin/profiles/<int:profile_id>', methods=['GET'])
+@require_admin
+def get_profile(profile_id):
+    """One captured profile with its SQL statements and hottest frames"""
+    try:
+        record = profiler.get(profile_id)
+        if not record:
+            return jsonify({
+                'success': False,
+                'error': 'Profile not found'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'profile': record
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
@@ -1,14 +1,32 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
+from collections import Counter
 from datetime import datetime, timedelta
 from src.models.user import db, User
 from src.models.booking import Booking
 from src.models.event import Event
 from src.models.lounge import Lounge
 from src.models.membership import Membership
+from src.models.seat_hold import SeatHold
+from src.utils.dates import parse_timestamp
+from src.utils.idempotency import idempotent
+from src.utils.pagination import encode_cursor, decode_cursor, page_size
+from src.utils.cache import response_cache
+from src.utils import qr_tokens
 
 bookings_bp = Blueprint('bookings', __name__)
 
+# Related objects that GET /users/<id>/bookings can embed via ?include=
+USER_BOOKING_INCLUDES = {'event', 'lounge'}
+
+# Scans accepted per offline sync request, how far ahead of the server clock a device may be,
+# and how old an offline scan may be: tokens are judged at scanned_at, so a backdated scan
+# could otherwise replay a token that has since expired
+MAX_CHECKIN_BATCH = 500
+SCAN_CLOCK_SKEW = timedelta(minutes=5)
+MAX_OFFLINE_AGE = timedelta(hours=12)
+
 @bookings_bp.route('/bookings', methods=['POST'])
+@idempotent
 def create_booking():
     """Create a new booking"""
     try:
@@ -23,8 +41,21 @@ def create_booking():
                     'error': f'Missing required field: {field}'
                 }), 400
         
-        # Parse booking date
-        booking_date = datetime.strptime(data['booking_date'], '%Y-%m-%d').date()
+        # Parse booking date and time
+        try:
+            booking_date = datetime.strptime(data['booking_date'], '%Y-%m-%d').date()
+        except (TypeError, ValueError):
+            return jsonify({
+                'success': False,
+                'error': 'booking_date must be a date in YYYY-MM-DD format'
+            }), 400
+        try:
+            datetime.strptime(data['booking_time'], '%H:%M')
+        except (TypeError, ValueError):
+            return jsonify({
+                'success': False,
+                'error': 'booking_time must be a time in HH:MM format'
+            }), 400
         
         # Validate booking is in the future
         if booking_date <= datetime.now().date():
@@ -33,23 +64,57 @@ def create_booking():
                 'error': 'Booking date must be in the future'
             }), 400
         
+        # Parse guest count once; a zero or negative party would release seats from the ledger
+        guest_count = data['guest_count']
+        if isinstance(guest_count, str) and guest_count.strip().isdigit():
+            guest_count = int(guest_count)
+        if isinstance(guest_count, bool) or not isinstance(guest_count, int) or guest_count < 1:
+            return jsonify({
+                'success': False,
+                'error': 'guest_count must be a positive whole number'
+            }), 400
+        
+        try:
+            duration_hours = int(data.get('duration_hours', 2))
+        except (TypeError, ValueError):
+            duration_hours = None
+        if duration_hours is None or not 0 < duration_hours <= Booking.MAX_DURATION_HOURS:
+            return jsonify({
+                'success': False,
+                'error': f'Duration must be a whole number between 1 and {Booking.MAX_DURATION_HOURS} hours'
+            }), 400
+        
         # Calculate total amount
         total_amount = 0
         event = None
         lounge = None
+        hold = None
         
         if 'event_id' in data and data['event_id']:
             event = Event.query.get(data['event_id'])
-            if not event or not event.is_available(data['guest_count']):
+            if event and guest_count > event.max_guests:
+                return jsonify({
+                    'success': False,
+                    'error': f'guest_count exceeds the event capacity of {event.max_guests}'
+                }), 400
+            
+            # Reserve the seats atomically so concurrent checkouts cannot oversell
+            if event and event.date > datetime.utcnow():
+                hold = SeatHold.place(event.id, guest_count, current_app.config['SEAT_HOLD_TTL_MINUTES'])
+            if not hold:
                 return jsonify({
                     'success': False,
                     'error': 'Event not available for requested guest count'
                 }), 400
-            total_amount = event.price * data['guest_count']
+            total_amount = event.price * guest_count
         
         elif 'lounge_id' in data and data['lounge_id']:
             lounge = Lounge.query.get(data['lounge_id'])
-            duration_hours = data.get('duration_hours', 2)
+            if lounge and guest_count > lounge.capacity:
+                return jsonify({
+                    'success': False,
+                    'error': f'guest_count exceeds the lounge capacity of {lounge.capacity}'
+                }), 400
             
             if not lounge or not lounge.is_available(booking_date, data['booking_time'], duration_hours):
                 return jsonify({
@@ -66,36 +131,37 @@ def create_booking():
             }), 400
         
         # Apply membership discount if user is logged in
-        user = None
         if 'user_id' in data and data['user_id']:
-            user = User.query.get(data['user_id'])
-            if user:
-                membership = user.get_active_membership()
-                if membership:
-                    total_amount = membership.apply_discount(total_amount)
+            user, membership = User.load_with_membership(data['user_id'])
+            if membership:
+                total_amount = membership.apply_discount(total_amount)
         
         # Create booking
         booking = Booking(
             guest_name=data['guest_name'],
             guest_email=data['guest_email'],
             guest_phone=data.get('guest_phone'),
-            guest_count=data['guest_count'],
+            guest_count=guest_count,
             special_requests=data.get('special_requests'),
             event_id=data.get('event_id'),
             lounge_id=data.get('lounge_id'),
             booking_date=booking_date,
             booking_time=data['booking_time'],
-            duration_hours=data.get('duration_hours', 2),
+            duration_hours=duration_hours,
             total_amount=total_amount,
-            user_id=data.get('user_id')
+            user_id=data.get('user_id'),
+            hold_id=hold.hold_id if hold else None
         )
         
         db.session.add(booking)
         db.session.commit()
+        if hold:
+            response_cache.bump('events')
         
         return jsonify({
             'success': True,
             'booking': booking.to_dict(),
+            'hold': hold.to_dict() if hold else None,
             'message': 'Booking created successfully'
         }), 201
         
@@ -138,6 +204,7 @@ def get_booking(booking_reference):
         }), 500
 
 @bookings_bp.route('/bookings/<booking_reference>/confirm', methods=['POST'])
+@idempotent
 def confirm_booking(booking_reference):
     """Confirm a booking and generate QR code"""
     try:
@@ -161,18 +228,23 @@ def confirm_booking(booking_reference):
         booking.payment_method = data.get('payment_method', 'stripe')
         booking.payment_reference = data.get('payment_reference')
         
-        # Confirm booking and generate QR code
-        booking.confirm_booking()
+        # Confirm booking and generate QR code, converting its own seat hold if it is still live
+        # (a hold_id in the request body is ignored; holds are bound to the booking at creation)
+        if not booking.confirm_booking():
+            db.session.rollback()
+            return jsonify({
+                'success': False,
+                'error': 'Seat hold expired and the event no longer has capacity for this booking'
+            }), 409
         
         # Update membership usage if applicable
-        if booking.user:
-            membership = booking.user.get_active_membership()
+        if booking.user_id:
+            user, membership = User.load_with_membership(booking.user_id)
             if membership:
-                membership.total_bookings += 1
-                membership.total_spent += booking.total_amount
-                membership.updated_at = datetime.utcnow()
+                membership.record_booking(booking.total_amount)
         
         db.session.commit()
+        response_cache.bump(booking.cache_family())
         
         return jsonify({
             'success': True,
@@ -212,15 +284,17 @@ def checkin_booking(booking_reference):
                 'check_in_time': booking.check_in_time.isoformat()
             }), 400
         
-        # Check in the guest
-        booking.check_in()
+        # Check in the guest; the conditional update loses to a concurrent scan
+        if not Booking.check_in_reference(booking_reference):
+            db.session.rollback()
+            return jsonify({
+                'success': False,
+                'error': 'Guest already checked in'
+            }), 400
         
         # Update membership usage
-        if booking.user:
-            membership = booking.user.get_active_membership()
-            if membership:
-                membership.events_attended += 1
-                membership.updated_at = datetime.utcnow()
+        if booking.user_id:
+            Membership.add_attendance({booking.user_id: 1})
         
         db.session.commit()
         
@@ -237,6 +311,146 @@ def checkin_booking(booking_reference):
             'error': str(e)
         }), 500
 
+@bookings_bp.route('/bookings/checkin/scan', methods=['POST'])
+def scan_checkin():
+    """Check in a guest from a signed QR token: verified in memory, then one conditional update"""
+    try:
+        data = request.get_json(silent=True) or {}
+        try:
+            booking_reference = qr_tokens.verify(data.get('token'))
+        except qr_tokens.InvalidQRToken as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        checked_in_at = datetime.utcnow()
+        booking = Booking.check_in_reference(booking_reference, checked_in_at)
+        if not booking:
+            db.session.rollback()
+            # Slow path only: explain why the guest was not admitted
+            current = db.session.execute(
+                db.select(Booking.status, Booking.check_in_time)
+                .where(Booking.booking_reference == booking_reference)
+            ).first()
+            if not current:
+                return jsonify({
+                    'success': False,
+                    'error': 'Booking not found'
+                }), 404
+            if current.check_in_time:
+                return jsonify({
+                    'success': False,
+                    'error': 'Guest already checked in',
+                    'check_in_time': current.check_in_time.isoformat()
+                }), 409
+            return jsonify({
+                'success': False,
+                'error': f'Booking is {current.status}, not confirmed'
+            }), 400
+        
+        if booking.user_id:
+            Membership.add_attendance({booking.user_id: 1})
+        
+        db.session.commit()
+        
+        return jsonify({
+            'success': True,
+            'booking_reference': booking_reference,
+            'guest_name': booking.guest_name,
+            'guest_count': booking.guest_count,
+            'check_in_time': checked_in_at.isoformat(),
+            'message': 'Guest checked in successfully'
+        }), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@bookings_bp.route('/bookings/checkin/batch', methods=['POST'])
+def batch_checkin():
+    """Apply a door scanner's queue of offline scans in one transaction, reporting each scan's outcome"""
+    try:
+        data = request.get_json(silent=True) or {}
+        scans = data.get('scans')
+        if not isinstance(scans, list) or not scans:
+            return jsonify({
+                'success': False,
+                'error': 'scans must be a non-empty list'
+            }), 400
+        if len(scans) > MAX_CHECKIN_BATCH:
+            return jsonify({
+                'success': False,
+                'error': f'At most {MAX_CHECKIN_BATCH} scans per batch'
+            }), 400
+        
+        now = datetime.utcnow()
+        results = [None] * len(scans)
+        first_scan = {}  # booking reference -> index of its earliest scan in this batch
+        for index, scan in enumerate(scans):
+            try:
+                if not isinstance(scan, dict):
+                    raise ValueError('Each scan must be an object with a token')
+                scanned_at = parse_timestamp(scan['scanned_at']) if scan.get('scanned_at') else now
+                if scanned_at > now + SCAN_CLOCK_SKEW:
+                    raise ValueError('scanned_at is in the future')
+                if scanned_at < now - MAX_OFFLINE_AGE:
+                    raise ValueError(f'scanned_at is more than {MAX_OFFLINE_AGE.total_seconds() / 3600:g} hours old')
+                # Offline scans are judged by the token's validity when they were made
+                reference = qr_tokens.verify(scan.get('token'), at=scanned_at)
+            except (TypeError, ValueError) as e:
+                results[index] = {'index': index, 'result': 'invalid', 'error': str(e)}
+                continue
+            results[index] = {'index': index, 'booking_reference': reference, 'scanned_at': scanned_at}
+            earliest = first_scan.get(reference)
+            if earliest is None or scanned_at < results[earliest]['scanned_at']:
+                first_scan[reference] = index
+        
+        outcomes = Booking.check_in_batch({
+            reference: results[index]['scanned_at'] for reference, index in first_scan.items()
+        }) if first_scan else {}
+        
+        attended = Counter()
+        for result in results:
+            reference = result.get('booking_reference')
+            if reference is None:
+                continue
+            outcome, booking = outcomes[reference]
+            if first_scan[reference] != result['index']:
+                # Repeat scans of a guest within the batch never count twice
+                outcome = 'duplicate' if outcome in ('accepted', 'duplicate') else outcome
+            elif outcome == 'accepted' and booking.user_id:
+                attended[booking.user_id] += 1
+            result['result'] = outcome
+            result['scanned_at'] = result['scanned_at'].isoformat()
+            if outcome == 'conflict':
+                result['error'] = f'Booking is {booking.status}, not confirmed'
+            elif outcome == 'not_found':
+                result['error'] = 'Booking not found'
+            elif booking is not None:
+                result['guest_count'] = booking.guest_count
+                if outcome == 'duplicate' and booking.check_in_time:
+                    result['check_in_time'] = booking.check_in_time.isoformat()
+        
+        Membership.add_attendance(attended)
+        db.session.commit()
+        
+        return jsonify({
+            'success': True,
+            'summary': dict(Counter(result['result'] for result in results)),
+            'results': results
+        }), 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @bookings_bp.route('/bookings/<booking_reference>/cancel', methods=['POST'])
 def cancel_booking(booking_reference):
     """Cancel a booking"""
@@ -249,24 +463,24 @@ def cancel_booking(booking_reference):
                 'error': 'Booking not found'
             }), 404
         
-        if booking.status in ['cancelled', 'completed']:
+        if booking.status in ['cancelled', 'expired', 'completed']:
             return jsonify({
                 'success': False,
                 'error': 'Booking cannot be cancelled'
             }), 400
         
-        # Check cancellation policy (24 hours before booking)
-        booking_datetime = datetime.combine(booking.booking_date, datetime.strptime(booking.booking_time, '%H:%M').time())
-        if datetime.now() > booking_datetime - timedelta(hours=24):
+        # Check cancellation policy (24 hours before booking); legacy rows with an
+        # unparseable booking_time have no slot, so fall back to the start of the day
+        if datetime.now() > (booking.starts_at or booking.booking_date) - timedelta(hours=24):
             return jsonify({
                 'success': False,
                 'error': 'Cancellation must be made at least 24 hours before booking time'
             }), 400
         
-        booking.status = 'cancelled'
-        booking.updated_at = datetime.utcnow()
+        booking.cancel()
         
         db.session.commit()
+        response_cache.bump(booking.cache_family())
         
         return jsonify({
             'success': True,
@@ -283,25 +497,69 @@ def cancel_booking(booking_reference):
 
 @bookings_bp.route('/users/<int:user_id>/bookings', methods=['GET'])
 def get_user_bookings(user_id):
-    """Get all bookings for a specific user"""
+    """Get a page of bookings for a specific user, newest first"""
     try:
         user = User.query.get_or_404(user_id)
         
-        bookings = Booking.query.filter_by(user_id=user_id).order_by(Booking.created_at.desc()).all()
+        try:
+            limit = page_size(request.args.get('limit'))
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        include = set(filter(None, request.args.get('include', 'event,lounge').split(',')))
+        unknown = include - USER_BOOKING_INCLUDES
+        if unknown:
+            return jsonify({
+                'success': False,
+                'error': f"Unknown include: {', '.join(sorted(unknown))}"
+            }), 400
+        
+        query = Booking.query.filter_by(user_id=user_id)
+        if 'event' in include:
+            query = query.options(db.joinedload(Booking.event))
+        if 'lounge' in include:
+            query = query.options(db.joinedload(Booking.lounge))
+        
+        cursor = request.args.get('cursor')
+        if cursor:
+            try:
+                created_at, booking_id = decode_cursor(cursor, datetime, int)
+            except ValueError as e:
+                return jsonify({
+                    'success': False,
+                    'error': str(e)
+                }), 400
+            query = query.filter(db.or_(
+                Booking.created_at < created_at,
+                db.and_(Booking.created_at == created_at, Booking.id < booking_id)
+            ))
+        
+        # Fetch one extra row to learn whether another page follows
+        bookings = query.order_by(Booking.created_at.desc(), Booking.id.desc()).limit(limit + 1).all()
+        has_more = len(bookings) > limit
+        bookings = bookings[:limit]
         
         bookings_data = []
         for booking in bookings:
             booking_dict = booking.to_dict()
-            if booking.event:
+            if 'event' in include and booking.event:
                 booking_dict['event'] = booking.event.to_dict()
-            if booking.lounge:
+            if 'lounge' in include and booking.lounge:
                 booking_dict['lounge'] = booking.lounge.to_dict()
             bookings_data.append(booking_dict)
         
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_cursor(bookings[-1].created_at, bookings[-1].id)
+        
         return jsonify({
             'success': True,
             'bookings': bookings_data,
-            'total': len(bookings_data)
+            'total': len(bookings_data),
+            'next_cursor': next_cursor
         }), 200
         
     except Exception as e:
@@ -311,6 +569,7 @@ def get_user_bookings(user_id):
         }), 500
 
 @bookings_bp.route('/availability/lounges', methods=['GET'])
+@response_cache.cached('lounges')
 def check_lounge_availability():
     """Check lounge availability for specific date and time"""
     try:
@@ -327,14 +586,13 @@ def check_lounge_availability():
         
         booking_date = datetime.strptime(date_str, '%Y-%m-%d').date()
         
-        lounges = Lounge.get_available_lounges(category)
+        lounges = Lounge.find_available_lounges(booking_date, time_str, duration, category)
         available_lounges = []
         
         for lounge in lounges:
-            if lounge.is_available(booking_date, time_str, duration):
-                lounge_dict = lounge.to_dict()
-                lounge_dict['total_cost'] = lounge.calculate_total_cost(duration)
-                available_lounges.append(lounge_dict)
+            lounge_dict = lounge.to_dict()
+            lounge_dict['total_cost'] = lounge.calculate_total_cost(duration)
+            available_lounges.append(lounge_dict)
         
         return jsonify({
             'success': True,
@@ -2,26 +2,61 @@ from flask import Blueprint, request, jsonify
 from datetime import datetime
 from src.models.user import db
 from src.models.event import Event
+from src.utils.pagination import encode_cursor, decode_cursor, page_size
+from src.utils.cache import response_cache
+from src.utils.dates import parse_date_bound
 
 events_bp = Blueprint('events', __name__)
 
+EVENTS_PAGE_SIZE = 50
+
 @events_bp.route('/events', methods=['GET'])
+@response_cache.cached('events')
 def get_events():
-    """Get all available events with optional category filtering"""
+    """Get a page of available events with optional category, date-range and field filtering"""
     try:
         category = request.args.get('category', 'all')
-        events = Event.get_available_events(category)
         
-        events_data = []
-        for event in events:
-            event_dict = event.to_dict()
-            event_dict['available_spots'] = event.get_available_spots()
-            events_data.append(event_dict)
+        try:
+            limit = page_size(request.args.get('limit'), default=EVENTS_PAGE_SIZE)
+            date_from = parse_date_bound(request.args.get('from'))
+            date_to = parse_date_bound(request.args.get('to'), end=True)
+            cursor = request.args.get('cursor')
+            after = decode_cursor(cursor, datetime, int) if cursor else None
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        fields = None
+        if request.args.get('fields'):
+            requested = set(request.args['fields'].split(','))
+            unknown = requested - set(Event.LISTING_FIELDS)
+            if unknown:
+                return jsonify({
+                    'success': False,
+                    'error': f"Unknown fields: {', '.join(sorted(unknown))}"
+                }), 400
+            # Canonical order, without duplicates, so equivalent requests share one serializer
+            fields = [field for field in Event.LISTING_FIELDS if field in requested]
+        
+        # Fetch one extra row to learn whether another page follows
+        events = Event.get_available_events(category, date_from, date_to, after=after, limit=limit + 1, fields=fields)
+        has_more = len(events) > limit
+        events = events[:limit]
+        
+        events_data = [event.to_dict(fields or Event.LISTING_FIELDS) for event in events]
+        
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_cursor(events[-1].date, events[-1].id)
         
         return jsonify({
             'success': True,
             'events': events_data,
-            'total': len(events_data)
+            'total': len(events_data),
+            'next_cursor': next_cursor
         }), 200
         
     except Exception as e:
@@ -31,6 +66,7 @@ def get_events():
         }), 500
 
 @events_bp.route('/events/<int:event_id>', methods=['GET'])
+@response_cache.cached('events')
 def get_event(event_id):
     """Get specific event details"""
     try:
@@ -42,12 +78,9 @@ def get_event(event_id):
                 'error': 'Event not found or inactive'
             }), 404
         
-        event_dict = event.to_dict()
-        event_dict['available_spots'] = event.get_available_spots()
-        
         return jsonify({
             'success': True,
-            'event': event_dict
+            'event': event.to_dict(Event.LISTING_FIELDS)
         }), 200
         
     except Exception as e:
@@ -57,6 +90,7 @@ def get_event(event_id):
         }), 500
 
 @events_bp.route('/events/<int:event_id>/availability', methods=['GET'])
+@response_cache.cached('events')
 def check_event_availability(event_id):
     """Check event availability for specific guest count"""
     try:
@@ -114,6 +148,7 @@ def create_event():
         
         db.session.add(event)
         db.session.commit()
+        response_cache.bump('events')
         
         return jsonify({
             'success': True,
@@ -161,6 +196,7 @@ def update_event(event_id):
         
         event.updated_at = datetime.utcnow()
         db.session.commit()
+        response_cache.bump('events')
         
         return jsonify({
             'success': True,
@@ -182,7 +218,7 @@ def delete_event(event_id):
         event = Event.query.get_or_404(event_id)
         
         # Check if event has bookings
-        if event.bookings:
+        if Event.has_bookings(event.id):
             return jsonify({
                 'success': False,
                 'error': 'Cannot delete event with existing bookings'
@@ -190,6 +226,7 @@ def delete_event(event_id):
         
         db.session.delete(event)
         db.session.commit()
+        response_cache.bump('events')
         
         return jsonify({
             'success': True,
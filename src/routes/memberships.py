@@ -1,23 +1,30 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, current_app
 from datetime import datetime
 from src.models.user import db, User
 from src.models.membership import MembershipTier, Membership
+from src.utils.cache import response_cache
 
 memberships_bp = Blueprint('memberships', __name__)
 
+def _tier_catalogue():
+    tiers = MembershipTier.query.filter_by(is_active=True).order_by(MembershipTier.sort_order).all()
+    tiers_data = [tier.to_dict() for tier in tiers]
+    return {
+        'success': True,
+        'tiers': tiers_data,
+        'total': len(tiers_data)
+    }
+
 @memberships_bp.route('/membership-tiers', methods=['GET'])
 def get_membership_tiers():
     """Get all available membership tiers"""
     try:
-        tiers = MembershipTier.query.filter_by(is_active=True).order_by(MembershipTier.sort_order).all()
-        
-        tiers_data = [tier.to_dict() for tier in tiers]
-        
-        return jsonify({
-            'success': True,
-            'tiers': tiers_data,
-            'total': len(tiers_data)
-        }), 200
+        # Tiers change rarely (seeding, not the API), so the encoded catalogue and its ETag are
+        # reused up to the cache TTL; this stands in for response_cache on this route
+        return current_app.json.encoded_response(
+            'membership_tiers', response_cache.version('membership_tiers'), _tier_catalogue,
+            max_age=current_app.config['RESPONSE_CACHE_TTL']
+        )
         
     except Exception as e:
         return jsonify({
@@ -26,6 +33,7 @@ def get_membership_tiers():
         }), 500
 
 @memberships_bp.route('/membership-tiers/<tier_slug>', methods=['GET'])
+@response_cache.cached('membership_tiers')
 def get_membership_tier(tier_slug):
     """Get specific membership tier details"""
     try:
@@ -63,8 +71,8 @@ def create_membership():
                     'error': f'Missing required field: {field}'
                 }), 400
         
-        # Validate user exists
-        user = User.query.get(data['user_id'])
+        # Validate user exists (and load any active membership in the same query)
+        user, existing_membership = User.load_with_membership(data['user_id'])
         if not user:
             return jsonify({
                 'success': False,
@@ -80,7 +88,6 @@ def create_membership():
             }), 404
         
         # Check if user already has an active membership
-        existing_membership = user.get_active_membership()
         if existing_membership:
             return jsonify({
                 'success': False,
@@ -94,6 +101,7 @@ def create_membership():
             billing_cycle=data['billing_cycle'],
             payment_method=data.get('payment_method')
         )
+        membership.tier = tier
         
         db.session.add(membership)
         db.session.commit()
@@ -115,8 +123,12 @@ def create_membership():
 def get_user_membership(user_id):
     """Get user's current membership"""
     try:
-        user = User.query.get_or_404(user_id)
-        membership = user.get_active_membership()
+        user, membership = User.load_with_membership(user_id)
+        if not user:
+            return jsonify({
+                'success': False,
+                'error': 'User not found'
+            }), 404
         
         if not membership:
             return jsonify({
@@ -140,7 +152,7 @@ def get_user_membership(user_id):
 def renew_membership(membership_id):
     """Renew a membership"""
     try:
-        membership = Membership.query.get_or_404(membership_id)
+        membership = Membership.query.options(db.joinedload(Membership.tier)).get_or_404(membership_id)
         
         if not membership.is_active:
             return jsonify({
@@ -176,7 +188,7 @@ def renew_membership(membership_id):
 def cancel_membership(membership_id):
     """Cancel a membership"""
     try:
-        membership = Membership.query.get_or_404(membership_id)
+        membership = Membership.query.options(db.joinedload(Membership.tier)).get_or_404(membership_id)
         
         if not membership.is_active:
             return jsonify({
@@ -208,7 +220,7 @@ def cancel_membership(membership_id):
 def upgrade_membership(membership_id):
     """Upgrade membership to a higher tier"""
     try:
-        membership = Membership.query.get_or_404(membership_id)
+        membership = Membership.query.options(db.joinedload(Membership.tier)).get_or_404(membership_id)
         data = request.get_json()
         
         if 'new_tier_id' not in data:
@@ -233,7 +245,7 @@ def upgrade_membership(membership_id):
         
         # Update membership tier
         old_tier_name = membership.tier.name
-        membership.tier_id = data['new_tier_id']
+        membership.tier = new_tier
         membership.updated_at = datetime.utcnow()
         
         # Process additional payment for upgrade (in real implementation)
@@ -259,8 +271,12 @@ def upgrade_membership(membership_id):
 def get_membership_benefits(user_id):
     """Get user's membership benefits and usage"""
     try:
-        user = User.query.get_or_404(user_id)
-        membership = user.get_active_membership()
+        user, membership = User.load_with_membership(user_id)
+        if not user:
+            return jsonify({
+                'success': False,
+                'error': 'User not found'
+            }), 404
         
         if not membership:
             return jsonify({
@@ -14,6 +14,7 @@ from src.models.user import db, User
 from src.models.event import Event
 from src.models.lounge import Lounge
 from src.models.membership import MembershipTier, Membership
+from src.migrations import upgrade_schema
 from api.main import app
 
 def seed_membership_tiers():
@@ -325,11 +326,12 @@ def seed_events():
         }
     ]
     
-    for event_data in events:
-        existing_event = Event.query.filter_by(title=event_data['title']).first()
-        if not existing_event:
-            event = Event(**event_data)
-            db.session.add(event)
+    existing_titles = set(db.session.execute(
+        db.select(Event.title).where(Event.title.in_([event_data['title'] for event_data in events]))
+    ).scalars())
+    Event.bulk_insert(
+        Event.import_values(event_data) for event_data in events if event_data['title'] not in existing_titles
+    )
     
     db.session.commit()
     print("✅ Events seeded successfully")
@@ -373,6 +375,8 @@ def main():
     
     with app.app_context():
         try:
+            upgrade_schema()
+            
             # Seed all data
             seed_membership_tiers()
             seed_lounges()
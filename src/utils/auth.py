@@ -0,0 +1,29 @@
+"""
+Admin endpoint guard
+Admin routes require `Authorization: Bearer <ADMIN_API_TOKEN>`. They fail
+closed: with no token configured every admin request gets 503 rather than
+being served unauthenticated.
+"""
+
+import hmac
+from functools import wraps
+from flask import current_app, jsonify, request
+
+
+def require_admin(view):
+    """Reject requests without the configured admin bearer token"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        token = current_app.config.get('ADMIN_API_TOKEN')
+        if not token:
+            return jsonify({
+                'success': False,
+                'error': 'Admin API is disabled: ADMIN_API_TOKEN is not configured'
+            }), 503
+        if not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+            return jsonify({
+                'success': False,
+                'error': 'Admin token required'
+            }), 401
+        return view(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,109 @@
+"""
+Versioned response cache for hot read endpoints
+Rendered responses are cached per route and query arguments under the current
+version of their resource family. Write routes bump the family version, which
+makes every older entry unreachable; LRU eviction then reclaims them. Cached
+responses carry a strong ETag and answer If-None-Match with 304.
+
+Versions live in process memory, so entries also expire after a TTL to bound
+staleness across workers that did not see the write.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from functools import wraps
+from flask import Response, current_app, request
+
+
+class CachedResponse:
+    __slots__ = ('body', 'mimetype', 'etag', 'expires_at')
+
+    def __init__(self, body, mimetype, etag, expires_at):
+        self.body = body
+        self.mimetype = mimetype
+        self.etag = etag
+        self.expires_at = expires_at
+
+
+class ResponseCache:
+    def __init__(self, max_entries=512, ttl_seconds=60):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = True
+        self._entries = OrderedDict()
+        self._versions = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """Read cache settings from the application config"""
+        self.max_entries = app.config.setdefault('RESPONSE_CACHE_MAX_ENTRIES', self.max_entries)
+        self.ttl_seconds = app.config.setdefault('RESPONSE_CACHE_TTL', self.ttl_seconds)
+        self.enabled = app.config.setdefault('RESPONSE_CACHE_ENABLED', self.enabled)
+
+    def version(self, family):
+        return self._versions[family]
+
+    def bump(self, *families):
+        """Invalidate every cached response of the given resource families"""
+        with self._lock:
+            for family in families:
+                self._versions[family] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def _set(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _render(self, view, args, kwargs):
+        """Run the view; return a cache entry for 200 responses, else the response itself"""
+        response = current_app.make_response(view(*args, **kwargs))
+        if response.status_code != 200:
+            return None, response
+
+        body = response.get_data()
+        etag = hashlib.sha256(body).hexdigest()[:32]
+        return CachedResponse(body, response.mimetype, etag, time.monotonic() + self.ttl_seconds), response
+
+    def cached(self, family):
+        """Decorator caching a GET view's successful responses under a resource family"""
+        def decorator(view):
+            @wraps(view)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return view(*args, **kwargs)
+
+                key = (family, self.version(family), request.path, tuple(sorted(request.args.items(multi=True))))
+                entry = self._get(key)
+                if entry is None:
+                    entry, response = self._render(view, args, kwargs)
+                    if entry is None:
+                        return response
+                    self._set(key, entry)
+
+                response = Response(entry.body, mimetype=entry.mimetype)
+                response.set_etag(entry.etag)
+                return response.make_conditional(request)
+            return wrapper
+        return decorator
+
+
+response_cache = ResponseCache()
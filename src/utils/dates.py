@@ -0,0 +1,29 @@
+"""
+Date helpers for query parameters and payloads
+"""
+
+from datetime import datetime, timedelta, timezone
+
+
+def parse_date_bound(value, end=False):
+    """Parse a from/to query value into naive UTC; a bare date as an end bound covers that whole day"""
+    if not value:
+        return None
+    parsed = parse_timestamp(value)
+    if end and len(value) == 10:
+        parsed += timedelta(days=1)
+    return parsed
+
+
+def parse_timestamp(value):
+    """Parse an ISO-8601 timestamp into a naive UTC datetime; naive input is taken as UTC.
+
+    Raises TypeError for anything but a string (e.g. an epoch number) and
+    ValueError for a malformed one.
+    """
+    if not isinstance(value, str):
+        raise TypeError(f'Expected an ISO-8601 timestamp string, got {type(value).__name__}')
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
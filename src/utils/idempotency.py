@@ -0,0 +1,155 @@
+"""
+Idempotency-Key support for write endpoints
+A request carrying an `Idempotency-Key` header runs at most once per key and
+route: its response is stored for IDEMPOTENCY_TTL seconds and replayed (with
+`Idempotent-Replayed: true`) to any retry, without re-running the view. The
+first request claims the key with a committed insert, so a concurrent retry
+loses on the unique (scope, key) constraint and gets 409 instead of running
+in parallel. A claim is locked for IDEMPOTENCY_LOCK_TIMEOUT seconds; if its
+request dies without storing a response, the next retry takes it over rather
+than getting 409 until the key expires. Completed responses are also kept in
+a small per-process LRU (IDEMPOTENCY_CACHE_SIZE), so repeated retries usually
+skip the database.
+
+Reusing a key with a different request body is rejected with 422. Server
+errors (5xx) are not stored; the claim is released so the client can retry.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from functools import wraps
+from flask import current_app, jsonify, request
+from sqlalchemy.exc import IntegrityError
+from src.models.user import db
+from src.models.idempotency_key import IdempotencyKey
+
+HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 255
+
+
+class ReplayCache:
+    """Bounded, thread-safe LRU of (scope, key) -> (request hash, status, body, expires_at)"""
+
+    def __init__(self, size=1024):
+        self.size = size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        """Default IDEMPOTENCY_TTL, IDEMPOTENCY_LOCK_TIMEOUT and IDEMPOTENCY_CACHE_SIZE"""
+        app.config.setdefault('IDEMPOTENCY_TTL', 24 * 3600)
+        app.config.setdefault('IDEMPOTENCY_LOCK_TIMEOUT', 60)
+        self.size = app.config.setdefault('IDEMPOTENCY_CACHE_SIZE', self.size)
+
+    def get(self, cache_key):
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return None
+            if entry[3] <= datetime.utcnow():
+                del self._entries[cache_key]
+                return None
+            self._entries.move_to_end(cache_key)
+            return entry
+
+    def put(self, cache_key, entry):
+        with self._lock:
+            self._entries[cache_key] = entry
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+replay_cache = ReplayCache()
+
+
+def _replay(status_code, body):
+    response = current_app.response_class(body, status=status_code, mimetype='application/json')
+    response.headers['Idempotent-Replayed'] = 'true'
+    return response
+
+
+def _mismatch():
+    return jsonify({
+        'success': False,
+        'error': f'{HEADER} was already used with a different request'
+    }), 422
+
+
+def _in_progress():
+    return jsonify({
+        'success': False,
+        'error': f'A request with this {HEADER} is still being processed'
+    }), 409
+
+
+def idempotent(view):
+    """Run view at most once per Idempotency-Key, replaying its stored response to retries"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        key = request.headers.get(HEADER)
+        if not key:
+            return view(*args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return jsonify({
+                'success': False,
+                'error': f'{HEADER} must be at most {MAX_KEY_LENGTH} characters'
+            }), 400
+
+        scope = f'{request.method} {request.path}'
+        request_hash = hashlib.sha256(request.get_data()).hexdigest()
+        cache_key = (scope, key)
+
+        cached = replay_cache.get(cache_key)
+        if cached is None:
+            record = IdempotencyKey.lookup(scope, key)
+            if record is not None and record.status_code is not None:
+                cached = (record.request_hash, record.status_code, record.response_body, record.expires_at)
+                replay_cache.put(cache_key, cached)
+            elif record is not None:
+                db.session.rollback()
+                if record.request_hash != request_hash:
+                    return _mismatch()
+                if record.in_flight():
+                    return _in_progress()
+                # A lapsed claim falls through to claim(), which takes it over
+        if cached is not None:
+            db.session.rollback()
+            if cached[0] != request_hash:
+                return _mismatch()
+            return _replay(cached[1], cached[2])
+
+        try:
+            expires_at, claim = IdempotencyKey.claim(
+                scope, key, request_hash,
+                current_app.config['IDEMPOTENCY_TTL'], current_app.config['IDEMPOTENCY_LOCK_TIMEOUT']
+            )
+        except IntegrityError:
+            db.session.rollback()
+            return _in_progress()
+
+        try:
+            response = current_app.make_response(view(*args, **kwargs))
+        except Exception:
+            db.session.rollback()
+            IdempotencyKey.release(scope, key, claim)
+            raise
+
+        # Successful views have committed; anything still pending belongs to a
+        # rejected request and must not be committed along with the response
+        db.session.rollback()
+        if response.status_code >= 500:
+            IdempotencyKey.release(scope, key, claim)
+            return response
+        body = response.get_data(as_text=True)
+        IdempotencyKey.complete(scope, key, claim, response.status_code, body)
+        replay_cache.put(cache_key, (request_hash, response.status_code, body, expires_at))
+        return response
+    return wrapper
+
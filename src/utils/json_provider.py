@@ -0,0 +1,87 @@
+"""
+Fast JSON provider for API responses
+Plain stdlib `json` with one reused C encoder: unsorted keys, compact
+separators and a `default` hook that handles our common non-JSON types first.
+Immutable payloads (e.g. the tier catalogue) can be encoded once and served
+as cached bytes under a version key, with a strong ETag so clients holding the
+current copy get 304.
+"""
+
+import dataclasses
+import decimal
+import hashlib
+import json
+import time as clock
+import uuid
+from datetime import date, datetime, time
+from flask import request
+from flask.json.provider import DefaultJSONProvider
+
+
+def _default(o):
+    """Encode the non-JSON types our payloads carry; dates as ISO 8601"""
+    kind = type(o)
+    if kind is datetime or kind is date or kind is time:
+        return o.isoformat()
+    if kind is decimal.Decimal or kind is uuid.UUID:
+        return str(o)
+    if isinstance(o, (date, time)):
+        return o.isoformat()
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, '__html__'):
+        return str(o.__html__())
+    raise TypeError(f'Object of type {kind.__name__} is not JSON serializable')
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    default = staticmethod(_default)
+    sort_keys = False
+
+    def __init__(self, app):
+        super().__init__(app)
+        self._encoder = json.JSONEncoder(
+            ensure_ascii=self.ensure_ascii,
+            sort_keys=self.sort_keys,
+            separators=(',', ':'),
+            default=self.default
+        )
+        self._encoded = {}
+
+    def dumps(self, obj, **kwargs):
+        if not kwargs:
+            return self._encoder.encode(obj)
+        return super().dumps(obj, **kwargs)
+
+    def _pretty(self):
+        return (self.compact is None and self._app.debug) or self.compact is False
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = self.dumps(obj, indent=2) if self._pretty() else self._encoder.encode(obj)
+        return self._app.response_class(f'{body}\n', mimetype=self.mimetype)
+
+    def encoded(self, name, version, build, max_age=None):
+        """Encoded bytes of build() and their ETag, cached under name until version changes.
+
+        Only for payloads that change solely through writes that also change
+        version (such as a response cache family version); max_age bounds how
+        long a copy survives changes made by other processes.
+        """
+        now = clock.monotonic()
+        entry = self._encoded.get(name)
+        if entry is not None and entry[0] == version and (entry[1] is None or entry[1] > now):
+            return entry[2], entry[3]
+        body = f'{self._encoder.encode(build())}\n'.encode()
+        etag = hashlib.sha256(body).hexdigest()[:32]
+        self._encoded[name] = (version, now + max_age if max_age is not None else None, body, etag)
+        return body, etag
+
+    def encoded_response(self, name, version, build, max_age=None):
+        """Response serving build()'s cached encoding (see encoded), answering If-None-Match with 304"""
+        if self._pretty():
+            return self.response(build())
+        body, etag = self.encoded(name, version, build, max_age)
+        response = self._app.response_class(body, mimetype=self.mimetype)
+        response.set_etag(etag)
+        return response.make_conditional(request)
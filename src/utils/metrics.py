@@ -0,0 +1,184 @@
+"""
+Per-request SQL instrumentation and Prometheus metrics
+Cursor-execute hooks count statements and DB time for the current request;
+after each request the totals land in per-endpoint counters and histograms
+alongside request latency. `render()` emits everything, plus connection-pool
+gauges, in the Prometheus text format for GET /api/metrics (admin token required).
+
+With SERVER_TIMING enabled every response also carries a Server-Timing
+header (`db;dur=..;desc="N queries", app;dur=..`), so chatty endpoints show up
+in the browser's network panel.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from flask import g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+
+# Histogram upper bounds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+POOL_GAUGES = ('size', 'checkedin', 'checkedout', 'overflow')
+
+
+class Histogram:
+    __slots__ = ('buckets', 'counts', 'total', 'count')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+        self.total += value
+        self.count += 1
+
+    def lines(self, name, labels):
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            yield f'{name}_bucket{_labels(labels, le=_number(bound))} {cumulative}'
+        yield f'{name}_bucket{_labels(labels, le="+Inf")} {self.count}'
+        yield f'{name}_sum{_labels(labels)} {_number(self.total)}'
+        yield f'{name}_count{_labels(labels)} {self.count}'
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels, **extra):
+    pairs = list(labels) + list(extra.items())
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in pairs) + '}'
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, '_metrics_started', None)
+    if started is None or not has_request_context() or 'metrics_started' not in g:
+        return
+    g.metrics_queries += 1
+    g.metrics_db_seconds += time.perf_counter() - started
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.enabled = True
+        self.server_timing = False
+        self._requests = defaultdict(int)
+        self._latency = {}
+        self._queries = {}
+        self._db_seconds = defaultdict(float)
+        self._jobs = {}
+        self._engines = []
+        self._lock = threading.Lock()
+
+    def init_app(self, app, db):
+        """Hook request lifecycle and the app's engines"""
+        self.enabled = app.config.setdefault('METRICS_ENABLED', self.enabled)
+        self.server_timing = app.config.setdefault('SERVER_TIMING', self.server_timing)
+        if not self.enabled:
+            return
+
+        with app.app_context():
+            engines = list(db.engines.values())
+        for engine in engines:
+            if not event.contains(engine, 'before_cursor_execute', _before_cursor_execute):
+                event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+                event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+            if engine not in self._engines:
+                self._engines.append(engine)
+
+        app.before_request(self._start)
+        app.after_request(self._finish)
+
+    def _start(self):
+        g.metrics_started = time.perf_counter()
+        g.metrics_queries = 0
+        g.metrics_db_seconds = 0.0
+
+    def _finish(self, response):
+        if 'metrics_started' not in g:
+            return response
+        elapsed = time.perf_counter() - g.metrics_started
+        endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+        route = (('method', request.method), ('endpoint', endpoint))
+
+        with self._lock:
+            self._requests[route + (('status', response.status_code),)] += 1
+            self._latency.setdefault(route, Histogram(LATENCY_BUCKETS)).observe(elapsed)
+            self._queries.setdefault(route, Histogram(QUERY_COUNT_BUCKETS)).observe(g.metrics_queries)
+            self._db_seconds[route] += g.metrics_db_seconds
+
+        if self.server_timing:
+            response.headers['Server-Timing'] = (
+                f'db;dur={g.metrics_db_seconds * 1000:.2f};desc="{g.metrics_queries} queries", '
+                f'app;dur={elapsed * 1000:.2f}'
+            )
+        return response
+
+    def observe_job(self, job, rows, seconds):
+        """Record one run of a background job that processed rows in seconds"""
+        with self._lock:
+            runs, total_rows, total_seconds, _ = self._jobs.get(job, (0, 0, 0.0, 0.0))
+            self._jobs[job] = (runs + 1, total_rows + rows, total_seconds + seconds, time.time())
+
+    def _job_lines(self):
+        series = (
+            ('elevate_job_runs_total', 'counter', 0),
+            ('elevate_job_rows_total', 'counter', 1),
+            ('elevate_job_seconds_total', 'counter', 2),
+            ('elevate_job_last_run_timestamp_seconds', 'gauge', 3),
+        )
+        for name, kind, index in series:
+            yield f'# TYPE {name} {kind}'
+            for job, values in self._jobs.items():
+                yield f'{name}{_labels((("job", job),))} {_number(values[index])}'
+
+    def _pool_lines(self):
+        yield '# TYPE elevate_db_pool_connections gauge'
+        for engine in self._engines:
+            # Only queue pools track checkouts (not e.g. SQLite's in-memory pools)
+            if not isinstance(engine.pool, QueuePool):
+                continue
+            for gauge in POOL_GAUGES:
+                labels = (('database', engine.url.render_as_string(hide_password=True)), ('state', gauge))
+                yield f'elevate_db_pool_connections{_labels(labels)} {getattr(engine.pool, gauge)()}'
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format"""
+        with self._lock:
+            lines = ['# TYPE elevate_http_requests_total counter']
+            lines += [f'elevate_http_requests_total{_labels(labels)} {count}' for labels, count in self._requests.items()]
+            lines.append('# TYPE elevate_http_request_duration_seconds histogram')
+            for labels, histogram in self._latency.items():
+                lines.extend(histogram.lines('elevate_http_request_duration_seconds', labels))
+            lines.append('# TYPE elevate_db_queries_per_request histogram')
+            for labels, histogram in self._queries.items():
+                lines.extend(histogram.lines('elevate_db_queries_per_request', labels))
+            lines.append('# TYPE elevate_db_query_seconds_total counter')
+            lines += [f'elevate_db_query_seconds_total{_labels(labels)} {_number(seconds)}'
+                      for labels, seconds in self._db_seconds.items()]
+            lines.extend(self._job_lines())
+        lines.extend(self._pool_lines())
+        return '\n'.join(lines) + '\n'
+
+
+metrics = RequestMetrics()
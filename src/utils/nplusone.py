@@ -0,0 +1,126 @@
+"""
+N+1 query detection for development
+Within each request, counts lazy relationship loads per relationship and
+executions per SQL statement shape (the parameterized statement text). When
+either reaches NPLUSONE_THRESHOLD the detector logs a warning naming the route
+and the relationship or statement, or raises NPlusOneError when NPLUSONE is
+'raise'. NPLUSONE defaults to 'log' in debug mode and 'off' otherwise.
+
+`statement_budget()` asserts an upper bound on the statements a block runs,
+for tests and benchmarks:
+
+    with statement_budget(3):
+        client.post(f'/api/bookings/{reference}/confirm', json={})
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+
+MODES = ('off', 'log', 'raise')
+
+
+class NPlusOneError(Exception):
+    pass
+
+
+def _route():
+    rule = request.url_rule.rule if request.url_rule else request.path
+    return f'{request.method} {rule}'
+
+
+def _active():
+    return has_request_context() and 'nplusone_lazy_loads' in g
+
+
+def _report(key, count, message):
+    """Log or raise once per request for each offending relationship or statement"""
+    if key in g.nplusone_reported:
+        return
+    g.nplusone_reported.add(key)
+    message = f'Possible N+1 in {_route()}: {message} ({count} times)'
+    if current_app.config['NPLUSONE'] == 'raise':
+        raise NPlusOneError(message)
+    current_app.logger.warning(message)
+
+
+def _on_orm_execute(orm_execute_state):
+    if not orm_execute_state.is_relationship_load or not _active():
+        return
+    path = orm_execute_state.loader_strategy_path
+    relationship = path[-1] if path is not None and len(path) else None
+    name = f'{relationship.parent.class_.__name__}.{relationship.key}' if relationship is not None else 'relationship'
+    g.nplusone_lazy_loads[name] += 1
+    count = g.nplusone_lazy_loads[name]
+    if count >= current_app.config['NPLUSONE_THRESHOLD']:
+        _report(('lazy', name), count, f'lazy load of {name}')
+
+
+def _on_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if executemany or not _active():
+        return
+    g.nplusone_statements[statement] += 1
+    count = g.nplusone_statements[statement]
+    if count >= current_app.config['NPLUSONE_THRESHOLD']:
+        shape = ' '.join(statement.split())
+        _report(('statement', statement), count, f'repeated statement {shape[:200]}')
+
+
+class NPlusOneDetector:
+    def init_app(self, app, db):
+        """Enable detection for app according to NPLUSONE / NPLUSONE_THRESHOLD"""
+        mode = app.config.setdefault('NPLUSONE', 'off')
+        if mode not in MODES:
+            raise ValueError(f"NPLUSONE must be one of {', '.join(MODES)}")
+        app.config.setdefault('NPLUSONE_THRESHOLD', 3)
+        if mode == 'off':
+            return
+
+        if not event.contains(db.session, 'do_orm_execute', _on_orm_execute):
+            event.listen(db.session, 'do_orm_execute', _on_orm_execute)
+        with app.app_context():
+            engines = list(db.engines.values())
+        for engine in engines:
+            if not event.contains(engine, 'before_cursor_execute', _on_cursor_execute):
+                event.listen(engine, 'before_cursor_execute', _on_cursor_execute)
+
+        @app.before_request
+        def start_nplusone_tracking():
+            g.nplusone_lazy_loads = Counter()
+            g.nplusone_statements = Counter()
+            g.nplusone_reported = set()
+
+
+class StatementBudget:
+    __slots__ = ('statements',)
+
+    def __init__(self):
+        self.statements = []
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+
+@contextmanager
+def statement_budget(max_statements, engine=None):
+    """Fail with AssertionError if the block executes more than max_statements statements"""
+    if engine is None:
+        engine = current_app.extensions['sqlalchemy'].engine
+    budget = StatementBudget()
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        budget.statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        yield budget
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+    if budget.count > max_statements:
+        listing = '\n'.join(f'  {" ".join(statement.split())[:160]}' for statement in budget.statements)
+        raise AssertionError(f'{budget.count} statements executed, budget is {max_statements}:\n{listing}')
+
+
+nplusone = NPlusOneDetector()
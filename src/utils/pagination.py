@@ -0,0 +1,50 @@
+"""
+Keyset pagination helpers
+Cursors are opaque URL-safe tokens wrapping the sort key of the last row on a
+page, so the next page can resume with an index range instead of an OFFSET.
+"""
+
+import base64
+import json
+from datetime import datetime
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(*values):
+    """Encode a row's sort key (datetimes, ints, strings) as an opaque cursor"""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor, *types):
+    """Decode a cursor back into a sort key, converting each value to the given type.
+
+    Raises ValueError for malformed or tampered cursors.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError
+        return [
+            datetime.fromisoformat(value) if value_type is datetime else value_type(value)
+            for value, value_type in zip(payload, types)
+        ]
+    except (ValueError, TypeError):
+        raise ValueError('Invalid cursor')
+
+
+def page_size(value, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """Clamp a requested page size to [1, maximum].
+
+    Raises ValueError if value is not a whole number.
+    """
+    if value is None:
+        return default
+    try:
+        return max(1, min(int(value), maximum))
+    except (TypeError, ValueError):
+        raise ValueError('limit must be a whole number')
@@ -0,0 +1,135 @@
+"""
+Sampled request profiler with slow-request capture
+A PROFILER_SAMPLE_RATE fraction of requests run under cProfile. When a
+sampled request takes at least PROFILER_SLOW_MS, its route, status, SQL
+statements with timings and hottest frames are kept in a bounded ring buffer
+(PROFILER_BUFFER_SIZE entries) that the admin API exposes. Unsampled requests
+pay only a random() call; a sample rate of 0 (the default) installs nothing.
+"""
+
+import cProfile
+import itertools
+import pstats
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+MAX_SQL_STATEMENTS = 100
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and has_request_context() and 'profile' in g:
+        context._profile_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, '_profile_started', None)
+    if started is None or not has_request_context() or 'profile' not in g:
+        return
+    if len(g.profile_sql) < MAX_SQL_STATEMENTS:
+        g.profile_sql.append({
+            'statement': ' '.join(statement.split()),
+            'ms': round((time.perf_counter() - started) * 1000, 3),
+            'executemany': executemany
+        })
+    g.profile_sql_count += 1
+
+
+def _hot_frames(profile, limit):
+    """Functions with the most self time: [{'function', 'calls', 'self_ms', 'cumulative_ms'}]"""
+    stats = pstats.Stats(profile).stats
+    hottest = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+    return [
+        {
+            'function': f'{filename}:{line}({name})',
+            'calls': calls,
+            'self_ms': round(self_time * 1000, 3),
+            'cumulative_ms': round(cumulative * 1000, 3)
+        }
+        for (filename, line, name), (_, calls, self_time, cumulative, _) in hottest
+    ]
+
+
+class RequestProfiler:
+    def __init__(self):
+        self.sample_rate = 0.0
+        self.slow_ms = 500
+        self.top_frames = 25
+        self._profiles = deque(maxlen=50)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def init_app(self, app, db):
+        """Read profiler settings and hook requests when sampling is on"""
+        self.sample_rate = float(app.config.setdefault('PROFILER_SAMPLE_RATE', self.sample_rate))
+        self.slow_ms = float(app.config.setdefault('PROFILER_SLOW_MS', self.slow_ms))
+        self.top_frames = app.config.setdefault('PROFILER_TOP_FRAMES', self.top_frames)
+        self._profiles = deque(self._profiles, maxlen=app.config.setdefault('PROFILER_BUFFER_SIZE', self._profiles.maxlen))
+        if self.sample_rate <= 0:
+            return
+
+        with app.app_context():
+            engines = list(db.engines.values())
+        for engine in engines:
+            if not event.contains(engine, 'before_cursor_execute', _before_cursor_execute):
+                event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+                event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+
+        app.before_request(self._start)
+        app.after_request(self._finish)
+
+    def _start(self):
+        if random.random() >= self.sample_rate:
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler already owns this interpreter/thread
+            return
+        g.profile = profile
+        g.profile_started = time.perf_counter()
+        g.profile_sql = []
+        g.profile_sql_count = 0
+
+    def _finish(self, response):
+        profile = g.pop('profile', None)
+        if profile is None:
+            return response
+        profile.disable()
+        duration_ms = (time.perf_counter() - g.profile_started) * 1000
+        if duration_ms < self.slow_ms:
+            return response
+
+        record = {
+            'id': next(self._ids),
+            'captured_at': datetime.utcnow().isoformat(),
+            'method': request.method,
+            'path': request.full_path.rstrip('?'),
+            'endpoint': request.url_rule.rule if request.url_rule else None,
+            'status': response.status_code,
+            'duration_ms': round(duration_ms, 3),
+            'sql_count': g.profile_sql_count,
+            'sql_ms': round(sum(statement['ms'] for statement in g.profile_sql), 3),
+            'sql': g.profile_sql,
+            'hot_frames': _hot_frames(profile, self.top_frames)
+        }
+        with self._lock:
+            self._profiles.append(record)
+        return response
+
+    def profiles(self):
+        """Captured profiles, newest first"""
+        with self._lock:
+            return list(reversed(self._profiles))
+
+    def get(self, profile_id):
+        with self._lock:
+            return next((record for record in self._profiles if record['id'] == profile_id), None)
+
+
+profiler = RequestProfiler()
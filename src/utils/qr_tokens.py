@@ -0,0 +1,76 @@
+"""
+Signed booking QR tokens
+A token is `E1.<kid>.<booking reference>.<expiry>.<signature>`: the signature
+is a truncated HMAC-SHA256 under a key derived from SECRET_KEY, so scanners
+can reject forged or stale codes without touching the database. The key id
+names the secret that signed it; tokens signed under a secret that has moved
+to SECRET_KEY_FALLBACKS keep verifying until it is dropped from that list.
+"""
+
+import base64
+import calendar
+import hashlib
+import hmac
+import time
+from functools import lru_cache
+from flask import current_app
+
+VERSION = 'E1'
+SIGNATURE_BYTES = 16
+DERIVATION_LABEL = b'elevate-events:booking-qr'
+
+
+class InvalidQRToken(ValueError):
+    pass
+
+
+@lru_cache(maxsize=8)
+def _keyring(secrets):
+    """{kid: key} for the given secrets; the first entry signs new tokens"""
+    keys = {}
+    for secret in secrets:
+        secret = secret.encode() if isinstance(secret, str) else secret
+        key = hmac.new(secret, DERIVATION_LABEL, hashlib.sha256).digest()
+        keys.setdefault(hashlib.sha256(key).hexdigest()[:6], key)
+    return keys
+
+
+def _current_keyring():
+    config = current_app.config
+    return _keyring((config['SECRET_KEY'],) + tuple(config.get('SECRET_KEY_FALLBACKS') or ()))
+
+
+def _signature(key, message):
+    digest = hmac.new(key, message.encode(), hashlib.sha256).digest()[:SIGNATURE_BYTES]
+    return base64.urlsafe_b64encode(digest).rstrip(b'=').decode()
+
+
+def sign_booking(reference, expires_at=None):
+    """Token admitting booking `reference` until the naive-UTC datetime expires_at (None: no expiry)"""
+    kid, key = next(iter(_current_keyring().items()))
+    # Naive datetimes in this app are UTC; 0 means the token never expires
+    expiry = format(calendar.timegm(expires_at.utctimetuple()) if expires_at else 0, 'x')
+    message = f'{VERSION}.{kid}.{reference}.{expiry}'
+    return f'{message}.{_signature(key, message)}'
+
+
+def verify(token, at=None):
+    """Booking reference of a token valid at the naive-UTC datetime at (default now); raises InvalidQRToken otherwise"""
+    parts = token.split('.') if isinstance(token, str) else []
+    if len(parts) != 5 or parts[0] != VERSION:
+        raise InvalidQRToken('Malformed QR token')
+    _, kid, reference, expiry, signature = parts
+
+    key = _current_keyring().get(kid)
+    if key is None:
+        raise InvalidQRToken('QR token was signed with a retired key')
+    if not hmac.compare_digest(signature, _signature(key, f'{VERSION}.{kid}.{reference}.{expiry}')):
+        raise InvalidQRToken('QR token signature does not match')
+
+    try:
+        expires = int(expiry, 16)
+    except ValueError:
+        raise InvalidQRToken('Malformed QR token')
+    if expires and (calendar.timegm(at.utctimetuple()) if at else time.time()) > expires:
+        raise InvalidQRToken('QR token has expired')
+    return reference
@@ -0,0 +1,179 @@
+"""
+Shared fixtures
+Each test gets a fresh app on in-memory SQLite (`app`, `client`), factories
+for the rows most tests need, and `statement_budget` for asserting how many
+SQL statements a block may run:
+
+    def test_listing(client, statement_budget):
+        with statement_budget(2):
+            client.get('/api/events')
+
+N+1 detection runs in raise mode, so a route that starts lazy-loading in a
+loop fails the test that exercises it. Tests that race requests across threads
+take `concurrent_app` (file-backed SQLite) and use `run_concurrently` and
+`seated` to check the seat ledger afterwards.
+"""
+
+import threading
+from datetime import datetime, timedelta
+from functools import wraps
+
+import pytest
+
+from src.app import create_app
+from src.models.user import db, User
+from src.models.event import Event
+from src.models.booking import Booking
+from src.models.membership import MembershipTier, Membership
+from src.utils.cache import response_cache
+from src.utils.idempotency import replay_cache
+from src.utils.nplusone import statement_budget as _statement_budget
+
+ADMIN_TOKEN = 'test-admin-token'
+
+TEST_CONFIG = {
+    'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+    'AUTO_CREATE_SCHEMA': True,
+    'RESPONSE_CACHE_ENABLED': False,
+    'NPLUSONE': 'raise',
+    'ADMIN_API_TOKEN': ADMIN_TOKEN,
+    'SECRET_KEY': 'test-secret-key',
+}
+
+
+def _make_app(**config):
+    response_cache.clear()
+    replay_cache.clear()
+    return create_app({**TEST_CONFIG, **config})
+
+
+def _in_context(app):
+    """Run a factory inside its own app context; the returned rows stay readable after it closes"""
+    def decorate(factory):
+        @wraps(factory)
+        def wrapper(*args, **kwargs):
+            with app.app_context():
+                return factory(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def run_concurrently(target, items):
+    """Call target(item) for every item, each on its own thread, and wait for all of them"""
+    threads = [threading.Thread(target=target, args=(item,)) for item in items]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def seated(event_id):
+    """Guests on an event's seat-holding bookings, for checking its seat ledger (needs an app context)"""
+    return db.session.execute(
+        db.select(db.func.coalesce(db.func.sum(Booking.guest_count), 0))
+        .where(Booking.event_id == event_id, Booking.status.in_(Booking.SEAT_HOLDING_STATUSES))
+    ).scalar()
+
+
+@pytest.fixture
+def app(request):
+    # No app context is held open: requests must get their own session, as in
+    # production. Tests touching the database directly use `with app.app_context()`.
+    if 'concurrent_app' in request.fixturenames:
+        # Keep the client and factories on the same database as concurrent_app
+        return request.getfixturevalue('concurrent_app')
+    return _make_app()
+
+
+@pytest.fixture
+def concurrent_app(tmp_path):
+    """App on a file-backed SQLite database, for tests that send requests from several threads.
+
+    In-memory SQLite gives each thread its own empty database, so concurrent
+    requests need real connections to one file. Requesting this fixture also
+    moves `app`, `client` and the factories onto it.
+    """
+    app = _make_app(SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'test.db'}")
+    yield app
+    with app.app_context():
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def admin_headers():
+    return {'Authorization': f'Bearer {ADMIN_TOKEN}'}
+
+
+@pytest.fixture
+def statement_budget(app):
+    """`with statement_budget(n):` fails the test if the block runs more than n statements"""
+    with app.app_context():
+        engine = db.engine
+
+    def budget(max_statements):
+        return _statement_budget(max_statements, engine=engine)
+    return budget
+
+
+@pytest.fixture
+def make_event(app):
+    @_in_context(app)
+    def make(**fields):
+        values = {
+            'title': 'Launch night', 'description': 'Test event', 'category': 'vip', 'price': 100.0,
+            'max_guests': 50, 'date': (datetime.utcnow() + timedelta(days=14)).replace(hour=20, minute=0, second=0, microsecond=0),
+        }
+        values.update(fields)
+        event = Event(**values)
+        db.session.add(event)
+        db.session.commit()
+        return event
+    return make
+
+
+@pytest.fixture
+def make_member(app):
+    """Create a user with an active membership; returns (user, membership)"""
+    @_in_context(app)
+    def make(username='member', **fields):
+        tier = MembershipTier.query.filter_by(slug='vip').first()
+        if tier is None:
+            tier = MembershipTier(name='VIP', slug='vip', monthly_price=99.0, discount_percentage=10)
+            db.session.add(tier)
+        user = User(username=username, email=f'{username}@example.com')
+        db.session.add(user)
+        db.session.flush()
+        values = {'user_id': user.id, 'tier': tier, 'end_date': datetime.utcnow() + timedelta(days=30)}
+        values.update(fields)
+        membership = Membership(**values)
+        db.session.add(membership)
+        db.session.commit()
+        return user, membership
+    return make
+
+
+@pytest.fixture
+def book(client):
+    """POST a booking for an event and optionally confirm it; returns the booking JSON"""
+    def create(event, confirm=False, test_client=None, **fields):
+        test_client = test_client or client
+        body = {
+            'guest_name': 'Guest', 'guest_email': 'guest@example.com', 'guest_count': 1,
+            'booking_date': event.date.date().isoformat(), 'booking_time': event.date.strftime('%H:%M'),
+            'event_id': event.id,
+        }
+        body.update(fields)
+        response = test_client.post('/api/bookings', json=body)
+        assert response.status_code == 201, response.get_json()
+        booking = response.get_json()['booking']
+        if confirm:
+            response = test_client.post(f"/api/bookings/{booking['booking_reference']}/confirm", json={})
+            assert response.status_code == 200, response.get_json()
+            booking = response.get_json()['booking']
+        return booking
+    return create
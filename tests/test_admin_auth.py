@@ -0,0 +1,40 @@
+import pytest
+
+from tests.conftest import _make_app
+
+ADMIN_REQUESTS = [
+    ('GET', '/api/admin/bookings/export?format=csv'),
+    ('POST', '/api/admin/events/import'),
+    ('GET', '/api/admin/profiles'),
+    ('GET', '/api/admin/profiles/1'),
+]
+
+
+@pytest.mark.parametrize('method, path', ADMIN_REQUESTS)
+@pytest.mark.parametrize('token', [None, ''])
+def test_admin_routes_fail_closed_without_a_configured_token(method, path, token):
+    client = _make_app(ADMIN_API_TOKEN=token).test_client()
+    for headers in ({}, {'Authorization': 'Bearer '}, {'Authorization': 'Bearer None'}):
+        response = client.open(path, method=method, headers=headers)
+        assert response.status_code == 503
+        assert 'ADMIN_API_TOKEN' in response.get_json()['error']
+
+
+@pytest.mark.parametrize('method, path', ADMIN_REQUESTS)
+@pytest.mark.parametrize('headers', [{}, {'Authorization': 'Bearer wrong-token'}, {'Authorization': 'test-admin-token'}])
+def test_admin_routes_reject_a_missing_or_wrong_token(client, method, path, headers):
+    response = client.open(path, method=method, headers=headers)
+    assert response.status_code == 401
+
+
+def test_admin_routes_accept_the_configured_token(client, admin_headers):
+    response = client.get('/api/admin/bookings/export?format=csv', headers=admin_headers)
+    assert response.status_code == 200
+
+
+def test_metrics_require_the_admin_token(client, admin_headers):
+    assert client.get('/api/metrics').status_code == 401
+    response = client.get('/api/metrics', headers=admin_headers)
+    assert response.status_code == 200
+    assert response.content_type.startswith('text/plain')
+    assert _make_app(ADMIN_API_TOKEN=None).test_client().get('/api/metrics').status_code == 503
@@ -0,0 +1,22 @@
+import pytest
+
+
+@pytest.mark.parametrize('field, value, error', [
+    ('duration_hours', 'x', 'Duration must be a whole number'),
+    ('duration_hours', None, 'Duration must be a whole number'),
+    ('duration_hours', 0, 'Duration must be a whole number'),
+    ('duration_hours', 25, 'Duration must be a whole number'),
+    ('booking_time', '8pm', 'booking_time must be a time in HH:MM format'),
+    ('booking_time', 2000, 'booking_time must be a time in HH:MM format'),
+    ('booking_date', '31/12/2030', 'booking_date must be a date in YYYY-MM-DD format'),
+])
+def test_create_booking_rejects_malformed_slots(client, make_event, field, value, error):
+    event = make_event()
+    body = {
+        'guest_name': 'Guest', 'guest_email': 'guest@example.com', 'guest_count': 1,
+        'booking_date': event.date.date().isoformat(), 'booking_time': '20:00', 'event_id': event.id,
+        field: value,
+    }
+    response = client.post('/api/bookings', json=body)
+    assert response.status_code == 400
+    assert response.get_json()['error'].startswith(error)
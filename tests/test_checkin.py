@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta
+
+from src.models.user import db
+from src.models.booking import Booking
+from src.utils import qr_tokens
+
+
+def batch(client, *scans):
+    response = client.post('/api/bookings/checkin/batch', json={'scans': list(scans)})
+    assert response.status_code == 200
+    return response.get_json()['results']
+
+
+def test_backdated_scan_cannot_revive_an_expired_token(app, client, make_event, book):
+    reference = book(make_event(), confirm=True)['booking_reference']
+    expired_at = datetime.utcnow() - timedelta(days=3)
+    with app.app_context():
+        token = qr_tokens.sign_booking(reference, expired_at)
+
+    [result] = batch(client, {'token': token, 'scanned_at': (expired_at - timedelta(hours=1)).isoformat()})
+    assert result['result'] == 'invalid'
+    assert 'hours old' in result['error']
+    with app.app_context():
+        assert db.session.execute(
+            db.select(Booking.status).where(Booking.booking_reference == reference)
+        ).scalar_one() == 'confirmed'
+
+
+def test_recent_offline_scans_are_accepted(client, make_event, book):
+    event = make_event()
+    recent, stale = (book(event, confirm=True)['qr_code'] for _ in range(2))
+    results = batch(
+        client,
+        {'token': recent, 'scanned_at': (datetime.utcnow() - timedelta(hours=11)).isoformat()},
+        {'token': stale, 'scanned_at': (datetime.utcnow() - timedelta(hours=13)).isoformat()},
+    )
+    assert [result['result'] for result in results] == ['accepted', 'invalid']
+
+
+def test_non_string_scanned_at_is_an_invalid_scan(client, make_event, book):
+    event = make_event()
+    tokens = [book(event, confirm=True)['qr_code'] for _ in range(3)]
+    results = batch(
+        client,
+        {'token': tokens[0], 'scanned_at': 1893456000},
+        {'token': tokens[1], 'scanned_at': ['2030-01-01T20:00:00']},
+        {'token': tokens[2]},
+    )
+    assert [result['result'] for result in results] == ['invalid', 'invalid', 'accepted']
+    assert 'ISO-8601' in results[0]['error']
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+import pytest
+
+from src.utils.dates import parse_date_bound, parse_timestamp
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2030-01-01T20:00:00+02:00', datetime(2030, 1, 1, 18, 0)),
+    ('2030-01-01T20:00:00-05:00', datetime(2030, 1, 2, 1, 0)),
+    ('2030-01-01T20:00:00Z', datetime(2030, 1, 1, 20, 0)),
+    ('2030-01-01T20:00:00', datetime(2030, 1, 1, 20, 0)),
+])
+def test_offsets_are_converted_to_utc(value, expected):
+    assert parse_timestamp(value) == expected
+    assert parse_date_bound(value) == expected
+    assert parse_date_bound(value, end=True) == expected
+
+
+def test_bare_end_date_covers_the_whole_day():
+    assert parse_date_bound('2030-01-01') == datetime(2030, 1, 1)
+    assert parse_date_bound('2030-01-01', end=True) == datetime(2030, 1, 2)
+    assert parse_date_bound('') is None
+
+
+def test_non_string_timestamps_raise_type_error():
+    with pytest.raises(TypeError):
+        parse_timestamp(1893456000)
@@ -0,0 +1,21 @@
+import json
+from datetime import datetime
+
+from src.models.user import db
+from src.models.event import Event
+
+
+def test_import_converts_offset_dates_to_utc(app, client, admin_headers):
+    rows = [
+        {'title': 'Paris', 'description': 'Import', 'category': 'vip', 'price': 100, 'max_guests': 50,
+         'date': '2030-06-01T20:00:00+02:00'},
+        {'title': 'New York', 'description': 'Import', 'category': 'vip', 'price': 100, 'max_guests': 50,
+         'date': '2030-06-01T20:00:00-04:00'},
+    ]
+    response = client.post('/api/admin/events/import', headers=admin_headers, content_type='application/x-ndjson',
+                           data=''.join(json.dumps(row) + '\n' for row in rows))
+    assert response.status_code == 201, response.get_json()
+
+    with app.app_context():
+        dates = dict(db.session.execute(db.select(Event.title, Event.date)).all())
+    assert dates == {'Paris': datetime(2030, 6, 1, 18, 0), 'New York': datetime(2030, 6, 2, 0, 0)}
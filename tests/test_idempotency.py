@@ -0,0 +1,122 @@
+import hashlib
+import json
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+from flask import jsonify
+
+from src.models.user import db, User
+from src.models.booking import Booking
+from src.models.idempotency_key import IdempotencyKey
+from src.utils.idempotency import idempotent
+from tests.conftest import run_concurrently
+
+
+def booking_body(event):
+    return json.dumps({
+        'guest_name': 'Guest', 'guest_email': 'guest@example.com', 'guest_count': 1,
+        'booking_date': event.date.date().isoformat(), 'booking_time': event.date.strftime('%H:%M'),
+        'event_id': event.id,
+    })
+
+
+def post_booking(client, body, key='retry-1'):
+    return client.post('/api/bookings', data=body, content_type='application/json', headers={'Idempotency-Key': key})
+
+
+def booking_count(app):
+    with app.app_context():
+        return db.session.execute(db.select(db.func.count(Booking.id))).scalar()
+
+
+def test_concurrent_retries_create_exactly_one_booking(concurrent_app, make_event):
+    app = concurrent_app
+    body = booking_body(make_event())
+    lock = threading.Lock()
+    statuses = Counter()
+    references = set()
+
+    def retry(_):
+        response = post_booking(app.test_client(), body)
+        with lock:
+            statuses[response.status_code] += 1
+            if response.status_code == 201:
+                references.add(response.get_json()['booking']['booking_reference'])
+
+    run_concurrently(retry, range(20))
+
+    assert set(statuses) <= {201, 409}
+    assert statuses[201] >= 1
+    assert len(references) == 1
+    assert booking_count(app) == 1
+
+    replay = post_booking(app.test_client(), body)
+    assert replay.status_code == 201
+    assert replay.headers['Idempotent-Replayed'] == 'true'
+    assert replay.get_json()['booking']['booking_reference'] in references
+    assert booking_count(app) == 1
+
+
+def store_claim(app, body, locked_until, key='retry-1'):
+    """Leave an unfinished claim behind, as a request that died mid-flight would"""
+    with app.app_context():
+        db.session.add(IdempotencyKey(
+            scope='POST /api/bookings', key=key, request_hash=hashlib.sha256(body.encode()).hexdigest(),
+            locked_until=locked_until, expires_at=datetime.utcnow() + timedelta(hours=24)
+        ))
+        db.session.commit()
+
+
+def test_retry_waits_for_a_claim_that_is_still_locked(app, client, make_event):
+    body = booking_body(make_event())
+    store_claim(app, body, datetime.utcnow() + timedelta(seconds=60))
+
+    assert post_booking(client, body).status_code == 409
+    assert booking_count(app) == 0
+
+
+@pytest.mark.parametrize('locked_until', [datetime.utcnow() - timedelta(seconds=1), None])
+def test_retry_takes_over_a_lapsed_claim(app, client, make_event, locked_until):
+    body = booking_body(make_event())
+    store_claim(app, body, locked_until)
+
+    response = post_booking(client, body)
+    assert response.status_code == 201
+    assert booking_count(app) == 1
+    replay = post_booking(client, body)
+    assert replay.headers['Idempotent-Replayed'] == 'true'
+    assert replay.get_json()['booking'] == response.get_json()['booking']
+
+
+def test_lapsed_claim_for_a_different_request_is_not_taken_over(app, client, make_event):
+    event = make_event()
+    store_claim(app, booking_body(event), None)
+
+    response = post_booking(client, booking_body(event).replace('"guest_count": 1', '"guest_count": 2'))
+    assert response.status_code == 422
+    assert booking_count(app) == 0
+
+
+def test_rejected_request_leaves_no_pending_changes(app):
+    app.config['TESTING'] = True
+
+    @app.route('/test/rename/<int:user_id>', methods=['POST'])
+    @idempotent
+    def rename(user_id):
+        db.session.get(User, user_id).username = 'renamed'
+        return jsonify({'success': False, 'error': 'Rejected'}), 400
+
+    with app.app_context():
+        user = User(username='original', email='original@example.com')
+        db.session.add(user)
+        db.session.commit()
+
+    client = app.test_client()
+    for _ in range(2):
+        response = client.post(f'/test/rename/{user.id}', headers={'Idempotency-Key': 'rename-1'})
+        assert response.status_code == 400
+    assert response.headers['Idempotent-Replayed'] == 'true'
+    with app.app_context():
+        assert db.session.get(User, user.id).username == 'original'
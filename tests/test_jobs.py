@@ -0,0 +1,107 @@
+"""Maintenance jobs run end to end through the CLI against a database created by `flask init-db`"""
+
+import os
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.models.user import db, User
+from src.models.event import Event
+from src.models.booking import Booking
+from src.models.membership import MembershipTier, Membership
+from tests.conftest import _make_app
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def flask_cli(tmp_path):
+    """Run `flask --app api/main.py <args>` in a fresh interpreter against an init-db database.
+
+    A fresh interpreter imports only what the command itself imports, as in
+    production, so a table missing from init-db fails the job.
+    """
+    env = {**os.environ, 'SQLALCHEMY_DATABASE_URI': f"sqlite:///{tmp_path / 'cli.db'}"}
+    env.pop('AUTO_CREATE_SCHEMA', None)
+
+    def run(*args):
+        result = subprocess.run(
+            [sys.executable, '-m', 'flask', '--app', 'api/main.py', *args],
+            cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stdout + result.stderr
+        return result.stdout
+
+    run('init-db')
+    run.app = _make_app(SQLALCHEMY_DATABASE_URI=env['SQLALCHEMY_DATABASE_URI'], AUTO_CREATE_SCHEMA=False)
+    yield run
+    with run.app.app_context():
+        db.engine.dispose()
+
+
+def test_expire_pending_bookings(flask_cli):
+    app = flask_cli.app
+    with app.app_context():
+        event = Event(title='Launch night', description='Test event', category='vip', price=100.0,
+                      max_guests=10, date=(datetime.utcnow() + timedelta(days=14)).replace(hour=20, minute=0))
+        db.session.add(event)
+        db.session.commit()
+        event_id, event_date = event.id, event.date
+
+    client = app.test_client()
+    references = []
+    for _ in range(3):
+        response = client.post('/api/bookings', json={
+            'guest_name': 'Guest', 'guest_email': 'guest@example.com', 'guest_count': 2,
+            'booking_date': event_date.date().isoformat(), 'booking_time': '20:00', 'event_id': event_id,
+        })
+        references.append(response.get_json()['booking']['booking_reference'])
+    with app.app_context():
+        db.session.execute(
+            db.update(Booking).where(Booking.booking_reference.in_(references[:2]))
+            .values(created_at=datetime.utcnow() - timedelta(hours=3))
+        )
+        db.session.commit()
+
+    assert 'Expired 2 stale pending bookings' in flask_cli('expire-pending-bookings')
+    assert 'Expired 0 stale pending bookings' in flask_cli('expire-pending-bookings')
+
+    with app.app_context():
+        statuses = dict(db.session.execute(db.select(Booking.booking_reference, Booking.status)).all())
+        assert [statuses[reference] for reference in references] == ['expired', 'expired', 'pending']
+        assert db.session.get(Event, event_id).held_seats == 2
+
+
+def test_renew_memberships(flask_cli):
+    app = flask_cli.app
+    now = datetime.utcnow()
+    with app.app_context():
+        tier = MembershipTier(name='VIP', slug='vip', monthly_price=99.0)
+        db.session.add(tier)
+        for index, (end_date, auto_renew) in enumerate([
+            (now - timedelta(days=5), True),
+            (now - timedelta(days=5), False),
+            (now + timedelta(days=10), True),
+        ]):
+            user = User(username=f'member{index}', email=f'member{index}@example.com')
+            db.session.add(user)
+            db.session.flush()
+            db.session.add(Membership(user_id=user.id, tier=tier, end_date=end_date, auto_renew=auto_renew))
+        db.session.commit()
+
+    output = flask_cli('renew-memberships', '--dry-run')
+    assert 'would renew 1 memberships (1 monthly, 0 annual)' in output
+    assert 'Would expire 1 (1 not auto-renewing' in output
+
+    output = flask_cli('renew-memberships')
+    assert 'Renewed 1 memberships (1 monthly, 0 annual)' in output
+    assert 'Expired 1 (1 not auto-renewing' in output
+    assert 'Renewed 0 memberships' in flask_cli('renew-memberships')
+
+    with app.app_context():
+        memberships = Membership.query.order_by(Membership.id).all()
+        assert [membership.is_active for membership in memberships] == [True, False, True]
+        assert memberships[0].end_date > now
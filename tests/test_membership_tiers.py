@@ -0,0 +1,23 @@
+from src.models.membership import MembershipTier, db
+from src.utils.cache import response_cache
+
+
+def test_tier_catalogue_is_conditional_and_follows_the_cache_version(app, client, make_member):
+    make_member()
+    first = client.get('/api/membership-tiers')
+    etag = first.headers['ETag']
+
+    assert [tier['slug'] for tier in first.get_json()['tiers']] == ['vip']
+    assert client.get('/api/membership-tiers', headers={'If-None-Match': etag}).status_code == 304
+
+    with app.app_context():
+        db.session.add(MembershipTier(name='Gold', slug='gold', monthly_price=199.0, sort_order=2))
+        db.session.commit()
+    assert client.get('/api/membership-tiers', headers={'If-None-Match': etag}).status_code == 304
+
+    response_cache.bump('membership_tiers')
+    refreshed = client.get('/api/membership-tiers', headers={'If-None-Match': etag})
+
+    assert refreshed.status_code == 200
+    assert refreshed.headers['ETag'] != etag
+    assert [tier['slug'] for tier in refreshed.get_json()['tiers']] == ['vip', 'gold']
@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+
+from src.migrations import upgrade_schema
+from src.models.user import db
+from src.models.event import Event
+from src.models.booking import Booking
+
+
+def legacy_booking(event, reference, booking_time, status='confirmed'):
+    """Insert a booking the way the pre-slot schema stored it: no starts_at/ends_at"""
+    db.session.execute(db.insert(Booking).values(
+        booking_reference=reference, guest_name='Legacy', guest_email='legacy@example.com', guest_count=2,
+        event_id=event.id, booking_date=event.date.replace(hour=0, minute=0), booking_time=booking_time,
+        duration_hours=2, total_amount=200.0, status=status, created_at=datetime.utcnow()
+    ))
+
+
+def test_upgrade_backfills_slots_and_skips_unparseable_rows(app, client, make_event):
+    event = make_event()
+    with app.app_context():
+        legacy_booking(event, 'LEGACY1', '20:00')
+        legacy_booking(event, 'LEGACY2', '8pm')
+        legacy_booking(event, 'LEGACY3', '21:30')
+        db.session.commit()
+
+        report = upgrade_schema()
+        assert (report['slots_filled'], report['slots_skipped']) == (2, [2])
+        slots = dict(db.session.execute(db.select(Booking.booking_reference, Booking.starts_at)).all())
+        assert slots == {
+            'LEGACY1': event.date.replace(hour=20, minute=0),
+            'LEGACY2': None,
+            'LEGACY3': event.date.replace(hour=21, minute=30),
+        }
+
+        # Nothing left to fill, and the bad row is reported again rather than failing the upgrade
+        report = upgrade_schema()
+        assert (report['slots_filled'], report['slots_skipped']) == (0, [2])
+
+    response = client.post('/api/bookings/LEGACY2/cancel')
+    assert response.status_code == 200
+
+
+def test_upgrade_of_a_pre_slot_database_survives_bad_rows(app, make_event):
+    event = make_event()
+    with app.app_context():
+        with db.engine.begin() as connection:
+            connection.exec_driver_sql('DROP INDEX ix_bookings_lounge_slot')
+            connection.exec_driver_sql('ALTER TABLE bookings DROP COLUMN starts_at')
+            connection.exec_driver_sql('ALTER TABLE bookings DROP COLUMN ends_at')
+            connection.exec_driver_sql(
+                "INSERT INTO bookings (booking_reference, guest_name, guest_email, guest_count, event_id, "
+                "booking_date, booking_time, duration_hours, total_amount, status) VALUES "
+                f"('OLD1', 'Legacy', 'legacy@example.com', 2, {event.id}, '2030-01-01 00:00:00', '8pm', 2, 200, 'pending'), "
+                f"('OLD2', 'Legacy', 'legacy@example.com', 2, {event.id}, '2030-01-01 00:00:00', '19:00', 2, 200, 'pending')"
+            )
+
+        report = upgrade_schema()
+        assert report['added_columns'] == {('bookings', 'starts_at'), ('bookings', 'ends_at')}
+        assert (report['slots_filled'], report['slots_skipped']) == (1, [1])
+        assert db.session.execute(
+            db.select(Booking.starts_at).where(Booking.booking_reference == 'OLD2')
+        ).scalar_one() == datetime(2030, 1, 1, 19, 0)
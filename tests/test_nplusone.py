@@ -0,0 +1,59 @@
+import pytest
+from flask import jsonify
+
+from src.models.booking import Booking
+from src.utils.nplusone import NPlusOneError
+
+
+def test_lazy_loads_in_a_loop_raise(app, make_event, book):
+    app.config['TESTING'] = True
+
+    @app.route('/test/lazy-events')
+    def lazy_events():
+        return jsonify([booking.event.title for booking in Booking.query.all()])
+
+    for index in range(3):
+        book(make_event(title=f'Event {index}'))
+
+    with pytest.raises(NPlusOneError, match='Booking.event'):
+        app.test_client().get('/test/lazy-events')
+
+
+def test_statement_budget_fails_when_exceeded(client, make_event, statement_budget):
+    event = make_event()
+    with pytest.raises(AssertionError, match='budget is 0'):
+        with statement_budget(0):
+            client.get(f'/api/events/{event.id}')
+
+
+@pytest.mark.parametrize('path, budget', [
+    ('/api/events', 1),
+    ('/api/events/{event_id}', 1),
+    ('/api/events/{event_id}/availability', 1),
+    ('/api/bookings/{reference}', 2),
+    ('/api/users/{user_id}/bookings', 2),
+    ('/api/users/{user_id}/membership', 1),
+    ('/api/membership-tiers', 1),
+    ('/api/availability/lounges?date=2030-01-01&time=20:00', 1),
+])
+def test_read_endpoint_statement_budgets(client, make_event, make_member, book, statement_budget, path, budget):
+    event = make_event()
+    user, _ = make_member()
+    reference = book(event, user_id=user.id)['booking_reference']
+
+    with statement_budget(budget):
+        response = client.get(path.format(event_id=event.id, reference=reference, user_id=user.id))
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize('path', ['/api/events', '/api/events?category=vip'])
+def test_event_listing_statement_count_does_not_grow_with_events(client, make_event, book, statement_budget, path):
+    book(make_event(title='First'), guest_count=2)
+    with statement_budget(1) as single:
+        assert len(client.get(path).get_json()['events']) == 1
+
+    for index in range(19):
+        book(make_event(title=f'Event {index}'))
+    with statement_budget(single.count) as many:
+        assert len(client.get(path).get_json()['events']) == 20
+    assert many.count == single.count
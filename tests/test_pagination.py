@@ -0,0 +1,11 @@
+import pytest
+
+
+@pytest.mark.parametrize('path', ['/api/events', '/api/users/{user_id}/bookings'])
+@pytest.mark.parametrize('limit, status', [('abc', 400), ('2.5', 400), ('', 400), ('0', 200), ('1000', 200)])
+def test_listings_validate_limit(client, make_member, path, limit, status):
+    user, _ = make_member()
+    response = client.get(path.format(user_id=user.id), query_string={'limit': limit})
+    assert response.status_code == status
+    if status == 400:
+        assert response.get_json()['error'] == 'limit must be a whole number'
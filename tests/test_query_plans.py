@@ -0,0 +1,15 @@
+from src.query_plans import check_query_plans, _full_scans
+
+
+def test_route_queries_use_indexes(app):
+    with app.app_context():
+        results = check_query_plans()
+
+    assert len(results) > 10
+    full_scans = {name: scans for name, _, scans in results if scans}
+    assert full_scans == {}
+
+
+def test_full_scans_ignore_allowed_tables():
+    plan = ['SCAN bookings', 'SCAN lounges', 'SEARCH events USING INDEX ix_events_date (date>?)', 'SCAN CONSTANT ROW']
+    assert _full_scans(plan) == ['SCAN bookings']
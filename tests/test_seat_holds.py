@@ -0,0 +1,115 @@
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models.user import db
+from src.models.event import Event
+from src.models.booking import Booking
+from tests.conftest import _make_app, run_concurrently, seated
+
+
+@pytest.mark.parametrize('requests, capacity, guests', [(500, 100, 1), (200, 50, 3)])
+def test_concurrent_bookings_never_oversell(concurrent_app, make_event, requests, capacity, guests):
+    app = concurrent_app
+    event = make_event(max_guests=capacity)
+    lock = threading.Lock()
+    created = Counter()
+    confirmed = Counter()
+    references = []
+
+    def book(_):
+        response = app.test_client().post('/api/bookings', json={
+            'guest_name': 'Stress', 'guest_email': 'stress@example.com', 'guest_count': guests,
+            'booking_date': event.date.date().isoformat(), 'booking_time': event.date.strftime('%H:%M'),
+            'event_id': event.id
+        })
+        with lock:
+            created[response.status_code] += 1
+            if response.status_code == 201:
+                references.append(response.get_json()['booking']['booking_reference'])
+
+    def confirm(reference):
+        response = app.test_client().post(f'/api/bookings/{reference}/confirm', json={})
+        with lock:
+            confirmed[response.status_code] += 1
+
+    run_concurrently(book, range(requests))
+    run_concurrently(confirm, references)
+
+    assert set(created) <= {201, 400}
+    assert created[201] == len(references) == capacity // guests
+    assert dict(confirmed) == {200: len(references)}
+
+    with app.app_context():
+        event = db.session.get(Event, event.id)
+        assert seated(event.id) <= capacity
+        assert (event.confirmed_seats, event.held_seats) == (seated(event.id), 0)
+
+
+def test_confirm_ignores_a_hold_id_in_the_request(app, client, make_event, book):
+    event = make_event(max_guests=2)
+    mine = book(event)['booking_reference']
+    theirs = book(event)['booking_reference']
+    with app.app_context():
+        their_hold = db.session.execute(
+            db.select(Booking.hold_id).where(Booking.booking_reference == theirs)
+        ).scalar_one()
+
+    response = client.post(f'/api/bookings/{mine}/confirm', json={'hold_id': their_hold})
+    assert response.status_code == 200
+
+    with app.app_context():
+        event = db.session.get(Event, event.id)
+        assert (event.confirmed_seats, event.held_seats) == (1, 1)
+    assert client.post(f'/api/bookings/{theirs}/confirm', json={}).status_code == 200
+    with app.app_context():
+        event = db.session.get(Event, event.id)
+        assert (event.confirmed_seats, event.held_seats) == (2, 0)
+
+
+@pytest.mark.parametrize('guest_count', [0, -5, 3, 'x', '', 1.5, True, None])
+def test_create_rejects_invalid_guest_counts(app, client, make_event, book, guest_count):
+    event = make_event(max_guests=2)
+    response = client.post('/api/bookings', json={
+        'guest_name': 'Guest', 'guest_email': 'guest@example.com', 'guest_count': guest_count,
+        'booking_date': event.date.date().isoformat(), 'booking_time': event.date.strftime('%H:%M'),
+        'event_id': event.id,
+    })
+    assert response.status_code == 400
+    assert 'guest_count' in response.get_json()['error']
+
+    with app.app_context():
+        event = db.session.get(Event, event.id)
+        assert (event.confirmed_seats, event.held_seats) == (0, 0)
+    book(event, confirm=True, guest_count=2)
+    with app.app_context():
+        assert db.session.get(Event, event.id).confirmed_seats == 2
+
+
+def test_create_accepts_a_numeric_string_guest_count(app, make_event, book):
+    event = make_event(max_guests=2, price=100.0)
+    booking = book(event, guest_count='2')
+    assert (booking['guest_count'], booking['total_amount']) == (2, 200.0)
+    with app.app_context():
+        assert db.session.get(Event, event.id).held_seats == 2
+
+
+def test_hold_ttl_comes_from_the_environment(monkeypatch):
+    monkeypatch.setenv('SEAT_HOLD_TTL_MINUTES', '3')
+    app = _make_app()
+    with app.app_context():
+        event = Event(title='Launch night', description='Test event', category='vip', price=100.0, max_guests=10,
+                      date=(datetime.utcnow() + timedelta(days=14)).replace(hour=20, minute=0, second=0, microsecond=0))
+        db.session.add(event)
+        db.session.commit()
+    response = app.test_client().post('/api/bookings', json={
+        'guest_name': 'Guest', 'guest_email': 'guest@example.com', 'guest_count': 1,
+        'booking_date': event.date.date().isoformat(), 'booking_time': event.date.strftime('%H:%M'),
+        'event_id': event.id,
+    })
+    assert app.config['SEAT_HOLD_TTL_MINUTES'] == 3
+    hold = response.get_json()['hold']
+    lifetime = datetime.fromisoformat(hold['expires_at']) - datetime.utcnow()
+    assert timedelta(minutes=2) < lifetime <= timedelta(minutes=3)
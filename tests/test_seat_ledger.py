@@ -0,0 +1,65 @@
+import pytest
+
+from src import migrations
+from src.models.user import db
+from src.models.event import Event
+from tests.conftest import run_concurrently, seated
+
+
+def test_ledger_matches_bookings_under_concurrent_confirms_and_cancels(concurrent_app, make_event, book):
+    app = concurrent_app
+    event = make_event(max_guests=100)
+    references = [book(event, guest_count=2)['booking_reference'] for _ in range(30)]
+    statuses = []
+
+    def confirm(reference):
+        statuses.append(app.test_client().post(f'/api/bookings/{reference}/confirm', json={}).status_code)
+
+    def cancel(reference):
+        statuses.append(app.test_client().post(f'/api/bookings/{reference}/cancel').status_code)
+
+    run_concurrently(confirm, references)
+    run_concurrently(cancel, references[:10])
+    assert statuses.count(200) == 40
+
+    with app.app_context():
+        event = db.session.get(Event, event.id)
+        assert event.confirmed_seats == seated(event.id) == 40
+        assert event.held_seats == 0
+        assert event.get_available_spots() == 60
+
+
+def test_reconcile_rebuilds_a_drifted_ledger(app, make_event, book):
+    event = make_event()
+    book(event, confirm=True, guest_count=3)
+
+    with app.app_context():
+        db.session.execute(db.update(Event).where(Event.id == event.id).values(confirmed_seats=42))
+        db.session.commit()
+        assert Event.reconcile_confirmed_seats() == 1
+        db.session.commit()
+        assert db.session.get(Event, event.id).confirmed_seats == 3
+
+
+def test_every_upgrade_repairs_the_ledger_even_if_a_later_backfill_fails(app, make_event, book, monkeypatch):
+    event = make_event()
+    book(event, confirm=True, guest_count=3)
+
+    def fail():
+        raise RuntimeError('slot backfill failed')
+
+    with app.app_context():
+        db.session.execute(db.update(Event).where(Event.id == event.id).values(confirmed_seats=0))
+        db.session.commit()
+        monkeypatch.setattr(migrations, '_backfill_booking_slots', fail)
+        with pytest.raises(RuntimeError):
+            migrations.upgrade_schema()
+        db.session.rollback()
+        assert db.session.get(Event, event.id).confirmed_seats == 3
+
+        monkeypatch.undo()
+        db.session.execute(db.update(Event).where(Event.id == event.id).values(confirmed_seats=7))
+        db.session.commit()
+        assert migrations.upgrade_schema()['seats_reconciled'] == 1
+        assert migrations.upgrade_schema()['seats_reconciled'] == 0
+        assert db.session.get(Event, event.id).confirmed_seats == 3
@@ -0,0 +1,35 @@
+import json
+
+from src.models.event import Event
+from src.routes.admin import BOOKING_EXPORT_FIELDS
+from src.utils.serializers import SERIALIZER_CACHE_SIZE, _cached_serializer, serializer_for
+
+
+def test_equivalent_field_lists_share_one_serializer(client, make_event):
+    make_event()
+    _cached_serializer.cache_clear()
+    responses = [
+        client.get(f'/api/events?fields={fields}').get_json()
+        for fields in ('title,id', 'id,title', 'id,title,id,title', 'title,title,id')
+    ]
+
+    assert {tuple(event) for response in responses for event in response['events']} == {('id', 'title')}
+    assert _cached_serializer.cache_info().currsize == 1
+
+
+def test_serializer_cache_is_bounded(app):
+    with app.app_context():
+        for count in range(1, SERIALIZER_CACHE_SIZE + 50):
+            serializer_for(Event, ('id',) * count)
+    assert _cached_serializer.cache_info().currsize == SERIALIZER_CACHE_SIZE
+
+
+def test_export_serializes_selected_rows_by_column_name(client, admin_headers, make_event, book):
+    booking = book(make_event(), guest_count=2)
+    response = client.get('/api/admin/bookings/export?format=ndjson', headers=admin_headers)
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    assert [tuple(row) for row in rows] == [BOOKING_EXPORT_FIELDS]
+    assert rows[0]['booking_reference'] == booking['booking_reference']
+    assert rows[0]['guest_count'] == 2
+    assert rows[0]['booking_date'].startswith(booking['booking_date'])
@@ -0,0 +1,101 @@
+"""Statement budgets for write endpoints: commits return fresh rows without a reload"""
+
+import pytest
+
+from src.models.user import db
+from src.models.membership import MembershipTier, Membership
+
+
+@pytest.fixture
+def confirmed(make_event, book):
+    """Reference and QR token of a confirmed booking"""
+    booking = book(make_event(), confirm=True)
+    return booking['booking_reference'], booking['qr_code']
+
+
+def test_create_booking(client, make_event, statement_budget):
+    event = make_event()
+    body = {
+        'guest_name': 'Guest', 'guest_email': 'guest@example.com', 'guest_count': 2,
+        'booking_date': event.date.date().isoformat(), 'booking_time': event.date.strftime('%H:%M'),
+        'event_id': event.id,
+    }
+    with statement_budget(4):
+        response = client.post('/api/bookings', json=body)
+    assert response.status_code == 201
+    assert response.get_json()['booking']['id']
+
+
+def test_confirm_booking(client, make_event, book, statement_budget):
+    reference = book(make_event())['booking_reference']
+    with statement_budget(6):
+        response = client.post(f'/api/bookings/{reference}/confirm', json={})
+    assert response.status_code == 200
+    assert response.get_json()['booking']['status'] == 'confirmed'
+
+
+def test_check_in_by_reference(client, confirmed, statement_budget):
+    reference, _ = confirmed
+    with statement_budget(2):
+        response = client.post(f'/api/bookings/{reference}/checkin')
+    assert response.status_code == 200
+
+
+def test_check_in_by_scan(client, confirmed, statement_budget):
+    _, token = confirmed
+    with statement_budget(1):
+        response = client.post('/api/bookings/checkin/scan', json={'token': token})
+    assert response.status_code == 200
+
+
+def test_batch_check_in(client, make_event, book, statement_budget):
+    event = make_event()
+    tokens = [book(event, confirm=True)['qr_code'] for _ in range(5)]
+    with statement_budget(2):
+        response = client.post('/api/bookings/checkin/batch', json={'scans': [{'token': token} for token in tokens]})
+    assert response.status_code == 200
+    assert [result['result'] for result in response.get_json()['results']] == ['accepted'] * 5
+
+
+def test_cancel_booking(client, confirmed, statement_budget):
+    reference, _ = confirmed
+    with statement_budget(3):
+        response = client.post(f'/api/bookings/{reference}/cancel')
+    assert response.status_code == 200
+    assert response.get_json()['booking']['status'] == 'cancelled'
+
+
+def test_create_event(client, statement_budget):
+    body = {
+        'title': 'Launch night', 'description': 'Test event', 'category': 'vip',
+        'price': 100, 'max_guests': 50, 'date': '2030-01-01T20:00:00',
+    }
+    with statement_budget(1):
+        response = client.post('/api/events', json=body)
+    assert response.status_code == 201
+
+
+def test_update_event(client, make_event, statement_budget):
+    event = make_event()
+    with statement_budget(2):
+        response = client.put(f'/api/events/{event.id}', json={'price': 120})
+    assert response.status_code == 200
+    assert response.get_json()['event']['price'] == 120
+
+
+def test_create_membership(app, client, make_member, statement_budget):
+    user, _ = make_member()
+    with app.app_context():
+        db.session.execute(db.update(Membership).values(is_active=False))
+        db.session.commit()
+        tier_id = MembershipTier.query.filter_by(slug='vip').one().id
+    with statement_budget(3):
+        response = client.post('/api/memberships', json={'user_id': user.id, 'tier_id': tier_id, 'billing_cycle': 'monthly'})
+    assert response.status_code == 201
+
+
+def test_renew_membership(client, make_member, statement_budget):
+    _, membership = make_member()
+    with statement_budget(2):
+        response = client.post(f'/api/memberships/{membership.id}/renew', json={})
+    assert response.status_code == 200